@@ -0,0 +1,199 @@
+# package: Bot.AsyncBot
+
+import asyncio
+import logging
+import random
+
+import aiohttp
+
+from Bot.Bot import Bot, generate_post, sort_by_post_count
+from Bot.Helper import get_rule, iter_users, next_user
+from Bot.ResponseCache import ResponseCache
+
+
+class AsyncBot:
+    """
+    Bot that runs the simulated users concurrently (used to generate load on the Django API).
+
+    Every user is signed up, logged in and creates his posts in his own task, all the requests are sent through
+    one connection pool and the number of requests in flight is limited by the 'CONCURRENCY_LIMIT' rule.
+    The like activity depends on the order of the users (see the task rules) so the users like the posts one
+    after the other like in the regular bot.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor to initialize the bot.
+        """
+        # Load the bot default configuration into the bot (the same defaults as the regular bot).
+        self.number_of_users = get_rule('NUMBER_OF_USERS', Bot.NUMBER_OF_USERS)
+        self.max_posts_per_user = get_rule('MAX_POSTS_PER_USER', Bot.MAX_POSTS_PER_USER)
+        self.max_likes_per_user = get_rule('MAX_LIKES_PER_USER', Bot.MAX_LIKES_PER_USER)
+        self.concurrency_limit = get_rule('CONCURRENCY_LIMIT', Bot.CONCURRENCY_LIMIT)
+        self.bulk_posts = get_rule('BULK_POSTS', False)
+        self.bulk_posts_batch_size = get_rule('BULK_POSTS_BATCH_SIZE', Bot.BULK_POSTS_BATCH_SIZE)
+        self.max_signup_attempts = get_rule('MAX_SIGNUP_ATTEMPTS', Bot.MAX_SIGNUP_ATTEMPTS)
+
+    def start_activity(self):
+        """
+        Method to start the bot activity.
+        """
+        asyncio.run(self.run())
+
+    async def run(self):
+        """
+        Run the bot activity.
+        """
+        self.__load_configuration()  # Load configurations for the bot run.
+
+        # Limit the requests in flight and the open connections to the site.
+        self.semaphore = asyncio.Semaphore(self.concurrency_limit)
+        connector = aiohttp.TCPConnector(limit=self.concurrency_limit)
+
+        self.response_cache = ResponseCache()  # The responses of the get requests (sent back as conditional requests).
+
+        async with aiohttp.ClientSession(self.site_address, connector=connector) as session:
+            self.session = session
+
+            # Run task for every user to sign up, log in and create his posts.
+            # The users tasks take the users from the same iterator (a rejected user is replaced by the next user).
+            users = iter_users(self.number_of_users)
+            users = await asyncio.gather(*(self.__run_user(users) for _ in range(self.number_of_users)))
+            await self.__like_user_posts(list(users))  # Like the posts.
+
+    async def __run_user(self, users) -> dict:
+        """
+        Sign up the next user, log in and create his posts.
+        :param users: The users iterator.
+        :return: The logged user.
+        """
+        data = await self.__signup_user(users)
+        user = await self.__signin_user(data)
+        await self.__create_user_posts(user)
+        return user
+
+    async def __like_user_posts(self, users: list):
+        """
+        Method to for the users to like posts according to the task rules.
+        :param users: The logged users.
+        """
+        users.sort(key=sort_by_post_count, reverse=True)  # Sort user by the number of posts they created.
+
+        for user in users:
+
+            for _ in range(self.max_likes_per_user):  # Run until user reach max likes.
+
+                # Get the usernames of the creators of the posts with no likes (excluding the current user posts).
+                params = {'likes_count': 0, 'exclude_creator': user['username'], 'distinct': 'creator'}
+                _, creators = await self.__request('GET', self.posts_path, user, params=params)
+
+                # Stop the bot if all the posts that the user can like are liked (see Decisions in the readme).
+                if len(creators) == 0:
+                    logging.warning(
+                        "All the posts that the user can like are liked (user can't like his own posts), stopping the bot.")
+                    return
+
+                # Choose random post from random creator that the user didn't already liked.
+                creator = random.choice(creators)
+                creator_posts_path = '%s%s/%s' % (self.users_path, creator, self.posts_path)
+                _, creator_posts = await self.__request('GET', creator_posts_path, user, params={'not_liked_by_me': 'true'})
+                post_to_like = random.choice(creator_posts)
+
+                await self.__request('PUT', '%s%s/like/' % (self.posts_path, post_to_like['id']), user)
+                logging.warning('Post with title %s by user %s is successfully liked.' % (post_to_like['title'], creator))
+
+            logging.warning('User with the email %s reached max likes.' % user['email'])
+        logging.warning('All the users reached max likes, stopping the bot.')
+
+    async def __signup_user(self, users) -> dict[str, str]:
+        """
+        Register the next user, the users that are rejected (the email is taken or not valid) are replaced by the next
+        users (up to max attempts).
+        :param users: The users iterator.
+        :return: The registered user credentials.
+        :exception: Exception if no user is registered after max attempts or the site failed.
+        """
+        for _ in range(self.max_signup_attempts):
+            data = next_user(users)
+            status, body = await self.__request('POST', self.signup_path, data=data)
+
+            if status == 201:
+                logging.warning('User with mail %s been registered successfully.' % data['email'])
+                return data
+
+            # Only the rejected users are replaced, other failures happen to every user.
+            if status != 400:
+                raise Exception('Failed to register the user with mail %s: %s' % (data['email'], body))
+
+            logging.warning('User with mail %s is rejected, trying the next user: %s' % (data['email'], body))
+
+        raise Exception('Failed to register a user after %s attempts.' % self.max_signup_attempts)
+
+    async def __signin_user(self, data: dict[str, str]) -> dict:
+        """
+        Log in the user.
+        :param data: The user credentials.
+        :return: The logged user.
+        """
+        _, user = await self.__request('POST', self.login_path, data=data)
+        logging.warning('User with mail %s is successfully logged in.' % data['email'])
+        return user
+
+    async def __create_user_posts(self, user: dict):
+        """
+        Create posts for the user.
+        :param user: The logged user.
+        """
+        # Record the number of posts the user made so the users can be sorted by them later.
+        user['num_of_posts'] = random.randint(1, int(self.max_posts_per_user))
+
+        # Create the posts in batches with the bulk posts API if the bulk mode is on.
+        if self.bulk_posts:
+            for start in range(0, user['num_of_posts'], self.bulk_posts_batch_size):
+                count = min(self.bulk_posts_batch_size, user['num_of_posts'] - start)
+                await self.__request('POST', self.posts_path + 'bulk/', user, json=[generate_post() for _ in range(count)])
+        else:
+            for _ in range(user['num_of_posts']):
+                await self.__request('POST', self.posts_path, user, data=generate_post())
+
+        logging.warning('User with the email %s successfuly create %s posts.' % (user['email'], user['num_of_posts']))
+
+    async def __request(self, method: str, path: str, user: dict = None, **kwargs) -> tuple:
+        """
+        Send request to the site through the shared connection pool (the get requests are conditional, see
+        'ResponseCache').
+        :param method: The HTTP method.
+        :param path: The path of the page (relative to the site address).
+        :param user: The logged user (to send the request with his JWT token) or None.
+        :param kwargs: Additional arguments for the request (data, json, params).
+        :return: The response status and JSON.
+        """
+        headers = {'Authorization': 'Token %s' % (user['token'])} if user else {}
+
+        key = None
+        if method == 'GET' and user:
+            key = self.response_cache.get_key(path, kwargs.get('params'), user['token'])
+            headers.update(self.response_cache.get_headers(key))
+
+        async with self.semaphore:
+            async with self.session.request(method, '/' + path, headers=headers, **kwargs) as response:
+                body = None if response.status == 304 else await response.json(content_type=None)
+
+        if key is None:
+            return response.status, body
+
+        body = self.response_cache.resolve(key, response.status, response.headers.get('ETag'), body)
+        return (200 if response.status == 304 else response.status), body
+
+    def __load_configuration(self) -> None:
+        """
+        Method to load the configuration for the bot run.
+        """
+        self.site_address = get_rule('SITE_ADDRESS', None)
+        self.login_path = get_rule('LOGIN_PATH', None)
+        self.signup_path = get_rule('SIGNUP_PATH', None)
+        self.posts_path = get_rule('POSTS_PATH', None)
+        self.users_path = get_rule('USERS_PATH', None)
+
+        if None in (self.site_address, self.login_path, self.signup_path, self.posts_path, self.users_path):
+            raise Exception("Invalid configuration")
@@ -0,0 +1,362 @@
+# package: Bot.Benchmark
+import json
+import logging
+import random
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import requests
+
+from Bot.Bot import Bot, generate_post
+from Bot.Helper import get_rule
+from Bot.LatencyRecorder import LatencyRecorder
+
+
+class Benchmark:
+    """
+    Benchmark that runs scenarios against the site and records the latency of every endpoint.
+
+    The site should run with the benchmark settings ('PythonTask.settings_benchmark') so the external services
+    (Clearbit and hunter.io) are replaced with local fakes and don't affect the results.
+    Only the requests of the scenario itself are recorded, the requests that prepare the data are not.
+    With 'async_views' the reads are sent to the async views (the site should run on ASGI server), the endpoints
+    keep their names so the results can be compared with the sync views results.
+    """
+    SCENARIOS = ('signup_storm', 'login_storm', 'feed_read', 'like_storm', 'mixed')
+
+    USERS = 20  # Number of users that sign up.
+    POSTS_PER_USER = 20  # Number of posts every user creates before the scenario.
+    REQUESTS = 500  # Number of requests in the read, login and mixed scenarios.
+    PAGE_SIZE = 50  # Number of posts in a feed page.
+
+    def __init__(self, scenario: str, users: int = None, posts_per_user: int = None, requests_count: int = None,
+                 concurrency: int = None, async_views: bool = None) -> None:
+        """
+        Constructor to initialize the benchmark.
+        :param scenario: The scenario to run (see 'SCENARIOS').
+        :param users: Number of users that sign up.
+        :param posts_per_user: Number of posts every user creates before the scenario.
+        :param requests_count: Number of requests in the read, login and mixed scenarios.
+        :param concurrency: Number of requests that run concurrently.
+        :param async_views: Send the reads to the async views.
+        """
+        if scenario not in self.SCENARIOS:
+            raise Exception('Unknown scenario %s, the scenarios are: %s.' % (scenario, ', '.join(self.SCENARIOS)))
+
+        if scenario in ('like_storm', 'mixed') and (users or get_rule('BENCHMARK_USERS', Benchmark.USERS)) < 2:
+            raise Exception('The %s scenario needs at least 2 users (users can only like posts of other users).' % scenario)
+
+        self.scenario = scenario
+        self.users_count = users or get_rule('BENCHMARK_USERS', Benchmark.USERS)
+        self.posts_per_user = posts_per_user or get_rule('BENCHMARK_POSTS_PER_USER', Benchmark.POSTS_PER_USER)
+        self.requests_count = requests_count or get_rule('BENCHMARK_REQUESTS', Benchmark.REQUESTS)
+        self.concurrency = concurrency or get_rule('CONCURRENCY_LIMIT', Bot.CONCURRENCY_LIMIT)
+        self.max_likes_per_user = get_rule('MAX_LIKES_PER_USER', Bot.MAX_LIKES_PER_USER)
+        self.async_views = async_views if async_views is not None else get_rule('BENCHMARK_ASYNC_VIEWS', False)
+        self.read_prefix = 'async/' if self.async_views else ''  # The path prefix of the read requests.
+
+        self.site_address = get_rule('SITE_ADDRESS', None)
+        self.login_path = get_rule('LOGIN_PATH', None)
+        self.signup_path = get_rule('SIGNUP_PATH', None)
+        self.posts_path = get_rule('POSTS_PATH', None)
+        self.users_path = get_rule('USERS_PATH', None)
+
+        self.run_id = '%x' % int(time.time() * 1000)  # Used to create unique users in every run.
+        self.__local = threading.local()  # Every thread has its own HTTP session.
+
+    def run(self) -> dict:
+        """
+        Run the scenario.
+        :return: The benchmark results.
+        """
+        logging.warning('Running the %s benchmark.' % self.scenario)
+
+        scenarios = {
+            'signup_storm': self.__signup_storm,
+            'login_storm': self.__login_storm,
+            'feed_read': self.__feed_read,
+            'like_storm': self.__like_storm,
+            'mixed': self.__mixed,
+        }
+
+        with ThreadPoolExecutor(self.concurrency) as self.executor:
+            recorder = scenarios[self.scenario]()
+
+        recorder.stop()
+
+        return {
+            'scenario': self.scenario,
+            'commit': self.__get_commit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'config': {
+                'users': self.users_count,
+                'posts_per_user': self.posts_per_user,
+                'requests': self.requests_count,
+                'concurrency': self.concurrency,
+                'max_likes_per_user': self.max_likes_per_user,
+                'async_views': self.async_views,
+            },
+            'results': recorder.summary(),
+        }
+
+    @staticmethod
+    def save(results: dict, output_dir: str) -> Path:
+        """
+        Write the benchmark results to JSON file.
+        :param results: The benchmark results.
+        :param output_dir: The directory of the results files.
+        :return: The path of the results file.
+        """
+        path = Path(output_dir) / ('%s-%s-%s.json' % (
+            results['scenario'], results['commit'][:10], results['timestamp'].replace(':', '')))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(results, indent=2))
+        return path
+
+    @staticmethod
+    def compare(old: dict, new: dict) -> list[dict]:
+        """
+        Compare the results of two benchmarks of the same scenario.
+        :param old: The results of the baseline benchmark.
+        :param new: The results of the compared benchmark.
+        :return: The change (in percent) of every endpoint latency percentiles and throughput.
+        """
+        old_endpoints = {'total': old['results']['total'], **old['results']['endpoints']}
+        new_endpoints = {'total': new['results']['total'], **new['results']['endpoints']}
+
+        rows = []
+        for endpoint in old_endpoints.keys() & new_endpoints.keys():
+            row = {'endpoint': endpoint}
+            for metric in ('p50', 'p95', 'p99', 'throughput', 'error_rate'):
+                before, after = old_endpoints[endpoint][metric], new_endpoints[endpoint][metric]
+                row[metric] = (before, after, (after - before) / before * 100 if before else None)
+            rows.append(row)
+
+        return sorted(rows, key=lambda row: row['endpoint'])
+
+    def __signup_storm(self) -> LatencyRecorder:
+        """
+        Scenario of many users that sign up and log in concurrently.
+        :return: The scenario recorder.
+        """
+        recorder = LatencyRecorder()
+        self.__signup_users(recorder, min_users=0)
+        return recorder
+
+    def __login_storm(self) -> LatencyRecorder:
+        """
+        Scenario of users that log in again and again concurrently (measures the cost of the password hashing, see
+        the hashing profiles in the site settings).
+        :return: The scenario recorder.
+        """
+        users = self.__signup_users()
+
+        recorder = LatencyRecorder()
+        self.__run_concurrently([
+            lambda user=random.choice(users): self.__request(
+                'POST login/', 'POST', self.login_path, None, recorder, data=self.__get_user_data(user['index']))
+            for _ in range(self.requests_count)])
+        return recorder
+
+    def __feed_read(self) -> LatencyRecorder:
+        """
+        Scenario of users that read the feed and the posts of other users.
+        :return: The scenario recorder.
+        """
+        users = self.__signup_users()
+        self.__create_posts(users)
+
+        recorder = LatencyRecorder()
+        self.__run_concurrently([lambda: self.__read(random.choice(users), users, recorder)
+                                 for _ in range(self.requests_count)])
+        return recorder
+
+    def __like_storm(self) -> LatencyRecorder:
+        """
+        Scenario of users that like posts of other users concurrently (every user likes until he reaches max likes).
+        :return: The scenario recorder.
+        """
+        users = self.__signup_users(min_users=2)
+        self.__create_posts(users)
+        posts = self.__get_all_posts(users[0])
+
+        recorder = LatencyRecorder()
+        self.__run_concurrently([lambda user=user: self.__like(user, posts, recorder)
+                                 for user in users for _ in range(self.max_likes_per_user)])
+        return recorder
+
+    def __mixed(self) -> LatencyRecorder:
+        """
+        Scenario of users that read posts, like posts and create posts (most of the requests are reads).
+        :return: The scenario recorder.
+        """
+        users = self.__signup_users(min_users=2)
+        self.__create_posts(users)
+        posts = self.__get_all_posts(users[0])
+
+        recorder = LatencyRecorder()
+        actions = [
+            lambda user: self.__read(user, users, recorder),
+            lambda user: self.__like(user, posts, recorder),
+            lambda user: self.__create_post(user, recorder),
+        ]
+        weights = [70, 20, 10]
+
+        self.__run_concurrently([lambda action=action, user=random.choice(users): action(user)
+                                 for action in random.choices(actions, weights, k=self.requests_count)])
+        return recorder
+
+    def __read(self, user: dict, users: list, recorder: LatencyRecorder) -> None:
+        """
+        Read a feed page or the posts of random user.
+        :param user: The logged user.
+        :param users: The users of the benchmark.
+        :param recorder: The scenario recorder.
+        """
+        if random.random() < 0.7:
+            self.__request('GET posts/ (page)', 'GET', self.read_prefix + self.posts_path, user, recorder,
+                           params={'page_size': self.PAGE_SIZE})
+        else:
+            creator = random.choice(users)['username']
+            self.__request('GET users/<username>/posts/', 'GET',
+                           '%s%s%s/%s' % (self.read_prefix, self.users_path, creator, self.posts_path), user, recorder)
+
+    def __like(self, user: dict, posts: list, recorder: LatencyRecorder) -> None:
+        """
+        Like random post of other user.
+        :param user: The logged user.
+        :param posts: The posts of the benchmark.
+        :param recorder: The scenario recorder.
+        """
+        posts = [post for post in posts if post['creator'] != user['username']]
+        if not posts:
+            return  # All the posts are the user posts.
+
+        post = random.choice(posts)
+        self.__request('PUT posts/<id>/like/', 'PUT', '%s%s/like/' % (self.posts_path, post['id']), user, recorder)
+
+    def __create_post(self, user: dict, recorder: LatencyRecorder) -> None:
+        """
+        Create post.
+        :param user: The logged user.
+        :param recorder: The scenario recorder.
+        """
+        self.__request('POST posts/', 'POST', self.posts_path, user, recorder, data=generate_post())
+
+    def __signup_users(self, recorder: LatencyRecorder = None, min_users: int = 1) -> list[dict]:
+        """
+        Sign up and log in the benchmark users concurrently (the users that failed are skipped).
+        :param recorder: The recorder of the requests (None to not record them).
+        :param min_users: The minimum number of users the scenario needs.
+        :return: The logged users (with the index of their credentials).
+        """
+        def signup_user(index: int) -> dict:
+            data = self.__get_user_data(index)
+            self.__request('POST signup/', 'POST', self.signup_path, None, recorder, data=data)
+            response = self.__request('POST login/', 'POST', self.login_path, None, recorder, data=data)
+
+            # The failed requests are recorded, the scenario continues without the user.
+            if response is None or response.status_code != 200:
+                logging.warning('User with the mail %s failed to sign up or log in, skipping him.' % data['email'])
+                return None
+
+            return {**response.json(), 'index': index}
+
+        users = self.__run_concurrently([lambda index=index: signup_user(index) for index in range(self.users_count)])
+        users = [user for user in users if user is not None]
+
+        if len(users) < min_users:
+            raise Exception('Only %s users signed up, the %s scenario needs at least %s (is the site up?).' % (
+                len(users), self.scenario, min_users))
+
+        return users
+
+    def __get_user_data(self, index: int) -> dict:
+        """
+        Get the credentials of a benchmark user.
+        :param index: The index of the user.
+        :return: The user username, email and password.
+        """
+        return {
+            'username': 'bench%s%s' % (self.run_id, index),
+            'email': 'bench-%s-%s@example.com' % (self.run_id, index),
+            'password': 'benchmark-%s' % index,
+        }
+
+    def __create_posts(self, users: list) -> None:
+        """
+        Create the posts of the users with the bulk posts API.
+        :param users: The logged users.
+        """
+        self.__run_concurrently([
+            lambda user=user: self.__request('POST posts/bulk/', 'POST', self.posts_path + 'bulk/', user,
+                                             json=[generate_post() for _ in range(self.posts_per_user)])
+            for user in users])
+
+    def __get_all_posts(self, user: dict) -> list:
+        """
+        Get all the posts.
+        :param user: The logged user.
+        :return: The posts.
+        """
+        response = self.__request('GET posts/', 'GET', self.posts_path, user)
+
+        if response is None or response.status_code != 200:
+            raise Exception('Failed to get the posts of the benchmark (is the site up?).')
+
+        return response.json()
+
+    def __run_concurrently(self, tasks: list) -> list:
+        """
+        Run the tasks in the benchmark threads.
+        :param tasks: The tasks to run.
+        :return: The tasks results.
+        """
+        return list(self.executor.map(lambda task: task(), tasks))
+
+    def __request(self, endpoint: str, method: str, path: str, user: dict = None, recorder: LatencyRecorder = None,
+                  **kwargs):
+        """
+        Send request to the site and record it.
+        :param endpoint: The endpoint name used in the results.
+        :param method: The HTTP method.
+        :param path: The path of the page (relative to the site address).
+        :param user: The logged user (to send the request with his JWT token) or None.
+        :param recorder: The recorder of the request (None to not record it).
+        :param kwargs: Additional arguments for the request (data, json, params).
+        :return: The response or None if the request failed to be sent.
+        """
+        if not hasattr(self.__local, 'session'):
+            self.__local.session = requests.Session()
+
+        headers = {'Authorization': 'Token %s' % (user['token'])} if user else {}
+        address = '%s/%s' % (self.site_address, path)
+
+        started_at = time.perf_counter()
+        try:
+            response = self.__local.session.request(method, address, headers=headers, **kwargs)
+            failed = response.status_code >= 400
+        except requests.RequestException:
+            logging.warning('Request to %s failed.' % address, exc_info=True)
+            response, failed = None, True
+
+        if recorder is not None:
+            recorder.record(endpoint, time.perf_counter() - started_at, failed)
+
+        return response
+
+    @staticmethod
+    def __get_commit() -> str:
+        """
+        Get the commit of the code that the benchmark runs on (used to compare results across commits).
+        :return: The commit hash or 'unknown'.
+        """
+        try:
+            return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                  check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return 'unknown'
@@ -3,10 +3,15 @@
 import logging
 import random
 import string
+import threading
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from Bot.Helper import get_rule, Generator
+from Bot.EventStreamClient import EventStreamClient
+from Bot.Helper import get_rule, iter_users, next_user
+from Bot.LocalState import LocalState
+from Bot.ResponseCache import ResponseCache
 
 # Set format to the bot logs.
 logging.basicConfig(format='%(asctime)s - %(message)s', datefmt='%d-%b-%y %H:%M:%S')
@@ -22,31 +27,14 @@ def sort_by_post_count(user):
     return user['num_of_posts']
 
 
-def filter_no_liked_posts(post):
+def generate_post():
     """
-    Function that used in filter to filter the posts that have no likes.
-    :param post: The post to filter
-    :return: If the post don't have likes.
+    Create post information (randomized data).
+    :return: The post title and body.
     """
-    return post['likes_count'] == 0
-
-
-def map_to_users(post):
-    """
-    Function that used in map to get the creators of the posts
-    :param post: The post to map.
-    :return: The username of the post creator.
-    """
-    return post['creator']
-
-
-def filter_user_liked_posts(post):
-    """
-    Function that used in filter to filter the posts that the user already liked.
-    :param post: The post to filter.
-    :return: If the user already liked the post.
-    """
-    return not post['is_user_like']
+    title = "".join(random.choice(string.ascii_letters) for _ in range(10))
+    body = "".join(random.choice(string.ascii_letters) for _ in range(20))
+    return {'title': title, 'body': body}
 
 
 class Bot:
@@ -56,6 +44,9 @@ class Bot:
     NUMBER_OF_USERS = 3  # Maximum number of new users to create.
     MAX_POSTS_PER_USER = 5  # Maximum number of posts the user can create.
     MAX_LIKES_PER_USER = 3  # Maximum number of likes the user can do.
+    CONCURRENCY_LIMIT = 10  # Maximum number of concurrent requests (and pooled connections).
+    BULK_POSTS_BATCH_SIZE = 500  # Maximum number of posts created in one request (when BULK_POSTS is set).
+    MAX_SIGNUP_ATTEMPTS = 5  # Maximum number of users tried for every new user (when the email is taken or invalid).
 
     def __init__(self) -> None:
         """
@@ -71,6 +62,11 @@ class Bot:
         self.number_of_users = get_rule('NUMBER_OF_USERS', Bot.NUMBER_OF_USERS)
         self.max_posts_per_user = get_rule('MAX_POSTS_PER_USER', Bot.NUMBER_OF_USERS)
         self.max_likes_per_user = get_rule('MAX_LIKES_PER_USER', Bot.MAX_LIKES_PER_USER)
+        self.concurrency_limit = get_rule('CONCURRENCY_LIMIT', Bot.CONCURRENCY_LIMIT)
+        self.bulk_posts = get_rule('BULK_POSTS', False)
+        self.bulk_posts_batch_size = get_rule('BULK_POSTS_BATCH_SIZE', Bot.BULK_POSTS_BATCH_SIZE)
+        self.stream_mode = get_rule('STREAM_MODE', False)
+        self.max_signup_attempts = get_rule('MAX_SIGNUP_ATTEMPTS', Bot.MAX_SIGNUP_ATTEMPTS)
 
     def start_activity(self):
         """
@@ -79,9 +75,54 @@ class Bot:
         """
         self.users = []
         self.__load_configuration()  # Load configurations for the bot run.
-        self.__signup_users()  # Sign Up uses
-        self.__create_users_posts()  # Create posts for the users.
-        self.__like_user_posts() # Like the posts.
+        self.session = self.__create_session()  # Reuse the connections to the site between the requests.
+        self.response_cache = ResponseCache()  # The responses of the get requests (sent back as conditional requests).
+
+        # The posts of the site and the likes of the users (kept from the events stream in the stream mode, so the
+        # posts are not requested).
+        self.state = LocalState()
+        self.posts_lock = threading.Lock()
+        self.events_stream = None
+
+        try:
+            self.__signup_users()  # Sign Up uses
+            self.__create_users_posts()  # Create posts for the users.
+
+            if self.stream_mode:
+                self.__start_events_stream()  # Keep the posts from the events stream.
+
+            self.__like_user_posts() # Like the posts.
+        finally:
+            if self.events_stream is not None:
+                self.events_stream.stop()
+            self.session.close()
+
+    def __start_events_stream(self):
+        """
+        Read the posts events stream (all the events from the first one) and wait until the existing posts are read.
+        """
+        logging.warning('Reading the posts from the events stream.')
+
+        address = '%s/%s' % (self.site_address, self.events_path)
+        self.events_stream = EventStreamClient(address, self.users[0]['token'], self.__handle_event)
+        self.events_stream.start()
+        self.events_stream.wait_caught_up()
+
+        logging.warning('Received %s posts from the events stream.' % len(self.state))
+
+    def __handle_event(self, kind: str, data: dict):
+        """
+        Update the local posts with the event of the stream.
+        :param kind: The event kind (post_created, post_liked or post_unliked).
+        :param data: The event data (the post as it is now).
+        """
+        with self.posts_lock:
+            self.state.update_post(data['post'], data['creator'], data['likes_count'], data.get('title'))
+
+            if kind == 'post_liked':
+                self.state.like(data['user'], data['post'], data['likes_count'])
+            elif kind == 'post_unliked':
+                self.state.unlike(data['user'], data['post'], data['likes_count'])
 
     def __like_user_posts(self):
         """
@@ -94,41 +135,47 @@ class Bot:
 
             for _ in range(self.max_likes_per_user):  # Run until user reach max likes.
 
-                posts = self.__request_posts(user)   # Get all the posts.
-                logging.warning('User with the email %s received %s posts.' % (user['email'], len(posts)))
-
-                logging.warning('Filtering for posts with no likes.')
-                unliked_posts = list(filter(filter_no_liked_posts, posts))  # filter the posts with no likes.
-                logging.warning('There are %s posts with no likes.' % len(unliked_posts))
+                post_to_like = self.__choose_post_to_like(user)
 
-                # Stop the bot if all the posts are liked.
-                if len(unliked_posts) == 0:
-                    logging.warning('All the posts are liked, stopping the bot.')
+                # Stop the bot if all the posts are liked or the only posts that not liked are the current user posts
+                # (see Decisions in the readme).
+                if post_to_like is None:
+                    logging.warning(
+                        "All the posts that the user can like are liked (user can't like his own posts), stopping the bot.")
                     return
 
-                # Get the usernames of the creators of the unliked posts.
-                creators = self.__get_creators_posts(posts, user)
+                self.__post_to_like(user, post_to_like) # Like the post.
 
-                # Stop the bots if the only posts that not liked are the current user posts (see Decisions in the readme)
-                if len(creators) == 0:
-                    logging.warning(
-                        "Only the current user posts are not liked and user can't like his own posts, stopping the bot.")
-                    return
+            logging.warning('User with the email %s reached max likes.' % user['email'])
+        logging.warning('All the users reached max likes, stopping the bot.')
 
-                # Select random creator of the unliked posts.
-                random.seed()
-                creator = random.choice(list(creators))
+    def __choose_post_to_like(self, user):
+        """
+        Choose random creator of the posts with no likes and random post of the creator that the user didn't like.
+        :param user: The logged user.
+        :return: The post or None if the user can't like any post.
+        """
+        if self.stream_mode:
+            # The local state keeps the posts with no likes by creator, so the choice doesn't scan the posts.
+            with self.posts_lock:
+                post = self.state.choose(user['username'])
+                return None if post is None else dict(post)
 
-                creator_posts = self.__get_users_posts(user, creator) # Get the creator posts.
+        # Get the usernames of the creators of the posts with no likes (excluding the current user posts).
+        creators = self.__get_unliked_posts_creators(user)
+        logging.warning('There are %s users with posts with no likes.' % len(creators))
 
-                # Choose random post form the creator posts that you user didn't already liked.
-                creator_posts_user_not_liked = list(filter(filter_user_liked_posts, creator_posts))
-                post_to_like = random.choice(creator_posts_user_not_liked)
+        if len(creators) == 0:
+            return None
 
-                self.__post_to_like(user, post_to_like) # Like the post.
+        # Select random creator of the unliked posts.
+        random.seed()
+        creator = random.choice(creators)
 
-            logging.warning('User with the email %s reached max likes.' % user['email'])
-        logging.warning('All the users reached max likes, stopping the bot.')
+        creator_posts = self.__get_users_posts(user, creator) # Get the creator posts the user didn't liked.
+
+        # Choose random post form the creator posts that you user didn't already liked.
+        return random.choice(creator_posts)
 
     def __post_to_like(self, user, post):
         """
@@ -138,16 +185,22 @@ class Bot:
         """
         logging.warning('Liking post with title %s by user %s.' % (post['title'], post['creator']))
 
-        # Send post request to like the post with the logged user JWT token.
+        # Send put request to like the post with the logged user JWT token (liking again doesn't unlike the post).
         headers = {'Authorization': 'Token %s' % (user['token'])}
-        posts_address = '%s/%s%s/' % (self.site_address, self.posts_path, post['id'])
+        like_address = '%s/%s%s/like/' % (self.site_address, self.posts_path, post['id'])
+
+        response = self.session.put(like_address, headers=headers)
+
+        # Update the local posts now (the event arrives later) so the next choice sees the like.
+        if self.stream_mode and response.ok:
+            with self.posts_lock:
+                self.state.like(user['username'], post['id'], response.json()['likes_count'])
 
-        response = requests.post(posts_address, headers=headers)
         logging.warning('Post with title %s by user %s is successfully liked.' % (post['title'], post['creator']))
 
     def __get_users_posts(self, user, creator_username):
         """
-        Get requested user post.
+        Get requested user posts that the logged user didn't like.
         :param user: The logged user.
         :param creator_username: The username of the user that you want to get the post from.
         :return:
@@ -155,45 +208,57 @@ class Bot:
         logging.warning('Requesting the posts for the user with the username %s.' % creator_username)
 
         # Send post request to get the requested user posts with the logged user JWT token.
-        headers = {'Authorization': 'Token %s' % (user['token'])}
         posts_address = '%s/%s%s/%s' % (self.site_address, self.users_path, creator_username, self.posts_path)
-        response = requests.get(posts_address, headers=headers)
+        params = {'not_liked_by_me': 'true'}  # Filter the posts the user already liked in the server.
+        posts = self.__get_json(posts_address, user, params)
 
         logging.warning('Successfully received the posts of the user %s.' % creator_username)
-        return response.json()
+        return posts
 
-    def __get_creators_posts(self, posts, user):
+    def __get_unliked_posts_creators(self, user):
         """
-        Get the creators of the posts.
-        :param posts: The posts.
-        :param user: The logged users.
-        :return: The creators of the posts (excluding the logged user).
+        Get the creators of the posts with no likes.
+        :param user: The logged user.
+        :return: The usernames of the creators of the posts with no likes (excluding the logged user).
         """
+        logging.warning('User with the email %s requesting the creators of the posts with no likes.' % user['email'])
 
-        creators = map(map_to_users, posts)
+        # Send get request to get the creators with the logged user JWT token, the posts are filtered in the server
+        # so only the creators usernames are received.
+        posts_address = '%s/%s' % (self.site_address, self.posts_path)
+        params = {'likes_count': 0, 'exclude_creator': user['username'], 'distinct': 'creator'}
+        creators = self.__get_json(posts_address, user, params)
 
-        # Filtering the posts that not of the logged user becasue the user can't like his own posts.
-        creators = filter(lambda creator: creator != user['username'], creators)
+        logging.warning('User with the email %s successfully received the creators.' % user['email'])
 
-        return set(creators)
+        return creators
 
-    def __request_posts(self, user):
+    def __get_json(self, address: str, user, params: dict = None):
         """
-        Request all the posts.
+        Send conditional get request with the logged user JWT token, if the response didn't change since the last
+        time it received the site answers 304 and the cached response is used.
+        :param address: The requested address.
         :param user: The logged user.
-        :return: JSON of all the posts.
+        :param params: The query parameters.
+        :return: The response JSON.
         """
+        key = self.response_cache.get_key(address, params, user['token'])
+        headers = {'Authorization': 'Token %s' % (user['token']), **self.response_cache.get_headers(key)}
 
-        logging.warning('User with the email %s requesting posts.' % user['email'])
-
-        # Send post request to get all the posts with the logged user JWT token.
-        headers = {'Authorization': 'Token %s' % (user['token'])}
-        posts_address = '%s/%s' % (self.site_address, self.posts_path)
-        response = requests.get(posts_address, headers=headers)
+        response = self.session.get(address, headers=headers, params=params)
+        body = None if response.status_code == 304 else response.json()
+        return self.response_cache.resolve(key, response.status_code, response.headers.get('ETag'), body)
 
-        logging.warning('User with the email %s successfully received the posts.' % user['email'])
-
-        return response.json()
+    def __create_session(self) -> requests.Session:
+        """
+        Create HTTP session that keeps the connections to the site alive between the requests.
+        :return: The HTTP session.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency_limit)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
 
     def __load_configuration(self) -> None:
         """
@@ -204,6 +269,7 @@ class Bot:
         self.signup_path = get_rule('SIGNUP_PATH', None)
         self.posts_path = get_rule('POSTS_PATH', None)
         self.users_path = get_rule('USERS_PATH', None)
+        self.events_path = get_rule('EVENTS_PATH', 'events/')
 
         self.__verify_configuration()  # Verify the required configurations.
 
@@ -233,32 +299,42 @@ class Bot:
         :return:
         """
 
+        logging.info('Registering users.')
+
+        # The generated users are unique (or read from the users fixture), a user that is rejected (the email is
+        # taken or not valid) is replaced by the next user (see Decisions in the readme).
+        users = iter_users(self.number_of_users)
+
         for _ in range(self.number_of_users):
-            data = self.__signup_user()
+            data = self.__signup_user(users)
             self.__signin_user(data)
 
-    def __signup_user(self) -> dict[str, str]:
+    def __signup_user(self, users) -> dict[str, str]:
         """
-        Create user and register him.
-        :return:
+        Register the next user, the users that are rejected are replaced by the next users (up to max attempts).
+        :param users: The users iterator.
+        :return: The registered user credentials.
+        :exception: Exception if no user is registered after max attempts or the site failed.
         """
         sign_up_address = '%s/%s' % (self.site_address, self.signup_path)
 
-        logging.info('Registering users.')
-
-        # Because mail is used as login identification, it's unique and becuase we have limited
-        while True:
+        for _ in range(self.max_signup_attempts):
+            data = next_user(users)
 
-            data = Generator.generate_user()  # Generate user data.
             logging.warning('Registering user with mail %s.' % data['email'])
-            response = requests.post(sign_up_address, data=data)  # Send registration request for the new user.
+            response = self.session.post(sign_up_address, data=data)  # Send registration request for the new user.
 
-            # End the loop if the user is registred.
             if response.status_code == 201:
                 logging.warning('User with mail %s been registered successfully.' % data['email'])
                 return data
 
-            logging.warning('User with the mail %s already exist, trying another mail.' % data['email'])
+            # Only the rejected users are replaced, other failures happen to every user.
+            if response.status_code != 400:
+                raise Exception('Failed to register the user with mail %s: %s' % (data['email'], response.text))
+
+            logging.warning('User with mail %s is rejected, trying the next user: %s' % (data['email'], response.text))
+
+        raise Exception('Failed to register a user after %s attempts.' % self.max_signup_attempts)
 
     def __signin_user(self, data: dict[str, str]):
         """
@@ -268,7 +344,7 @@ class Bot:
         sign_in_address = '%s/%s' % (self.site_address, self.login_path)
         logging.warning('Login user with mail %s.' % data['email'])
 
-        response = requests.post(sign_in_address, data=data)
+        response = self.session.post(sign_in_address, data=data)
         self.users.append(response.json())
         logging.warning('User with mail %s is successfully logged in.' % data['email'])
 
@@ -281,9 +357,12 @@ class Bot:
             user['num_of_posts'] = random.randint(1, int(self.max_posts_per_user))
             logging.warning('Creating %s posts for the user with the email %s.' % (user['num_of_posts'], user['email']))
 
-            # Create posts.
-            for _ in range(user['num_of_posts']):
-                self.create_post_user(user)
+            # Create posts (in batches if the bulk mode is on).
+            if self.bulk_posts:
+                self.create_posts_user(user, user['num_of_posts'])
+            else:
+                for _ in range(user['num_of_posts']):
+                    self.create_post_user(user)
 
             logging.warning(
                 'User with the email %s successfuly create %s posts.' % (user['email'], user['num_of_posts']))
@@ -297,10 +376,25 @@ class Bot:
         posts_address = '%s/%s' % (self.site_address, self.posts_path)
 
         # Create post information (randomized data).
-        title = "".join(random.choice(string.ascii_letters) for _ in range(10))
-        body = "".join(random.choice(string.ascii_letters) for _ in range(20))
-        data = {'title': title, 'body': body}
+        data = generate_post()
+        title = data['title']
 
         # Send post request to create the logged user post with the logged user JWT token.
-        response = requests.post(posts_address, headers=headers, data=data)
+        response = self.session.post(posts_address, headers=headers, data=data)
         logging.warning('User with the email %s successfully created post with the title %s.' % (user['email'], title))
+
+    def create_posts_user(self, user, num_of_posts: int):
+        """
+        Create many posts for the user with the bulk posts API.
+        :param user: The logged user.
+        :param num_of_posts: The number of posts to create.
+        """
+        headers = {'Authorization': 'Token %s' % (user['token'])}
+        posts_address = '%s/%sbulk/' % (self.site_address, self.posts_path)
+
+        # Send the posts in batches so every request stay small.
+        for start in range(0, num_of_posts, self.bulk_posts_batch_size):
+            data = [generate_post() for _ in range(min(self.bulk_posts_batch_size, num_of_posts - start))]
+
+            response = self.session.post(posts_address, headers=headers, json=data)
+            logging.warning('User with the email %s successfully created %s posts.' % (user['email'], response.json()['created']))
@@ -0,0 +1,152 @@
+# package: Bot.EventStreamClient
+import http.client
+import json
+import logging
+import socket
+import threading
+from typing import Callable
+from urllib.parse import urlsplit
+
+
+class EventStreamClient:
+    """
+    Client of the posts events stream of the site (Server-Sent Events), reads the stream in a background thread and
+    calls the handler with every event.
+
+    The client reconnects after the last event it received when the connection fails, so no event is lost or handled
+    twice. The handler is called from the background thread.
+    The stream is read with 'http.client' (the responses of 'requests' are read in blocks, so the last events would
+    wait until the next block is full).
+    """
+    RECONNECT_DELAY = 1  # Number of seconds to wait before reconnecting (until the site sends its own delay).
+    TIMEOUT = 60  # Number of seconds without data until the connection is considered broken (the site sends heartbeats).
+
+    def __init__(self, address: str, token: str, handler: Callable[[str, dict], None], offset: int = 0) -> None:
+        """
+        Constructor to initialize the client.
+        :param address: The address of the events stream.
+        :param token: The JWT token of a logged user.
+        :param handler: Called with the kind and the data of every event.
+        :param offset: The ID of the last event that already handled (0 to read all the events).
+        """
+        self.address = urlsplit(address)
+        self.token = token
+        self.handler = handler
+        self.offset = offset
+        self.reconnect_delay = self.RECONNECT_DELAY
+
+        self.caught_up = threading.Event()  # Set when the events that existed when the stream opened are handled.
+        self.error = None  # The error that stopped the client (the site refused the stream).
+        self.__stopped = threading.Event()
+        self.__connection = None
+        self.__thread = threading.Thread(target=self.__run, name='event-stream', daemon=True)
+
+    def start(self) -> None:
+        """
+        Start reading the stream.
+        """
+        self.__thread.start()
+
+    def wait_caught_up(self, timeout: float = None) -> bool:
+        """
+        Wait until the events that existed when the stream opened are handled.
+        :param timeout: Maximum number of seconds to wait (None to wait until caught up).
+        :return: If the stream caught up.
+        :exception: Exception if the site refused the stream.
+        """
+        caught_up = self.caught_up.wait(timeout)
+        if self.error is not None:
+            raise self.error
+
+        return caught_up
+
+    def stop(self) -> None:
+        """
+        Stop reading the stream.
+        """
+        self.__stopped.set()
+
+        # Interrupt the read of the stream.
+        connection = self.__connection
+        if connection is not None and connection.sock is not None:
+            try:
+                connection.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+        self.__thread.join(timeout=5)
+
+    def __run(self) -> None:
+        """
+        Read the stream until the client stops, reconnect when the connection fails.
+        """
+        while not self.__stopped.is_set():
+            try:
+                self.__read()
+            except (OSError, http.client.HTTPException, ValueError):
+                if not self.__stopped.is_set():
+                    logging.warning('The events stream disconnected, reconnecting after event %s.' % self.offset)
+            except Exception as error:
+                # The request is refused (not authenticated or invalid offset), reconnecting will not help.
+                logging.warning('The events stream is refused: %s' % error)
+                self.error = error
+                self.caught_up.set()  # Release the waiting bot.
+                return
+
+            self.__stopped.wait(self.reconnect_delay)
+
+    def __read(self) -> None:
+        """
+        Read the stream from the last handled event.
+        :exception: Exception if the site refused the stream.
+        """
+        connection_class = http.client.HTTPSConnection if self.address.scheme == 'https' else http.client.HTTPConnection
+        self.__connection = connection = connection_class(self.address.netloc, timeout=self.TIMEOUT)
+
+        try:
+            headers = {'Authorization': 'Token %s' % self.token, 'Last-Event-ID': str(self.offset),
+                       'Accept': 'text/event-stream'}
+            connection.request('GET', self.address.path or '/', headers=headers)
+            response = connection.getresponse()
+
+            if response.status >= 500:
+                raise http.client.HTTPException('The site failed with status %s.' % response.status)
+            if response.status != 200:
+                raise Exception('status %s, %s' % (response.status, response.read().decode('utf-8', 'replace')))
+
+            event = {}
+            for line in response:
+                if self.__stopped.is_set():
+                    return
+
+                line = line.decode('utf-8').rstrip('\r\n')
+                if line:
+                    field, _, value = line.partition(':')
+                    event[field] = value[1:] if value.startswith(' ') else value
+                    continue
+
+                # Empty line, the end of the event.
+                self.__dispatch(event)
+                event = {}
+        finally:
+            connection.close()
+
+    def __dispatch(self, event: dict) -> None:
+        """
+        Handle an event of the stream.
+        :param event: The event fields.
+        """
+        if 'retry' in event:
+            self.reconnect_delay = int(event['retry']) / 1000
+
+        if 'event' not in event:
+            return  # Comment (heartbeat) or the reconnect delay.
+
+        if event['event'] == 'caught_up':
+            self.caught_up.set()
+            return
+
+        self.handler(event['event'], json.loads(event.get('data', '{}')))
+
+        if 'id' in event:
+            self.offset = int(event['id'])
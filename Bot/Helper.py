@@ -1,6 +1,9 @@
 # Package: Bot.Helper
+import itertools
+import json
 import random
 import string
+from typing import Iterator
 
 random.seed() # Create seed based on the system time.
 def get_rule(name: str, default: any) -> any:
@@ -24,58 +27,140 @@ def get_rule(name: str, default: any) -> any:
 class Generator:
     """
     Generator class to generate data.
+
+    The users are generated in batches from one buffer of random bytes (every byte is mapped to a character), every
+    user has a unique index that is part of his username and email so the generated users never collide, and the
+    same seed generates the same users.
     """
+    NAME_ALPHABET = string.ascii_lowercase + '234567'  # 32 characters, every byte is mapped to one of them evenly.
+    PASSWORD_ALPHABET = string.ascii_letters + string.digits + '-_'  # 64 characters.
+    NAMESPACE_LENGTH = 4  # Number of random characters that are the same for all the users of the generator.
+    # The lengths of the user parts add up to multiple of 4 bytes (the random generator draws 4 bytes together).
+    USERNAME_LENGTH = 6  # Number of random characters in the username (before the index).
+    EMAIL_LENGTH = 6  # Number of random characters in the email local part (before the index).
+    PASSWORD_LENGTH = 12
 
-    @staticmethod
-    def generate_user() -> dict[str, str]:
-        """
-        Generate random user data.
+    # Because Clearbit enrichment is used to supply the additional data on user sign up, the default domains are of
+    # real companies.
+    EMAIL_DOMAINS = ['clearbit.com', 'intercom.io', 'airbnb.com', 'dropbox.com', 'segment.com', 'tray.io',
+                     'stripe.com', 'domo.com', 'cisco.com']
 
-        :return: The user information
+    __NAME_TABLE = bytes.maketrans(bytes(range(256)), (NAME_ALPHABET * 8).encode())
+    __PASSWORD_TABLE = bytes.maketrans(bytes(range(256)), (PASSWORD_ALPHABET * 4).encode())
+
+    def __init__(self, seed: int = None, domains: list[str] = None) -> None:
         """
-        user = {
-            'username': Generator.generate_user_name(),
-            'password': Generator.generate_password(),
-            'email': Generator.generate_mail()
-        }
+        Constructor to initialize the generator.
+        :param seed: The seed (None for random seed).
+        :param domains: The domains of the emails (the users are spread between them).
+        """
+        self.random = random.Random(seed)
+        self.domains = domains or self.EMAIL_DOMAINS
+        self.index = 0  # The index of the next user.
+        self.namespace = self.random.randbytes(self.NAMESPACE_LENGTH).translate(self.__NAME_TABLE).decode('ascii')
 
-        return user
+    @classmethod
+    def from_rules(cls) -> 'Generator':
+        """
+        Create the generator from the configuration file ('USERS_SEED' and 'EMAIL_DOMAINS').
+        :return: The generator.
+        """
+        return cls(get_rule('USERS_SEED', None), get_rule('EMAIL_DOMAINS', None))
 
-    @staticmethod
-    def generate_user_name() -> str:
+    def generate_users(self, count: int) -> list[dict[str, str]]:
         """
-        Generate random username.
-        :return: The username
+        Generate random users data.
+        :param count: The number of users.
+        :return: The users information.
         """
+        # Every user has its own part of the random bytes (so the users don't depend on the number of users generated
+        # together), the bytes are mapped to the characters of the names and of the passwords once for all the users.
+        name_length = self.USERNAME_LENGTH + self.EMAIL_LENGTH
+        user_length = name_length + self.PASSWORD_LENGTH
+        data = self.random.randbytes(count * user_length)
+        names = data.translate(self.__NAME_TABLE).decode('ascii')
+        passwords = data.translate(self.__PASSWORD_TABLE).decode('ascii')
 
-        username = "".join(random.choice(string.ascii_lowercase) for _ in range(2))
-        username = username + "".join(random.choice(string.digits) for _ in range(4))
-        username = username + "".join(random.choice(string.ascii_uppercase) for _ in range(5))
-        return username
+        users = []
+        for position in range(count):
+            index, offset = self.index + position, position * user_length
+            name = names[offset:offset + name_length]
+            password = passwords[offset + name_length:offset + user_length]
+            domain = self.domains[index % len(self.domains)]
 
-    @staticmethod
-    def generate_password() -> str:
+            users.append({
+                'username': '%s%s%s' % (self.namespace, name[:self.USERNAME_LENGTH], index),
+                'password': password,
+                'email': '%s.%s%s@%s' % (self.namespace, name[self.USERNAME_LENGTH:], index, domain),
+            })
+
+        self.index += count
+        return users
+
+    def generate_user(self) -> dict[str, str]:
         """
-        Generate random password.
-        :return: The password.
+        Generate random user data.
+
+        :return: The user information
         """
+        return self.generate_users(1)[0]
 
-        password = "".join(random.choice(string.ascii_lowercase) for _ in range(2))
-        password = password + "".join(random.choice(string.digits) for _ in range(4))
-        password = password + "".join(random.choice(string.ascii_uppercase) for _ in range(5))
-        return password
+    def write_fixture(self, path: str, count: int, batch_size: int = 10000) -> None:
+        """
+        Generate users and write them to fixture file (JSON object in every line) to use them in the bot later.
+        :param path: The path of the fixture file.
+        :param count: The number of users.
+        :param batch_size: The number of users generated together.
+        """
+        with open(path, 'w') as fixture:
+            for start in range(0, count, batch_size):
+                users = self.generate_users(min(batch_size, count - start))
+                fixture.writelines(json.dumps(user) + '\n' for user in users)
 
     @staticmethod
-    def generate_mail() -> str:
+    def read_fixture(path: str, count: int = None) -> list[dict[str, str]]:
         """
-        Generate random mail.
-        :return: The mail.
-
+        Read the users of fixture file.
+        :param path: The path of the fixture file.
+        :param count: The number of users to read (None to read all the users).
+        :return: The users information.
         """
-        # Because Clearbit enrichment is used to supply the additional data on user sign up
-        # There is need to use real mails to get the user data.
+        with open(path) as fixture:
+            users = [json.loads(line) for line in itertools.islice(fixture, count)]
+
+        if count is not None and len(users) < count:
+            raise Exception('The fixture %s has only %s users.' % (path, len(users)))
+
+        return users
+
+
+def iter_users(batch_size: int) -> Iterator[dict[str, str]]:
+    """
+    Iterate the users for the bot run, from the fixture file if 'USERS_FIXTURE' is set or generated in batches (the
+    bot takes the next user when a user isn't registered, so the generated users never run out).
+    :param batch_size: The number of users generated together.
+    :return: Iterator of the users information.
+    """
+    path = get_rule('USERS_FIXTURE', None)
+
+    if path:
+        yield from Generator.read_fixture(path)
+        return
+
+    generator = Generator.from_rules()
+    while True:
+        yield from generator.generate_users(batch_size)
+
+
+def next_user(users: Iterator[dict[str, str]]) -> dict[str, str]:
+    """
+    Get the next user to register.
+    :param users: The users iterator (see 'iter_users').
+    :return: The user information.
+    :exception: Exception if there are no more users (all the users of the fixture file are used).
+    """
+    user = next(users, None)
+    if user is None:
+        raise Exception('There are no more users to register (all the users of the fixture are used).')
 
-        mails = ['alex@clearbit.com', 'harlow@clearbit.com', 'eoghan@intercom.io', 'brian@airbnb.com',
-                 'arash@dropbox.com', 'peter@segment.com', 'dom@tray.io', 'john@stripe.com', 'josh@domo.com',
-                 'crobbins@cisco.com']
-        return random.choice(mails)
+    return user
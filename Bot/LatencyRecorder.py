@@ -0,0 +1,88 @@
+# package: Bot.LatencyRecorder
+import bisect
+import threading
+import time
+
+
+class LatencyRecorder:
+    """
+    Records the latency and the errors of the requests of every endpoint (used by the benchmark).
+    """
+    BUCKETS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]  # Histogram buckets bounds (ms).
+    PERCENTILES = [50, 95, 99]  # The reported percentiles.
+
+    def __init__(self) -> None:
+        """
+        Constructor to initialize the recorder.
+        """
+        self.__samples = {}  # The latencies (ms) of the requests by endpoint.
+        self.__errors = {}  # The number of failed requests by endpoint.
+        self.__lock = threading.Lock()
+        self.started_at = time.perf_counter()
+        self.stopped_at = None
+
+    def record(self, endpoint: str, latency: float, failed: bool = False) -> None:
+        """
+        Record request.
+        :param endpoint: The endpoint name (method and path template).
+        :param latency: The request latency in seconds.
+        :param failed: If the request failed.
+        """
+        with self.__lock:
+            self.__samples.setdefault(endpoint, []).append(latency * 1000)
+            self.__errors[endpoint] = self.__errors.get(endpoint, 0) + int(failed)
+
+    def stop(self) -> None:
+        """
+        Stop the recording (the throughput is computed until the recording stopped).
+        """
+        self.stopped_at = time.perf_counter()
+
+    def summary(self) -> dict:
+        """
+        Summarize the recorded requests.
+        :return: The latency percentiles, histogram, throughput and error rate of every endpoint and of all of them.
+        """
+        duration = (self.stopped_at or time.perf_counter()) - self.started_at
+
+        with self.__lock:
+            endpoints = {endpoint: self.__summarize(samples, self.__errors[endpoint], duration)
+                         for endpoint, samples in sorted(self.__samples.items())}
+            all_samples = [sample for samples in self.__samples.values() for sample in samples]
+            total = self.__summarize(all_samples, sum(self.__errors.values()), duration)
+
+        return {'duration': duration, 'total': total, 'endpoints': endpoints}
+
+    def __summarize(self, samples: list, errors: int, duration: float) -> dict:
+        """
+        Summarize the requests of one endpoint.
+        :param samples: The requests latencies (ms).
+        :param errors: The number of failed requests.
+        :param duration: The recording duration in seconds.
+        :return: The requests summary.
+        """
+        samples = sorted(samples)
+        count = len(samples)
+
+        summary = {
+            'count': count,
+            'errors': errors,
+            'error_rate': errors / count if count else 0,
+            'throughput': count / duration if duration else 0,  # Requests per second.
+            'mean': sum(samples) / count if count else 0,
+            'max': samples[-1] if count else 0,
+        }
+
+        # Nearest rank percentiles.
+        for percentile in self.PERCENTILES:
+            rank = max(0, -(-percentile * count // 100) - 1)
+            summary['p%s' % percentile] = samples[rank] if count else 0
+
+        # Number of requests in every bucket (the bucket is named by its upper bound, the last one is unbounded).
+        histogram = [0] * (len(self.BUCKETS) + 1)
+        for sample in samples:
+            histogram[bisect.bisect_left(self.BUCKETS, sample)] += 1
+        names = ['<=%sms' % bound for bound in self.BUCKETS] + ['>%sms' % self.BUCKETS[-1]]
+        summary['histogram'] = dict(zip(names, histogram))
+
+        return summary
@@ -0,0 +1,220 @@
+# package: Bot.LocalState
+import random
+
+
+class IndexedSet:
+    """
+    Set that keeps its items in a list too, so an item is added, removed and chosen randomly in O(1).
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor to initialize the set.
+        """
+        self.items = []  # The items (in no particular order).
+        self.__positions = {}  # The position of every item in the list.
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item) -> bool:
+        return item in self.__positions
+
+    def add(self, item) -> None:
+        """
+        Add the item (nothing is done if it's already in the set).
+        :param item: The item to add.
+        """
+        if item not in self.__positions:
+            self.__positions[item] = len(self.items)
+            self.items.append(item)
+
+    def discard(self, item) -> None:
+        """
+        Remove the item (nothing is done if it's not in the set), the last item takes its position.
+        :param item: The item to remove.
+        """
+        position = self.__positions.pop(item, None)
+        if position is None:
+            return
+
+        last = self.items.pop()
+        if position < len(self.items):
+            self.items[position] = last
+            self.__positions[last] = position
+
+    def choice(self, rng=random):
+        """
+        Choose random item.
+        :param rng: The random numbers generator.
+        :return: The item.
+        """
+        return self.items[rng.randrange(len(self.items))]
+
+
+class LocalState:
+    """
+    Local model of the posts of the site and the likes of the users (used by the bot in the stream mode and to
+    simulate the like activity offline).
+
+    The posts are kept by ID, the posts with no likes are kept by their creator and every user has the set of the posts
+    he liked, everything is updated on every change so choosing the next post to like doesn't scan the posts.
+    """
+    MAX_SAMPLES = 32  # Number of random posts of the creator to try before filtering all his posts.
+
+    def __init__(self) -> None:
+        """
+        Constructor to initialize the state.
+        """
+        self.posts = {}  # The posts by ID.
+        self.liked_posts = {}  # The IDs of the posts every user liked by the username.
+        self.__creators_posts = {}  # The IDs of the posts of every creator.
+        self.__unliked_posts = {}  # The IDs of the posts with no likes of every creator.
+        self.__creators = IndexedSet()  # The creators that have posts with no likes.
+
+    def __len__(self) -> int:
+        return len(self.posts)
+
+    @property
+    def creators_count(self) -> int:
+        """
+        The number of the creators that have posts with no likes.
+        """
+        return len(self.__creators)
+
+    def add_posts(self, posts) -> None:
+        """
+        Add the posts (or update them if they are already known).
+        :param posts: The posts (dicts with id, creator, likes_count and optionally title).
+        """
+        for post in posts:
+            self.update_post(post['id'], post['creator'], post['likes_count'], post.get('title'))
+
+    def update_post(self, post_id: int, creator: str, likes_count: int, title: str = None) -> dict:
+        """
+        Add the post or update it if it's already known.
+        :param post_id: The post ID.
+        :param creator: The username of the post creator.
+        :param likes_count: The number of likes of the post.
+        :param title: The post title (None to keep the known title).
+        :return: The post.
+        """
+        post = self.posts.get(post_id)
+
+        if post is None:
+            post = self.posts[post_id] = {'id': post_id, 'title': title or '', 'creator': creator, 'likes_count': 0}
+            self.__creators_posts.setdefault(creator, IndexedSet()).add(post_id)
+            self.__set_unliked(post, True)
+        elif title is not None:
+            post['title'] = title
+
+        self.__set_likes_count(post, likes_count)
+        return post
+
+    def like(self, username: str, post_id: int, likes_count: int = None) -> None:
+        """
+        Record that the user liked the known post.
+        :param username: The username of the user.
+        :param post_id: The post ID.
+        :param likes_count: The number of likes of the post after the like (None to count the like locally).
+        """
+        post = self.posts[post_id]
+        liked_posts = self.liked_posts.setdefault(username, set())
+
+        if likes_count is None:
+            likes_count = post['likes_count'] + (post_id not in liked_posts)
+
+        liked_posts.add(post_id)
+        self.__set_likes_count(post, likes_count)
+
+    def unlike(self, username: str, post_id: int, likes_count: int = None) -> None:
+        """
+        Record that the user unliked the known post.
+        :param username: The username of the user.
+        :param post_id: The post ID.
+        :param likes_count: The number of likes of the post after the unlike (None to count the unlike locally).
+        """
+        post = self.posts[post_id]
+        liked_posts = self.liked_posts.setdefault(username, set())
+
+        if likes_count is None:
+            likes_count = post['likes_count'] - (post_id in liked_posts)
+
+        liked_posts.discard(post_id)
+        self.__set_likes_count(post, likes_count)
+
+    def choose_creator(self, username: str, rng=random):
+        """
+        Choose random creator of the posts with no likes (excluding the user).
+        :param username: The username of the user.
+        :param rng: The random numbers generator.
+        :return: The username of the creator or None if only the user has posts with no likes.
+        """
+        creators = self.__creators
+
+        if len(creators) == 0 or (len(creators) == 1 and username in creators):
+            return None
+
+        # At least half of the creators are not the user so few tries are needed.
+        while True:
+            creator = creators.choice(rng)
+            if creator != username:
+                return creator
+
+    def choose_post(self, username: str, creator: str, rng=random) -> dict:
+        """
+        Choose random post of the creator that the user didn't like (the creator should have posts with no likes).
+        :param username: The username of the user.
+        :param creator: The username of the creator.
+        :param rng: The random numbers generator.
+        :return: The post.
+        """
+        creator_posts = self.__creators_posts[creator]
+        liked_posts = self.liked_posts.get(username, ())
+
+        for _ in range(self.MAX_SAMPLES):
+            post_id = creator_posts.choice(rng)
+            if post_id not in liked_posts:
+                return self.posts[post_id]
+
+        # The user liked most of the creator posts, choose from the ones he didn't like.
+        post_ids = [post_id for post_id in creator_posts.items if post_id not in liked_posts]
+        return self.posts[post_ids[rng.randrange(len(post_ids))]]
+
+    def choose(self, username: str, rng=random):
+        """
+        Choose the next post for the user to like according to the task rules: random creator of the posts with no
+        likes (excluding the user) and random post of the creator that the user didn't like.
+        :param username: The username of the user.
+        :param rng: The random numbers generator.
+        :return: The post or None if the user can't like any post.
+        """
+        creator = self.choose_creator(username, rng)
+        return None if creator is None else self.choose_post(username, creator, rng)
+
+    def __set_likes_count(self, post: dict, likes_count: int) -> None:
+        """
+        Set the number of likes of the post and move it in or out of the posts with no likes.
+        :param post: The post.
+        :param likes_count: The number of likes.
+        """
+        if (post['likes_count'] == 0) != (likes_count == 0):
+            self.__set_unliked(post, likes_count == 0)
+        post['likes_count'] = likes_count
+
+    def __set_unliked(self, post: dict, unliked: bool) -> None:
+        """
+        Add the post to the posts with no likes of its creator or remove it from them.
+        :param post: The post.
+        :param unliked: If the post has no likes.
+        """
+        creator = post['creator']
+        unliked_posts = self.__unliked_posts.setdefault(creator, IndexedSet())
+
+        if unliked:
+            unliked_posts.add(post['id'])
+            self.__creators.add(creator)
+        else:
+            unliked_posts.discard(post['id'])
+            if len(unliked_posts) == 0:
+                self.__creators.discard(creator)
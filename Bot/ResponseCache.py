@@ -0,0 +1,70 @@
+# package: Bot.ResponseCache
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class ResponseCache:
+    """
+    Local cache of the site responses and their ETags, used to send conditional GET requests.
+
+    When the cached response is sent back with 'If-None-Match' the site answers 304 (without the body) until the
+    response changes, and the cached body is used instead.
+    """
+    MAX_SIZE = 1000  # Maximum number of cached responses.
+
+    def __init__(self, max_size: int = MAX_SIZE) -> None:
+        """
+        Constructor to initialize the cache.
+        :param max_size: Maximum number of cached responses.
+        """
+        self.max_size = max_size
+        self.__entries = OrderedDict()  # The ETag and the body of every response ordered from the least recently used.
+        self.__lock = threading.Lock()
+        self.hits = 0  # Number of 304 responses.
+        self.misses = 0  # Number of full responses.
+
+    @staticmethod
+    def get_key(url: str, params: Optional[dict], token: Optional[str]) -> tuple:
+        """
+        Get the key of the response (the responses of the site depend on the logged user).
+        :param url: The requested address.
+        :param params: The query parameters.
+        :param token: The JWT token of the logged user.
+        :return: The cache key.
+        """
+        return url, tuple(sorted((params or {}).items())), token
+
+    def get_headers(self, key: tuple) -> dict:
+        """
+        Get the headers to make the request conditional.
+        :param key: The response key.
+        :return: The 'If-None-Match' header if the response is cached, otherwise empty headers.
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+        return {'If-None-Match': entry[0]} if entry else {}
+
+    def resolve(self, key: tuple, status: int, etag: Optional[str], body: Any) -> Any:
+        """
+        Get the body of the response and cache the new responses.
+        :param key: The response key.
+        :param status: The response status.
+        :param etag: The response ETag.
+        :param body: The response body (None when the status is 304).
+        :return: The cached body if the response didn't change, otherwise the received body.
+        """
+        with self.__lock:
+            if status == 304 and key in self.__entries:
+                self.hits += 1
+                self.__entries.move_to_end(key)
+                return self.__entries[key][1]
+
+            self.misses += 1
+            if status == 200 and etag:
+                self.__entries[key] = (etag, body)
+                self.__entries.move_to_end(key)
+                if len(self.__entries) > self.max_size:
+                    self.__entries.popitem(last=False)
+
+        return body
@@ -5,4 +5,22 @@ SITE_ADDRESS = "http://127.0.0.1:8000"  # The site address.
 LOGIN_PATH = "login/"  # The path to the login page.
 SIGNUP_PATH = "signup/"  # The path to the register page.
 POSTS_PATH = "posts/" # The path to the posts page.
-USERS_PATH = "users/" # The path to the users page.
\ No newline at end of file
+USERS_PATH = "users/" # The path to the users page.
+CONCURRENCY_LIMIT = 10  # Maximum number of concurrent requests (and pooled connections) to the site.
+EVENTS_PATH = "events/"  # The path to the posts events stream.
+ASYNC_MODE = False  # Run the users concurrently (used to generate load on the site).
+STREAM_MODE = False  # Keep the posts from the events stream instead of requesting them before every like (regular bot).
+USERS_SEED = None  # The seed of the generated users (the same seed generates the same users), None for random seed.
+EMAIL_DOMAINS = ["clearbit.com", "intercom.io", "airbnb.com", "dropbox.com", "segment.com", "tray.io", "stripe.com",
+                 "domo.com", "cisco.com"]  # The domains of the generated users emails.
+USERS_FIXTURE = None  # Path of users fixture file (generate_users.py) to sign up its users instead of generated users.
+MAX_SIGNUP_ATTEMPTS = 5  # Maximum number of users tried for every new user (when the email is taken or invalid).
+SIMULATION_SEED = None  # The seed of the offline simulation (simulate.py), None for random seed.
+BULK_POSTS = False  # Create the posts of every user with the bulk posts API (used to seed large datasets).
+BULK_POSTS_BATCH_SIZE = 500  # Maximum number of posts created in one request.
+BENCHMARK_SCENARIO = "mixed"  # The default benchmark scenario (signup_storm, login_storm, feed_read, like_storm or mixed).
+BENCHMARK_USERS = 20  # Number of users that sign up in the benchmark.
+BENCHMARK_POSTS_PER_USER = 20  # Number of posts every user creates before the benchmark scenario.
+BENCHMARK_REQUESTS = 500  # Number of requests in the read, login and mixed benchmark scenarios.
+BENCHMARK_ASYNC_VIEWS = False  # Send the benchmark reads to the async views (the site should run on ASGI server).
+BENCHMARK_OUTPUT_DIR = "benchmarks"  # The directory of the benchmark results files.
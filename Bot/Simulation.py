@@ -0,0 +1,180 @@
+# package: Bot.Simulation
+import time
+
+import numpy as np
+
+
+class BatchedRandom:
+    """
+    Random numbers generator that draws the random numbers from NumPy generator in batches (the simulation draws one
+    number for every choice, drawing them one by one from NumPy is slow).
+    """
+    BATCH_SIZE = 1 << 16  # Number of random numbers drawn together.
+
+    def __init__(self, seed=None) -> None:
+        """
+        Constructor to initialize the generator.
+        :param seed: The seed (int or NumPy SeedSequence, None for random seed).
+        """
+        self.generator = np.random.default_rng(seed)
+        self.__numbers = []
+        self.__index = 0
+
+    def random(self) -> float:
+        """
+        Get random float in [0, 1).
+        :return: The random number.
+        """
+        if self.__index == len(self.__numbers):
+            self.__numbers = self.generator.random(self.BATCH_SIZE).tolist()
+            self.__index = 0
+
+        self.__index += 1
+        return self.__numbers[self.__index - 1]
+
+    def randrange(self, stop: int) -> int:
+        """
+        Get random integer in [0, stop) (the same signature as 'random.randrange' so it can be used by 'LocalState').
+        :param stop: The upper bound.
+        :return: The random integer.
+        """
+        return int(self.random() * stop)
+
+
+class Simulation:
+    """
+    Offline simulation of the like activity of the bot (used for capacity planning of millions of users and posts).
+
+    The rules are the rules of the bot: every user creates random number of posts, the users like posts one after the
+    other ordered by the number of their posts, every like is of random post (that the user didn't like) of random
+    creator of the posts with no likes (excluding the user) and the simulation stops when the user can't like any post.
+    The posts are NumPy arrays ordered by creator (the post IDs are the creation order of the bot) and the creators
+    with posts with no likes are kept in array with their positions, so every like is O(1).
+    """
+    MAX_SAMPLES = 32  # Number of random posts of the creator to try before filtering all his posts.
+
+    def __init__(self, posts_counts, max_likes_per_user: int, seed: int = None) -> None:
+        """
+        Constructor to initialize the simulation.
+        :param posts_counts: The number of posts of every user (in the sign up order).
+        :param max_likes_per_user: Maximum number of likes the user can do.
+        :param seed: The seed of the random choices (None for random seed).
+        """
+        self.posts_counts = np.asarray(posts_counts, dtype=np.int64)
+        self.max_likes_per_user = max_likes_per_user
+        self.random = BatchedRandom(seed)
+
+        self.first_posts = np.concatenate(([0], np.cumsum(self.posts_counts)[:-1]))  # The first post of every user.
+        self.creators = np.repeat(np.arange(len(self.posts_counts)), self.posts_counts)  # The creator of every post.
+        self.likes_counts = np.zeros(len(self.creators), dtype=np.int64)  # The number of likes of every post.
+        self.__first_posts, self.__posts_counts = memoryview(self.first_posts), memoryview(self.posts_counts)
+
+        # The user and the post of every like in the like order (every user likes at most max likes).
+        self.likes_users = np.empty(len(self.posts_counts) * max_likes_per_user, dtype=np.int64)
+        self.likes_posts = np.empty(len(self.posts_counts) * max_likes_per_user, dtype=np.int64)
+        self.likes_count = 0
+
+    @classmethod
+    def generate(cls, number_of_users: int, max_posts_per_user: int, max_likes_per_user: int,
+                 seed: int = None) -> 'Simulation':
+        """
+        Create simulation of users with random number of posts (between 1 and the maximum like the bot creates).
+        :param number_of_users: Number of users.
+        :param max_posts_per_user: Maximum number of posts the user can create.
+        :param max_likes_per_user: Maximum number of likes the user can do.
+        :param seed: The seed of the posts counts and the random choices (None for random seed).
+        :return: The simulation.
+        """
+        posts_seed, choices_seed = np.random.SeedSequence(seed).spawn(2)  # Independent streams from one seed.
+        posts_counts = np.random.default_rng(posts_seed).integers(1, max_posts_per_user, size=number_of_users,
+                                                                   endpoint=True)
+        return cls(posts_counts, max_likes_per_user, choices_seed)
+
+    def run(self) -> dict:
+        """
+        Run the like activity.
+        :return: The simulation results.
+        """
+        started_at = time.perf_counter()
+
+        # The number of posts with no likes of every creator and the creators that have them (in creator order, the
+        # order the bot reads them), the position of every creator in the candidates is kept to remove him in O(1).
+        unliked_counts = np.bincount(self.creators[self.likes_counts == 0], minlength=len(self.posts_counts))
+        candidates = np.flatnonzero(unliked_counts > 0).tolist()
+        positions = np.full(len(self.posts_counts), -1, dtype=np.int64)
+        positions[candidates] = np.arange(len(candidates))
+
+        likes_per_user = np.zeros(len(self.posts_counts), dtype=np.int64)
+        stopped_by = None  # The user that couldn't like any post.
+
+        # Every like reads and writes few items of the arrays, through memory view it's faster than through NumPy.
+        likes_counts, likes_users, likes_posts = (memoryview(array) for array in (self.likes_counts, self.likes_users,
+                                                                                   self.likes_posts))
+        unliked_view, positions_view, likes_per_user_view = (memoryview(array) for array in (unliked_counts, positions,
+                                                                                              likes_per_user))
+
+        # Sort users by the number of posts they created (the sort is stable like the sort of the bot).
+        for user in np.argsort(-self.posts_counts, kind='stable').tolist():
+            liked_posts = set()
+
+            for _ in range(self.max_likes_per_user):
+
+                # Stop if all the posts are liked or the only posts that not liked are the user posts.
+                if len(candidates) == 0 or (len(candidates) == 1 and candidates[0] == user):
+                    stopped_by = user
+                    break
+
+                creator = user
+                while creator == user:
+                    creator = candidates[self.random.randrange(len(candidates))]
+
+                post = self.__choose_post(creator, liked_posts)
+                liked_posts.add(post)
+                likes_per_user_view[user] += 1
+                likes_users[self.likes_count], likes_posts[self.likes_count] = user, post
+                self.likes_count += 1
+
+                if likes_counts[post] == 0:
+                    unliked_view[creator] -= 1
+
+                    # Remove the creator from the candidates (the last candidate takes his position).
+                    if unliked_view[creator] == 0:
+                        position, last = positions_view[creator], candidates.pop()
+                        if last != creator:
+                            candidates[position], positions_view[last] = last, position
+                        positions_view[creator] = -1
+
+                likes_counts[post] += 1
+
+            if stopped_by is not None:
+                break
+
+        return {
+            'duration': time.perf_counter() - started_at,
+            'users': len(self.posts_counts),
+            'posts': len(self.creators),
+            'likes': self.likes_count,
+            'stopped_by': stopped_by,  # None if all the users reached max likes.
+            'users_reached_max_likes': int((likes_per_user == self.max_likes_per_user).sum()),
+            'posts_with_no_likes': int((self.likes_counts == 0).sum()),
+            'likes_per_user': likes_per_user,
+        }
+
+    def __choose_post(self, creator: int, liked_posts: set) -> int:
+        """
+        Choose random post of the creator that the user didn't like (the creator should have posts with no likes).
+        :param creator: The creator.
+        :param liked_posts: The posts the user liked.
+        :return: The post.
+        """
+        first_post, count = self.__first_posts[creator], self.__posts_counts[creator]
+
+        for _ in range(self.MAX_SAMPLES):
+            post = first_post + self.random.randrange(count)
+            if post not in liked_posts:
+                return post
+
+        # The user liked most of the creator posts, choose from the ones he didn't like.
+        posts = np.arange(first_post, first_post + count)
+        posts = posts[~np.isin(posts, list(liked_posts))]
+        return int(posts[self.random.randrange(len(posts))])
@@ -0,0 +1,109 @@
+# package: Bot.tests
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from Bot.Bot import Bot
+from Bot.LocalState import LocalState
+from Bot.Simulation import BatchedRandom, Simulation
+
+
+def run_local_state(posts_counts: list, max_likes_per_user: int, seed: int) -> list:
+    """
+    Run the like activity on the local state the way the bot does (users ordered by the number of their posts, every
+    user likes until he reaches max likes and the run stops when the user can't like any post).
+    :param posts_counts: The number of posts of every user (the users are named by their index).
+    :param max_likes_per_user: Maximum number of likes the user can do.
+    :param seed: The seed of the random choices.
+    :return: The user and the post of every like in the like order.
+    """
+    state, rng = LocalState(), BatchedRandom(seed)
+
+    post_ids = iter(range(sum(posts_counts)))  # The posts of every user follow the posts of the previous user.
+    state.add_posts({'id': next(post_ids), 'creator': str(user), 'likes_count': 0}
+                    for user, count in enumerate(posts_counts) for _ in range(count))
+
+    likes = []
+    for user in sorted(range(len(posts_counts)), key=lambda user: posts_counts[user], reverse=True):
+        for _ in range(max_likes_per_user):
+            post = state.choose(str(user), rng)
+            if post is None:
+                return likes
+
+            state.like(str(user), post['id'])
+            likes.append((user, post['id']))
+
+    return likes
+
+
+class SimulationTest(unittest.TestCase):
+    """
+    The simulation makes the same likes as the local state of the bot with the same random numbers.
+    """
+
+    def assert_same_likes(self, posts_counts: list, max_likes_per_user: int, seed: int) -> dict:
+        """
+        Check that the simulation and the local state make the same likes in the same order.
+        :param posts_counts: The number of posts of every user.
+        :param max_likes_per_user: Maximum number of likes the user can do.
+        :param seed: The seed of the random choices.
+        :return: The simulation results.
+        """
+        simulation = Simulation(posts_counts, max_likes_per_user, seed)
+        results = simulation.run()
+        likes = list(zip(simulation.likes_users[:simulation.likes_count].tolist(),
+                         simulation.likes_posts[:simulation.likes_count].tolist()))
+
+        self.assertEqual(likes, run_local_state(posts_counts, max_likes_per_user, seed))
+        self.assertEqual(results['likes'], len(likes))
+        return results
+
+    def test_random_posts(self):
+        posts_counts = np.random.default_rng(1).integers(1, 5, size=300, endpoint=True).tolist()
+        results = self.assert_same_likes(posts_counts, 3, seed=2)
+        self.assertIsNone(results['stopped_by'])  # Every user reached max likes.
+
+    def test_all_posts_liked(self):
+        # Few creators with many posts, the first user likes all the posts of the other creators (choosing from the
+        # posts he didn't like after the samples) and stops when only his posts are not liked.
+        results = self.assert_same_likes([60, 50, 40, 3], 200, seed=3)
+        self.assertEqual(results['stopped_by'], 0)
+        self.assertEqual(results['likes'], 93)
+        self.assertEqual(results['posts_with_no_likes'], 60)
+
+
+class SignupTest(unittest.TestCase):
+    """
+    A rejected user is replaced by the next user, up to max attempts.
+    """
+
+    def setUp(self) -> None:
+        self.bot = Bot()
+        self.bot.site_address, self.bot.signup_path = 'http://localhost:8000', 'signup/'
+        self.bot.session = mock.Mock()
+
+    def test_rejected_user_replaced(self):
+        self.bot.session.post.side_effect = [mock.Mock(status_code=400, text='taken'), mock.Mock(status_code=201)]
+        users = iter([{'email': 'taken@example.com'}, {'email': 'new@example.com'}])
+
+        self.assertEqual(self.bot._Bot__signup_user(users), {'email': 'new@example.com'})
+
+    def test_max_attempts(self):
+        self.bot.session.post.return_value = mock.Mock(status_code=400, text='invalid')
+        users = iter({'email': '%s@example.com' % index} for index in range(10))
+
+        with self.assertRaises(Exception):
+            self.bot._Bot__signup_user(users)
+        self.assertEqual(self.bot.session.post.call_count, self.bot.max_signup_attempts)
+
+    def test_site_failure(self):
+        self.bot.session.post.return_value = mock.Mock(status_code=500, text='error')
+
+        with self.assertRaises(Exception):
+            self.bot._Bot__signup_user(iter([{'email': 'a@example.com'}, {'email': 'b@example.com'}]))
+        self.assertEqual(self.bot.session.post.call_count, 1)  # The next user would fail the same way.
+
+
+if __name__ == '__main__':
+    unittest.main()
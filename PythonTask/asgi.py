@@ -13,4 +13,9 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'PythonTask.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from SocialNetwork.events import EventStreamApplication  # noqa: E402 (Django should be set up first)
+
+# The posts events are streamed in the event loop, the other requests are handled by Django.
+application = EventStreamApplication(django_application)
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/3.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -40,6 +41,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'SocialNetwork.profiling.ProfilingMiddleware',  # Used only when profiling is enabled (see 'PROFILING').
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -72,13 +74,56 @@ WSGI_APPLICATION = 'PythonTask.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/3.1/ref/settings/#databases
 
+# The database profile is chosen with the DATABASE_PROFILE environment variable.
+DATABASE_PROFILES = {
+    'sqlite': {
+        'ENGINE': 'SocialNetwork.db.backends.sqlite3',  # SQLite with the options of newer Django versions.
+        'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            # WAL journal so the reads don't block the writes, fsync only on checkpoints and wait for the lock.
+            'init_command': 'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA busy_timeout=20000',
+            'transaction_mode': 'IMMEDIATE',  # Take the write lock when the transaction begins.
+        },
+        # The tests database is a file too, the connections of the concurrency tests threads to in-memory database fail
+        # on its table locks instead of waiting for them.
+        'TEST': {'NAME': BASE_DIR / 'test_db.sqlite3'},
+    },
+    # Requires the psycopg2 library. Set POSTGRES_PGBOUNCER=true when connecting through PgBouncer in transaction
+    # pooling mode (the server side cursors of the streamed posts don't work with it).
+    'postgresql': {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.environ.get('POSTGRES_DB', 'pythontask'),
+        'USER': os.environ.get('POSTGRES_USER', 'postgres'),
+        'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+        'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
+        'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+        'DISABLE_SERVER_SIDE_CURSORS': os.environ.get('POSTGRES_PGBOUNCER', 'false').lower() == 'true',
+    },
+}
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        **DATABASE_PROFILES[os.environ.get('DATABASE_PROFILE', 'sqlite')],
+        # Keep the connection of every thread open between requests for this number of seconds (0 to close it after
+        # every request, None to keep it open).
+        'CONN_MAX_AGE': int(os.environ.get('DATABASE_CONN_MAX_AGE', 60)),
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/3.1/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # Cache that kept between the site restarts.
+    'persistent': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.cache',
+    },
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/3.1/ref/settings/#auth-password-validators
 
@@ -97,6 +142,53 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing (see 'SocialNetwork.auth.hashers'), the profile is chosen with the PASSWORD_HASHING_PROFILE
+# environment variable. The first hasher of the profile hashes the passwords, the other hashers only verify the old
+# hashes and the passwords are hashed again with the first hasher (or its new cost) when the users log in.
+PASSWORD_HASHING = {
+    'PROFILE': os.environ.get('PASSWORD_HASHING_PROFILE', 'default'),
+    'ARGON2': {
+        'TIME_COST': 2,  # Number of passes over the memory.
+        'MEMORY_COST': 19 * 1024,  # Memory used to hash a password (KiB).
+        'PARALLELISM': 1,  # Number of threads used to hash a password.
+    },
+    'SCRYPT': {
+        'WORK_FACTOR': 2 ** 15,  # CPU and memory cost (power of 2).
+        'BLOCK_SIZE': 8,  # Block size, the memory used is 128 * WORK_FACTOR * BLOCK_SIZE bytes.
+        'PARALLELISM': 1,  # Number of independent computations.
+    },
+    'ALLOW_LOAD_TEST_HASHER': False,  # Allow the insecure 'loadtest' profile (only for benchmarks).
+}
+
+PASSWORD_HASHING_PROFILES = {
+    # Django default hasher (PBKDF2).
+    'default': [
+        'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+        'SocialNetwork.auth.hashers.TunedArgon2PasswordHasher',
+        'SocialNetwork.auth.hashers.ScryptPasswordHasher',
+    ],
+    # Memory hard hashers for production, argon2 requires the argon2-cffi library.
+    'argon2': [
+        'SocialNetwork.auth.hashers.TunedArgon2PasswordHasher',
+        'SocialNetwork.auth.hashers.ScryptPasswordHasher',
+        'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    ],
+    'scrypt': [
+        'SocialNetwork.auth.hashers.ScryptPasswordHasher',
+        'SocialNetwork.auth.hashers.TunedArgon2PasswordHasher',
+        'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    ],
+    # Fast and NOT SECURE hasher for load tests (requires 'ALLOW_LOAD_TEST_HASHER').
+    'loadtest': [
+        'SocialNetwork.auth.hashers.LoadTestPasswordHasher',
+        'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+        'SocialNetwork.auth.hashers.TunedArgon2PasswordHasher',
+        'SocialNetwork.auth.hashers.ScryptPasswordHasher',
+    ],
+}
+
+PASSWORD_HASHERS = PASSWORD_HASHING_PROFILES[PASSWORD_HASHING['PROFILE']]
+
 # Internationalization
 # https://docs.djangoproject.com/en/3.1/topics/i18n/
 
@@ -118,13 +210,86 @@ STATIC_URL = '/static/'
 # hunter.io API key
 HUNTER_API_KEY = 'Hunter.io API Key'
 
+# Verification of the new users emails (see 'SocialNetwork.verification.EmailVerifier').
+EMAIL_VERIFICATION = {
+    'CLIENT': 'SocialNetwork.verification.HunterEmailVerificationClient',  # Use 'FakeEmailVerificationClient' in tests.
+    'CACHE': 'persistent',  # Alias of the cache to keep the verdicts.
+    'EMAIL_TIMEOUT': 60 * 60 * 24 * 30,  # Number of seconds to keep the verdict of an email.
+    'DOMAIN_TIMEOUT': 60 * 60 * 24,  # Number of seconds to keep the verdict of a domain without mail servers.
+    'FAILURE_THRESHOLD': 5,  # Number of failed calls in a row that stop the calls to hunter.io.
+    'RECOVERY_TIMEOUT': 60,  # Number of seconds to wait before calling hunter.io again.
+    'FALLBACK_VALID': True,  # Accept the emails when hunter.io can't be called.
+}
+
 # clearbit enrichment API key
 CLEARBIT_API_KEY = 'Clearbit Enrichment API key'
 
+# Background enrichment of the users information (see 'SocialNetwork.enrichment.EnrichmentQueue').
+ENRICHMENT = {
+    'CLIENT': 'SocialNetwork.enrichment.ClearbitEnrichmentClient',  # Use 'FakeEnrichmentClient' in tests and benchmarks.
+    'WORKERS': 2,  # Number of background workers (0 to enrich the users during the sign up).
+    'BATCH_SIZE': 20,  # Maximum number of users enriched together.
+    'BATCH_WAIT': 0.5,  # Maximum number of seconds to wait for a batch to fill.
+    'CACHE': 'default',  # Alias of the cache to keep the lookups results.
+    'CACHE_TIMEOUT': 60 * 60 * 24,  # Number of seconds to keep the lookups results.
+    'MAX_RETRIES': 3,  # Number of times to retry failed lookups (only with workers).
+    'RETRY_BACKOFF': 1.0,  # Number of seconds to wait before the first retry (doubled every retry).
+}
+
 # The users models that to use for signing up and login the users.
 AUTH_USER_MODEL = 'SocialNetwork.User'
 
 # The authentication backend to use to authenticate the user based on the JWT token.
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': ('SocialNetwork.auth.backends.JWTAuthenticationBackend',),
-}
\ No newline at end of file
+}
+
+# Issuing and revoking of the JWT tokens (see 'SocialNetwork.auth.TokenService').
+JWT_TOKENS = {
+    'LIFETIME': 60 * 60 * 24 * 60,  # Number of seconds until a token expires.
+    'REFRESH_BEFORE': 60 * 60 * 24,  # Issue a new token when the cached token expires in less seconds than this.
+    'CACHE': 'persistent',  # Alias of the cache to keep the issued tokens (must be shared, the revocations are in the DB).
+}
+
+# Cache of the verified JWT tokens and their users (see 'SocialNetwork.auth.TokenCache'). With the process cache a user
+# changed in one process is invalidated only in that process (warning W001), the users changed by 'QuerySet.update()'
+# are not invalidated at all.
+JWT_AUTHENTICATION_CACHE = {
+    'MAX_SIZE': 10000,  # Maximum number of tokens cached in the process.
+    'TIMEOUT': 300,  # Maximum number of seconds a token is cached.
+    'CACHE': None,  # Alias of a cache in CACHES to share the tokens between processes (None to cache in the process).
+}
+
+# Cache of the posts every user liked, used to mark the liked posts (see 'SocialNetwork.likes.LikedPostsCache').
+LIKED_POSTS_CACHE = {
+    'CACHE': 'persistent',  # Alias of the cache to keep the liked posts of the users (shared by all the processes).
+    'TIMEOUT': 60 * 60,  # Number of seconds to keep the liked posts of a user.
+}
+
+# Change counters of the posts feeds used for conditional GET requests (see 'SocialNetwork.versioning.FeedVersions').
+FEED_VERSIONS = {
+    'CACHE': 'persistent',  # Alias of the cache to keep the counters (must be shared by all the processes).
+}
+
+# Cache of the rendered posts of the feed (see 'SocialNetwork.feed.FeedCache').
+FEED_CACHE = {
+    'ENABLED': True,  # If the feed is rendered from the cache.
+    'CACHE': 'default',  # Alias of the cache to keep the rendered posts (use a shared cache with many processes).
+    'TIMEOUT': 60 * 10,  # Number of seconds to keep a rendered post.
+}
+
+# Stream of the posts events (see 'SocialNetwork.events.EventStream').
+EVENT_STREAM = {
+    'POLL_INTERVAL': 0.5,  # Number of seconds between the reads of the new events.
+    'BATCH_SIZE': 500,  # Maximum number of events read together.
+    'HEARTBEAT': 15,  # Number of seconds without events until a comment is sent to keep the connection.
+    'RETRY': 1000,  # Number of milliseconds the client waits before reconnecting.
+}
+
+# Profiling of the requests (see 'SocialNetwork.profiling.ProfilingMiddleware').
+PROFILING = {
+    'ENABLED': DEBUG,  # If the requests are profiled.
+    'HEADER': True,  # If to send the profile in the 'Server-Timing' header.
+    'STATS': True,  # If to aggregate the profiles in the stats of the process ('profiling/stats/').
+    'LOG': False,  # If to log the profile of every request.
+}
@@ -0,0 +1,24 @@
+"""
+Django settings for running the benchmarks (see 'Bot.Benchmark').
+
+The external services are replaced with local fakes so they don't affect the results.
+"""
+
+from PythonTask.settings import *  # noqa: F401,F403
+
+DEBUG = False
+
+ALLOWED_HOSTS = ['127.0.0.1', 'localhost']
+
+# Generate the users information locally instead of Clearbit Enrichment.
+ENRICHMENT = {**ENRICHMENT, 'CLIENT': 'SocialNetwork.enrichment.FakeEnrichmentClient'}
+
+# Verify the emails locally instead of hunter.io.
+EMAIL_VERIFICATION = {**EMAIL_VERIFICATION, 'CLIENT': 'SocialNetwork.verification.FakeEmailVerificationClient'}
+
+# Allow the fast password hasher of the load tests (PASSWORD_HASHING_PROFILE=loadtest), so the signups and logins
+# are not limited by the password hashing.
+PASSWORD_HASHING = {**PASSWORD_HASHING, 'ALLOW_LOAD_TEST_HASHER': True}
+
+# Profile the requests to see where the time goes (the stats are in 'profiling/stats/'), the overhead is small.
+PROFILING = {**PROFILING, 'ENABLED': True}
@@ -0,0 +1,11 @@
+# package: SocialNetwork.auth
+from rest_framework import permissions
+
+
+class IsSuperUser(permissions.BasePermission):
+    """
+    Allow access only to the super users (created with 'createsuperuser'), the users have no staff flag.
+    """
+
+    def has_permission(self, request, view) -> bool:
+        return bool(request.user and request.user.is_authenticated and request.user.is_superuser)
@@ -0,0 +1,285 @@
+# package: SocialNetwork.auth
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.checks import Tags, Warning, register
+from django.core.signals import setting_changed
+from django.db import router
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from SocialNetwork.checks import check_shared_cache
+from SocialNetwork.models import User
+
+
+class TokenCache:
+    """
+    Bounded LRU cache (with expiration) of the decoded JWT tokens and the users they authenticate.
+
+    The cache keeps a lightweight snapshot of the user (without the password) so authenticating a request with
+    a cached token doesn't access the database. Changing or deleting a user invalidates all his cached tokens.
+    The entries are kept in the process or in a shared Django cache when the 'CACHE' option is set, a user changed
+    in one process invalidates the tokens cached in the other processes only with a shared cache.
+
+    The invalidation is done by the save and delete signals of the user, changing the users with 'QuerySet.update()'
+    or raw SQL doesn't send them, call 'invalidate_user()' for every changed user.
+    """
+    MAX_SIZE = 10000  # Maximum number of tokens cached in the process.
+    TIMEOUT = 300  # Maximum number of seconds a token is cached.
+
+    def __init__(self, max_size: int = MAX_SIZE, timeout: int = TIMEOUT, cache: Optional[str] = None) -> None:
+        """
+        Constructor to initialize the cache.
+        :param max_size: Maximum number of tokens cached in the process.
+        :param timeout: Maximum number of seconds a token is cached.
+        :param cache: Alias of Django cache to share the tokens between processes (None to cache in the process).
+        """
+        self.max_size = max_size
+        self.timeout = timeout
+        self.shared_cache = caches[cache] if cache else None
+
+        self.__entries = OrderedDict()  # The process cache entries ordered from the least recently used.
+        self.__users_versions = {}  # The version of the users that changed (used to invalidate the tokens).
+        self.__lock = threading.Lock()
+
+        # Counters to tune the cache.
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_settings(cls) -> 'TokenCache':
+        """
+        Create the cache from the 'JWT_AUTHENTICATION_CACHE' settings.
+        :return: The token cache.
+        """
+        options = getattr(settings, 'JWT_AUTHENTICATION_CACHE', {})
+        return cls(options.get('MAX_SIZE', cls.MAX_SIZE), options.get('TIMEOUT', cls.TIMEOUT), options.get('CACHE'))
+
+    def get(self, token: str) -> Optional[Tuple[dict, User]]:
+        """
+        Get the decoded token and the user it authenticates.
+        :param token: The JWT token.
+        :return: The token payload and the user or None if the token isn't cached.
+        """
+        entry = self.__get_entry(self.__get_key(token))
+
+        if entry is None or entry['expires_at'] <= time.time():
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry['payload'], self.__load_user(entry['user'])
+
+    def set(self, token: str, payload: dict, user: User, version: int) -> None:
+        """
+        Cache the decoded token and the user it authenticates.
+        :param token: The JWT token.
+        :param payload: The decoded token payload.
+        :param user: The user the token authenticates.
+        :param version: The user version read before the user loaded (see 'get_user_version'), a user changed while
+                        it loaded has a newer version so the stale user is never returned.
+        """
+        # Don't keep the token after it expires.
+        timeout = min(self.timeout, payload.get('exp', float('inf')) - time.time())
+        if timeout <= 0:
+            return
+
+        entry = {
+            'payload': payload,
+            'user': self.__dump_user(user),
+            'version': version,
+            'expires_at': time.time() + timeout
+        }
+
+        key = self.__get_key(token)
+
+        if self.shared_cache is not None:
+            self.shared_cache.set(key, entry, timeout)
+            return
+
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+
+            # Remove the least recently used tokens.
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def delete(self, token: str) -> None:
+        """
+        Remove the token from the cache.
+        :param token: The JWT token.
+        """
+        key = self.__get_key(token)
+
+        if self.shared_cache is not None:
+            self.shared_cache.delete(key)
+            return
+
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        Invalidate all the cached tokens of the user (called when the user changed or deleted).
+        :param user_id: The user ID.
+        """
+        self.invalidations += 1
+
+        if self.shared_cache is not None:
+            self.shared_cache.set(self.__get_user_version_key(user_id), time.time_ns(), None)
+            return
+
+        with self.__lock:
+            self.__users_versions[user_id] = self.__users_versions.get(user_id, 0) + 1
+
+    def clear(self) -> None:
+        """
+        Remove all the tokens from the process cache and reset the counters.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__users_versions.clear()
+
+        self.hits = self.misses = self.invalidations = 0
+
+    def stats(self) -> dict:
+        """
+        Get the cache counters.
+        :return: The cache hits, misses, invalidations and size.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+            'size': len(self.__entries),
+            'shared': self.shared_cache is not None
+        }
+
+    def __get_entry(self, key: str) -> Optional[dict]:
+        """
+        Get the cache entry if the user didn't change since it cached.
+        :param key: The cache key of the token.
+        :return: The cache entry or None.
+        """
+        if self.shared_cache is not None:
+            entry = self.shared_cache.get(key)
+        else:
+            with self.__lock:
+                entry = self.__entries.get(key)
+                if entry is not None:
+                    self.__entries.move_to_end(key)
+
+        if entry is None or entry['version'] != self.get_user_version(entry['user']['id']):
+            return None  # The user changed after the token cached.
+
+        return entry
+
+    def get_user_version(self, user_id: int) -> int:
+        """
+        Get the version of the user (changed every time the user invalidated), read it before loading the user to cache.
+        :param user_id: The user ID.
+        :return: The user version.
+        """
+        if self.shared_cache is not None:
+            return self.shared_cache.get(self.__get_user_version_key(user_id), 0)
+
+        return self.__users_versions.get(user_id, 0)
+
+    @staticmethod
+    def __get_key(token: str) -> str:
+        """
+        Get the cache key of the token (the token itself is not kept in the cache).
+        :param token: The JWT token.
+        :return: The cache key.
+        """
+        return 'jwt-authentication:token:%s' % hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def __get_user_version_key(user_id: int) -> str:
+        """
+        Get the cache key of the user version.
+        :param user_id: The user ID.
+        :return: The cache key.
+        """
+        return 'jwt-authentication:user:%s' % user_id
+
+    @staticmethod
+    def __dump_user(user: User) -> dict:
+        """
+        Create snapshot of the user fields (without the password).
+        :param user: The user.
+        :return: The user fields values.
+        """
+        return {field.attname: getattr(user, field.attname) for field in User._meta.concrete_fields
+                if field.attname != 'password'}
+
+    @staticmethod
+    def __load_user(snapshot: dict) -> User:
+        """
+        Create user instance from the user snapshot (without accessing the database).
+        :param snapshot: The user fields values.
+        :return: The user (the password is loaded from the database only if it's accessed).
+        """
+        return User.from_db(router.db_for_read(User), list(snapshot), list(snapshot.values()))
+
+
+_token_cache = None  # The cache of the process (created on first use).
+
+
+def get_token_cache() -> TokenCache:
+    """
+    Get the token cache of the process.
+    :return: The token cache.
+    """
+    global _token_cache
+
+    if _token_cache is None:
+        _token_cache = TokenCache.from_settings()
+
+    return _token_cache
+
+
+@register(Tags.caches)
+def check_token_cache(app_configs, **kwargs):
+    """
+    Check that the changed users invalidate their cached tokens in all the processes.
+    """
+    alias = getattr(settings, 'JWT_AUTHENTICATION_CACHE', {}).get('CACHE')
+    if alias is not None:
+        return check_shared_cache('JWT_AUTHENTICATION_CACHE', alias, 'SocialNetwork.E004')
+
+    return [Warning("The tokens of JWT_AUTHENTICATION_CACHE are cached in the process, a changed user (deactivated, "
+                    "deleted) is authenticated by the other processes until the cached tokens expire.",
+                    hint="Set 'CACHE' to a cache that is shared by all the processes, or silence the warning when the "
+                         "site runs in a single process or the 'TIMEOUT' is short enough.",
+                    id='SocialNetwork.W001')]
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_tokens(sender, instance: User, **kwargs):
+    """
+    Invalidate the cached tokens of the user when the user changed or deleted.
+    :param sender: The user model.
+    :param instance: The changed user.
+    """
+    get_token_cache().invalidate_user(instance.pk)
+
+
+@receiver(setting_changed)
+def reset_token_cache(setting: str, **kwargs):
+    """
+    Create the cache again when the cache settings changed (in the tests).
+    :param setting: The name of the changed setting.
+    """
+    global _token_cache
+
+    if setting == 'JWT_AUTHENTICATION_CACHE':
+        _token_cache = None
@@ -0,0 +1,251 @@
+# package: SocialNetwork.auth
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+import uuid
+
+import jwt
+from django.conf import settings
+from django.core.cache import caches
+from django.core.checks import Tags, register
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from SocialNetwork.checks import check_shared_cache
+
+
+class TokenService:
+    """
+    Service that issues, verifies and revokes the JWT tokens of the users (HS256, compatible with PyJWT).
+
+    The HMAC key and the encoded header are prepared once, so signing and verifying a token only hash the token.
+    The token of a user is issued once and returned again on the next logins until it's close to expire.
+    Every token has an ID ('jti') so it can be revoked alone, and all the tokens of a user that issued before a time
+    can be revoked together. The revocations are kept in the database until the tokens expire (see 'RevokedToken'), an
+    evicted revocation would make the token valid again. The issued tokens are kept in a cache that must be shared by all
+    the processes (checked on startup), otherwise another process returns a revoked token on the next login.
+    """
+    DEFAULT_OPTIONS = {
+        'LIFETIME': 60 * 60 * 24 * 60,  # Number of seconds until a token expires.
+        'REFRESH_BEFORE': 60 * 60 * 24,  # Issue a new token when the cached token expires in less seconds than this.
+        'CACHE': 'persistent',  # Alias of the cache to keep the issued tokens (shared by all the processes).
+    }
+    ALGORITHM = 'HS256'
+
+    def __init__(self, secret_key: str, **options) -> None:
+        """
+        Constructor to initialize the service.
+        :param secret_key: The key to sign the tokens.
+        :param options: The service options (see 'DEFAULT_OPTIONS').
+        """
+        self.options = {**self.DEFAULT_OPTIONS, **options}
+        self.cache = caches[self.options['CACHE']]
+
+        self.__hmac = hmac.new(secret_key.encode('utf-8'), digestmod=hashlib.sha256)  # Copied for every token.
+        self.__header = self.__encode_segment({'alg': self.ALGORITHM, 'typ': 'JWT'})
+
+    @classmethod
+    def from_settings(cls) -> 'TokenService':
+        """
+        Create the service from the 'JWT_TOKENS' settings.
+        :return: The token service.
+        """
+        return cls(settings.SECRET_KEY, **getattr(settings, 'JWT_TOKENS', {}))
+
+    def get_token(self, user) -> str:
+        """
+        Get the token of the user, the cached token is returned until it's close to expire.
+        :param user: The user.
+        :return: The JWT token.
+        """
+        key = self.__get_key('user', user.pk)
+        entry = self.cache.get(key)
+
+        if entry is not None and entry['exp'] - time.time() > self.options['REFRESH_BEFORE']:
+            return entry['token']
+
+        now = time.time()
+        payload = {'id': user.pk, 'jti': uuid.uuid4().hex, 'iat': now, 'exp': int(now + self.options['LIFETIME'])}
+        token = self.encode(payload)
+
+        self.cache.set(key, {'token': token, 'jti': payload['jti'], 'exp': payload['exp']},
+                       self.options['LIFETIME'] - self.options['REFRESH_BEFORE'])
+        return token
+
+    def encode(self, payload: dict) -> str:
+        """
+        Sign the payload.
+        :param payload: The token claims.
+        :return: The JWT token.
+        """
+        signing_input = '%s.%s' % (self.__header, self.__encode_segment(payload))
+        return '%s.%s' % (signing_input, self.__b64encode(self.__sign(signing_input)))
+
+    def decode(self, token: str, check_revoked: bool = True) -> dict:
+        """
+        Verify the token and get its claims.
+        :param token: The JWT token.
+        :param check_revoked: If to check that the token isn't revoked.
+        :return: The token claims.
+        :exception: jwt.InvalidTokenError if the token is malformed, the signature is wrong or the token expired or
+                    revoked.
+        """
+        # The token is not trusted until the signature is checked, every part of it is checked before it's used.
+        try:
+            signing_input, signature = token.rsplit('.', 1)
+            header, payload = signing_input.split('.')
+
+            # Tokens issued by this service have the same header, others (PyJWT) are checked.
+            if header != self.__header:
+                header = json.loads(self.__b64decode(header))
+                if not isinstance(header, dict):
+                    raise jwt.DecodeError('Invalid token header.')
+                if header.get('alg') != self.ALGORITHM:
+                    raise jwt.InvalidAlgorithmError('The token algorithm is not allowed.')
+
+            signature = self.__b64decode(signature)
+            payload = json.loads(self.__b64decode(payload))
+            if not isinstance(payload, dict) or 'id' not in payload:
+                raise jwt.DecodeError('Invalid token payload.')
+        except (ValueError, TypeError, RecursionError, binascii.Error) as exception:
+            raise jwt.DecodeError('Invalid token.') from exception
+
+        if not hmac.compare_digest(self.__sign(signing_input), signature):
+            raise jwt.InvalidSignatureError('Signature verification failed.')
+
+        # The times are compared with numbers (JSON booleans are integers in Python but not valid times).
+        for claim in ('exp', 'iat'):
+            if claim in payload and (not isinstance(payload[claim], (int, float)) or isinstance(payload[claim], bool)):
+                raise jwt.DecodeError('The %s claim must be a number.' % claim)
+
+        if 'exp' in payload and payload['exp'] <= time.time():
+            raise jwt.ExpiredSignatureError('Signature has expired.')
+
+        if check_revoked and self.is_revoked(payload):
+            raise jwt.InvalidTokenError('The token is revoked.')
+
+        return payload
+
+    def is_revoked(self, payload: dict) -> bool:
+        """
+        Check if the token is revoked.
+        :param payload: The token claims.
+        :return: If the token or all the tokens of the user that issued before it are revoked.
+        """
+        from SocialNetwork.models import RevokedToken  # The models import the service.
+
+        return RevokedToken.objects.is_revoked(payload['id'], payload.get('jti'), payload.get('iat', 0))
+
+    def revoke(self, token: str) -> None:
+        """
+        Revoke the token (the tokens without ID, issued before the service, revoke all the tokens of the user).
+        :param token: The JWT token.
+        """
+        from SocialNetwork.auth.TokenCache import get_token_cache  # The token cache imports the models.
+        from SocialNetwork.models import RevokedToken
+
+        payload = self.decode(token, check_revoked=False)
+
+        if 'jti' not in payload:
+            self.revoke_user(payload['id'])
+            return
+
+        expires_at = payload.get('exp', time.time() + self.options['LIFETIME'])
+        RevokedToken.objects.revoke_token(payload['id'], payload['jti'], expires_at)
+
+        # Don't return the revoked token on the next login.
+        key = self.__get_key('user', payload['id'])
+        entry = self.cache.get(key)
+        if entry is not None and entry['jti'] == payload['jti']:
+            self.cache.delete(key)
+
+        get_token_cache().delete(token)
+
+    def revoke_user(self, user_id: int) -> None:
+        """
+        Revoke all the tokens of the user that issued until now.
+        :param user_id: The user ID.
+        """
+        from SocialNetwork.auth.TokenCache import get_token_cache  # The token cache imports the models.
+        from SocialNetwork.models import RevokedToken
+
+        RevokedToken.objects.revoke_user(user_id, time.time() + self.options['LIFETIME'])
+        self.cache.delete(self.__get_key('user', user_id))
+        get_token_cache().invalidate_user(user_id)
+
+    def __sign(self, signing_input: str) -> bytes:
+        """
+        Compute the token signature with the prepared key.
+        :param signing_input: The encoded header and payload.
+        :return: The signature.
+        """
+        mac = self.__hmac.copy()
+        mac.update(signing_input.encode('utf-8'))
+        return mac.digest()
+
+    @classmethod
+    def __encode_segment(cls, data: dict) -> str:
+        """
+        Encode a JSON segment of the token.
+        :param data: The segment data.
+        :return: The encoded segment.
+        """
+        return cls.__b64encode(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+
+    @staticmethod
+    def __b64encode(data: bytes) -> str:
+        return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+    @staticmethod
+    def __b64decode(data: str) -> bytes:
+        return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+    @staticmethod
+    def __get_key(kind: str, value) -> str:
+        """
+        Get the cache key.
+        :param kind: The kind of the value ('user').
+        :param value: The user ID.
+        :return: The cache key.
+        """
+        return 'jwt-tokens:%s:%s' % (kind, value)
+
+
+_token_service = None  # The token service of the process (created on first use).
+
+
+def get_token_service() -> TokenService:
+    """
+    Get the token service of the process.
+    :return: The token service.
+    """
+    global _token_service
+
+    if _token_service is None:
+        _token_service = TokenService.from_settings()
+
+    return _token_service
+
+
+@register(Tags.caches)
+def check_token_service_cache(app_configs, **kwargs):
+    """
+    Check that the issued tokens are shared by all the processes.
+    """
+    options = {**TokenService.DEFAULT_OPTIONS, **getattr(settings, 'JWT_TOKENS', {})}
+    return check_shared_cache('JWT_TOKENS', options['CACHE'], 'SocialNetwork.E002')
+
+
+@receiver(setting_changed)
+def reset_token_service(setting: str, **kwargs):
+    """
+    Create the service again when the tokens settings or the secret key changed (in the tests).
+    :param setting: The name of the changed setting.
+    """
+    global _token_service
+
+    if setting in ('JWT_TOKENS', 'SECRET_KEY'):
+        _token_service = None
@@ -0,0 +1,40 @@
+# package: SocialNetwork.auth.backends
+from typing import Optional, Tuple
+
+from asgiref.sync import sync_to_async
+
+from SocialNetwork.auth.TokenCache import get_token_cache
+from SocialNetwork.auth.backends.JWTAuthenticationBackend import JWTAuthenticationBackend
+from SocialNetwork.models import User
+
+
+class AsyncJWTAuthenticationBackend(JWTAuthenticationBackend):
+    """
+    Authentication backend for the async views (see 'AsyncAPIView').
+
+    The tokens that already verified are taken from the token cache in the event loop, only the first request of
+    a token loads the user from the database in a worker thread.
+    """
+
+    async def authenticate_async(self, request) -> Optional[Tuple[User, str]]:
+        """
+        Authenticate the user request.
+        :param request: The authentication request.
+        :return: The user and it's token if the user authenticated otherwise None
+        :exception: AuthenticationFailed if the token is not valid.
+        """
+        token = self.get_token(request)
+        if token is None:
+            return None
+
+        user = self.get_cached_user(token)
+        if user is not None:
+            return (user, token)
+
+        payload = self.decode_token(token)
+        version = get_token_cache().get_user_version(payload['id'])  # Before loading, see 'TokenCache.set'.
+        user = await sync_to_async(self.get_active_user, thread_sensitive=False)(payload)
+
+        get_token_cache().set(token, payload, user, version)  # Cache the verified token for the next requests.
+
+        return (user, token)
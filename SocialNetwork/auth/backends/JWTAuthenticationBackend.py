@@ -2,10 +2,11 @@
 from typing import Tuple, Optional
 
 import jwt
-from django.conf import settings
 from rest_framework import authentication, exceptions
 from rest_framework.request import Request
 
+from SocialNetwork.auth.TokenCache import get_token_cache
+from SocialNetwork.auth.TokenService import get_token_service
 from SocialNetwork.models import User
 
 
@@ -24,6 +25,18 @@ class JWTAuthenticationBackend(authentication.BaseAuthentication):
 
         request.user = None  # Reset the user.
 
+        token = self.get_token(request)
+        if token is None:
+            return None
+
+        return self.__authenticate_user_credentials(token)  # Authenticate the user.
+
+    def get_token(self, request) -> Optional[str]:
+        """
+        Get the JWT token from the authentication header.
+        :param request: The authentication request.
+        :return: The token or None if the request doesn't have valid authentication header.
+        """
         # Get the authentication header name and the JWT that will be used for authentication.
         authentication_header = authentication.get_authorization_header(request).split()
         authentication_header_prefix = self.authentication_header_prefix.lower()
@@ -44,7 +57,7 @@ class JWTAuthenticationBackend(authentication.BaseAuthentication):
         if authentication_prefix.lower() != authentication_header_prefix:
             return None  # Mismatch between the authentication prefix
 
-        return self.__authenticate_user_credentials(authentication_token)  # Authenticate the user.
+        return authentication_token
 
     def __authenticate_user_credentials(self, token: str) -> Tuple[User, str]:
         """
@@ -52,12 +65,63 @@ class JWTAuthenticationBackend(authentication.BaseAuthentication):
         :param token: The request JWT token.
         :return:
         """
+        # Use the user of the token if the token already verified (the cache is invalidated when the user changed).
+        user = self.get_cached_user(token)
+        if user is not None:
+            return (user, token)
+
+        payload = self.decode_token(token)
+        version = get_token_cache().get_user_version(payload['id'])  # Before loading, see 'TokenCache.set'.
+        user = self.get_active_user(payload)
+
+        get_token_cache().set(token, payload, user, version)  # Cache the verified token for the next requests.
+
+        return (user, token) # Return the user with the token.
+
+    @staticmethod
+    def get_cached_user(token: str) -> Optional[User]:
+        """
+        Get the user of the token from the token cache.
+        :param token: The request JWT token.
+        :return: The user or None if the token isn't cached.
+        :exception: AuthenticationFailed if the token revoked (by other process) after it was cached.
+        """
+        token_cache = get_token_cache()
+
+        cached = token_cache.get(token)
+        if cached is None:
+            return None
+
+        payload, user = cached
+        if get_token_service().is_revoked(payload):
+            token_cache.delete(token)
+            msg = 'Invalid authentication. The token is revoked.'
+            raise exceptions.AuthenticationFailed(msg)
+
+        return user
+
+    @staticmethod
+    def decode_token(token: str) -> dict:
+        """
+        Verify and decode the JWT token.
+        :param token: The request JWT token.
+        :return: The token payload.
+        :exception: AuthenticationFailed if the token is not valid.
+        """
         try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256']) # Decode the token.
-        except:
+            return get_token_service().decode(token) # Decode the token.
+        except jwt.InvalidTokenError:
             msg = 'Invalid authentication. Could not decode token.'
             raise exceptions.AuthenticationFailed(msg) # Failure decoding the token.
 
+    @staticmethod
+    def get_active_user(payload: dict) -> User:
+        """
+        Get the user of the token.
+        :param payload: The token payload.
+        :return: The user.
+        :exception: AuthenticationFailed if the user doesn't exist or not active.
+        """
         try:
             user = User.objects.get(pk=payload['id']) # Find user based on his ID.
         except User.DoesNotExist:
@@ -68,4 +132,4 @@ class JWTAuthenticationBackend(authentication.BaseAuthentication):
             msg = 'This user has been deactivated.'
             raise exceptions.AuthenticationFailed(msg) # User not active.
 
-        return (user, token) # Return the user with the token.
+        return user
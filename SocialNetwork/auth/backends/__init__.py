@@ -1 +1,2 @@
 from SocialNetwork.auth.backends.JWTAuthenticationBackend import JWTAuthenticationBackend
+from SocialNetwork.auth.backends.AsyncJWTAuthenticationBackend import AsyncJWTAuthenticationBackend
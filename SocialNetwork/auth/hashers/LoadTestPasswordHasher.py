@@ -0,0 +1,52 @@
+# package: SocialNetwork.auth.hashers
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth.hashers import BasePasswordHasher, mask_hash
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.crypto import constant_time_compare
+from django.utils.translation import gettext_noop as _
+
+
+class LoadTestPasswordHasher(BasePasswordHasher):
+    """
+    Fast hasher (one salted SHA-256) for load tests on local machine, NOT SECURE.
+
+    The signups and logins of the benchmarks are then limited by the site and not by the password hashing.
+    The hasher can be used only when 'ALLOW_LOAD_TEST_HASHER' is set in the 'PASSWORD_HASHING' settings (only the
+    benchmark settings set it), and the hashes are not accepted by the other profiles because they don't list it.
+    """
+    algorithm = 'loadtest_sha256'
+
+    def __init__(self) -> None:
+        """
+        Constructor to initialize the hasher.
+        :exception: ImproperlyConfigured if the load test hasher is not allowed.
+        """
+        if not getattr(settings, 'PASSWORD_HASHING', {}).get('ALLOW_LOAD_TEST_HASHER', False):
+            raise ImproperlyConfigured('The load test password hasher is not secure, it can be used only when '
+                                       "PASSWORD_HASHING['ALLOW_LOAD_TEST_HASHER'] is set (in the benchmark settings).")
+
+    def encode(self, password: str, salt: str) -> str:
+        assert password is not None
+        assert salt and '$' not in salt
+
+        hash = hashlib.sha256((salt + password).encode()).hexdigest()
+        return '%s$%s$%s' % (self.algorithm, salt, hash)
+
+    def verify(self, password: str, encoded: str) -> bool:
+        algorithm, salt, hash = encoded.split('$', 2)
+        assert algorithm == self.algorithm
+
+        return constant_time_compare(encoded, self.encode(password, salt))
+
+    def safe_summary(self, encoded: str) -> dict:
+        algorithm, salt, hash = encoded.split('$', 2)
+        return {
+            _('algorithm'): algorithm,
+            _('salt'): mask_hash(salt, show=2),
+            _('hash'): mask_hash(hash),
+        }
+
+    def harden_runtime(self, password: str, encoded: str) -> None:
+        pass
@@ -0,0 +1,100 @@
+# package: SocialNetwork.auth.hashers
+import base64
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth.hashers import BasePasswordHasher, mask_hash
+from django.utils.crypto import constant_time_compare
+from django.utils.translation import gettext_noop as _
+
+
+class ScryptPasswordHasher(BasePasswordHasher):
+    """
+    Scrypt hasher (memory hard, from the standard library) with the cost taken from the 'SCRYPT' options of the
+    'PASSWORD_HASHING' settings.
+
+    The hashes have the same format as the scrypt hasher of newer Django versions
+    ('scrypt$<work factor>$<salt>$<block size>$<parallelism>$<hash>') so they stay valid after upgrading.
+    The passwords hashed with other costs are hashed again with the current cost when the users log in.
+    """
+    algorithm = 'scrypt'
+
+    DEFAULT_OPTIONS = {
+        'WORK_FACTOR': 2 ** 14,  # CPU and memory cost (power of 2).
+        'BLOCK_SIZE': 8,  # Block size, the memory used is 128 * WORK_FACTOR * BLOCK_SIZE bytes.
+        'PARALLELISM': 1,  # Number of independent computations.
+    }
+    HASH_LENGTH = 64
+
+    @property
+    def options(self) -> dict:
+        return {**self.DEFAULT_OPTIONS, **getattr(settings, 'PASSWORD_HASHING', {}).get('SCRYPT', {})}
+
+    def encode(self, password: str, salt: str, work_factor: int = None, block_size: int = None,
+               parallelism: int = None) -> str:
+        """
+        Hash the password.
+        :param password: The password.
+        :param salt: The salt.
+        :param work_factor: The work factor (the configured one when None).
+        :param block_size: The block size (the configured one when None).
+        :param parallelism: The parallelism (the configured one when None).
+        :return: The encoded hash.
+        """
+        assert password is not None
+        assert salt and '$' not in salt
+
+        options = self.options
+        work_factor = work_factor or options['WORK_FACTOR']
+        block_size = block_size or options['BLOCK_SIZE']
+        parallelism = parallelism or options['PARALLELISM']
+
+        hash = hashlib.scrypt(password.encode(), salt=salt.encode(), n=work_factor, r=block_size, p=parallelism,
+                              maxmem=256 * work_factor * block_size * parallelism, dklen=self.HASH_LENGTH)
+        hash = base64.b64encode(hash).decode('ascii').strip()
+
+        return '%s$%d$%s$%d$%d$%s' % (self.algorithm, work_factor, salt, block_size, parallelism, hash)
+
+    def decode(self, encoded: str) -> dict:
+        """
+        Split the encoded hash.
+        :param encoded: The encoded hash.
+        :return: The hash parts.
+        """
+        algorithm, work_factor, salt, block_size, parallelism, hash = encoded.split('$', 5)
+        assert algorithm == self.algorithm
+
+        return {
+            'algorithm': algorithm,
+            'work_factor': int(work_factor),
+            'salt': salt,
+            'block_size': int(block_size),
+            'parallelism': int(parallelism),
+            'hash': hash,
+        }
+
+    def verify(self, password: str, encoded: str) -> bool:
+        decoded = self.decode(encoded)
+        encoded_2 = self.encode(password, decoded['salt'], decoded['work_factor'], decoded['block_size'],
+                                decoded['parallelism'])
+        return constant_time_compare(encoded, encoded_2)
+
+    def safe_summary(self, encoded: str) -> dict:
+        decoded = self.decode(encoded)
+        return {
+            _('algorithm'): decoded['algorithm'],
+            _('work factor'): decoded['work_factor'],
+            _('block size'): decoded['block_size'],
+            _('parallelism'): decoded['parallelism'],
+            _('salt'): mask_hash(decoded['salt']),
+            _('hash'): mask_hash(decoded['hash']),
+        }
+
+    def must_update(self, encoded: str) -> bool:
+        decoded, options = self.decode(encoded), self.options
+        return (decoded['work_factor'] != options['WORK_FACTOR'] or decoded['block_size'] != options['BLOCK_SIZE']
+                or decoded['parallelism'] != options['PARALLELISM'])
+
+    def harden_runtime(self, password: str, encoded: str) -> None:
+        # The runtime for scrypt is too complicated to implement a sensible hardening algorithm.
+        pass
@@ -0,0 +1,33 @@
+# package: SocialNetwork.auth.hashers
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2 hasher with the cost taken from the 'ARGON2' options of the 'PASSWORD_HASHING' settings.
+
+    The passwords hashed with other costs are hashed again with the current cost when the users log in
+    (see 'must_update'). Requires the argon2-cffi library.
+    """
+    DEFAULT_OPTIONS = {
+        'TIME_COST': 2,  # Number of passes over the memory.
+        'MEMORY_COST': 512,  # Memory used to hash a password (KiB).
+        'PARALLELISM': 2,  # Number of threads used to hash a password.
+    }
+
+    @property
+    def options(self) -> dict:
+        return {**self.DEFAULT_OPTIONS, **getattr(settings, 'PASSWORD_HASHING', {}).get('ARGON2', {})}
+
+    @property
+    def time_cost(self) -> int:
+        return self.options['TIME_COST']
+
+    @property
+    def memory_cost(self) -> int:
+        return self.options['MEMORY_COST']
+
+    @property
+    def parallelism(self) -> int:
+        return self.options['PARALLELISM']
@@ -0,0 +1,3 @@
+from SocialNetwork.auth.hashers.TunedArgon2PasswordHasher import TunedArgon2PasswordHasher
+from SocialNetwork.auth.hashers.ScryptPasswordHasher import ScryptPasswordHasher
+from SocialNetwork.auth.hashers.LoadTestPasswordHasher import LoadTestPasswordHasher
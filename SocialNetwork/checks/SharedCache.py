@@ -0,0 +1,33 @@
+# Package: SocialNetwork.checks
+from django.conf import settings
+from django.core.checks import Error
+
+# The cache backends that keep the values in the process, the other processes (the workers of the server) don't see them.
+PROCESS_CACHE_BACKENDS = {
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+}
+
+
+def check_shared_cache(setting: str, alias: str, check_id: str) -> list:
+    """
+    Check that the cache of the setting is shared by all the processes of the site (used by the system checks of the
+    services that keep their state in the cache, with many workers a state kept in the process is not seen by the other
+    workers).
+
+    The check can be silenced (SILENCED_SYSTEM_CHECKS) when the site runs in a single process.
+    :param setting: The name of the setting that selects the cache.
+    :param alias: The cache alias.
+    :param check_id: The ID of the check.
+    :return: The errors.
+    """
+    if alias not in settings.CACHES:
+        return [Error("The cache '%s' of %s is not in CACHES." % (alias, setting), id=check_id)]
+
+    backend = settings.CACHES[alias]['BACKEND']
+    if backend in PROCESS_CACHE_BACKENDS:
+        return [Error("The cache '%s' of %s keeps the values in the process (%s)." % (alias, setting, backend),
+                      hint='Use a cache that is shared by all the processes (file, database or memcached).',
+                      id=check_id)]
+
+    return []
@@ -0,0 +1 @@
+from SocialNetwork.checks.SharedCache import check_shared_cache
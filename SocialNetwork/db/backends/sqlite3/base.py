@@ -0,0 +1,58 @@
+# package: SocialNetwork.db.backends.sqlite3
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.sqlite3 import base
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    SQLite backend with the 'init_command' and 'transaction_mode' options of newer Django versions.
+
+    'init_command' runs on every new connection (the PRAGMAs: WAL journal, synchronous and busy timeout), and
+    'transaction_mode' = 'IMMEDIATE' takes the write lock when the transaction begins instead of on the first write,
+    so a transaction that reads and then writes waits for the busy timeout instead of failing with "database is
+    locked". When Django is upgraded the engine can be replaced with 'django.db.backends.sqlite3' with the same options.
+    """
+    TRANSACTION_MODES = ('DEFERRED', 'IMMEDIATE', 'EXCLUSIVE')
+
+    def get_connection_params(self) -> dict:
+        """
+        Get the parameters of the connection (without the options of this backend).
+        :return: The arguments of 'sqlite3.connect'.
+        """
+        params = super().get_connection_params()
+        params.pop('init_command', None)
+        params.pop('transaction_mode', None)
+        return params
+
+    def get_new_connection(self, conn_params: dict):
+        """
+        Open connection and run the init commands.
+        :param conn_params: The arguments of 'sqlite3.connect'.
+        :return: The connection.
+        """
+        connection = super().get_new_connection(conn_params)
+
+        for command in self.settings_dict['OPTIONS'].get('init_command', '').split(';'):
+            if command.strip():
+                connection.execute(command)
+
+        return connection
+
+    @property
+    def transaction_mode(self) -> str:
+        """
+        Get the mode of the transactions begin.
+        :return: The transaction mode (None for SQLite default, DEFERRED).
+        :exception: ImproperlyConfigured if the mode is not valid.
+        """
+        mode = self.settings_dict['OPTIONS'].get('transaction_mode')
+        if mode is not None and mode.upper() not in self.TRANSACTION_MODES:
+            raise ImproperlyConfigured('settings.DATABASES["%s"]["OPTIONS"]["transaction_mode"] is improperly '
+                                       'configured, use one of %s.' % (self.alias, ', '.join(self.TRANSACTION_MODES)))
+        return mode and mode.upper()
+
+    def _start_transaction_under_autocommit(self) -> None:
+        """
+        Begin the transaction in the configured mode.
+        """
+        self.cursor().execute('BEGIN %s' % self.transaction_mode if self.transaction_mode else 'BEGIN')
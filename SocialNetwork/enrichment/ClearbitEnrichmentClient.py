@@ -0,0 +1,35 @@
+# Package: SocialNetwork.enrichment
+from typing import Optional
+
+from django.conf import settings
+
+from SocialNetwork.enrichment.EnrichmentClient import EnrichmentClient
+
+
+class ClearbitEnrichmentClient(EnrichmentClient):
+    """
+    Client that retrieve the information of the users from Clearbit Enrichment.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor to initialize the Clearbit API key.
+        """
+        import clearbit  # Imported here so the site can run with other clients without the package.
+
+        clearbit.key = settings.CLEARBIT_API_KEY
+        self.clearbit = clearbit
+
+    def find_person(self, email: str) -> Optional[dict]:
+        """
+        Find the information of the person with the given email.
+        :param email: The person email.
+        :return: The person information or None if the person not found.
+        :exception: If the lookup failed or the person information is not ready yet.
+        """
+        person = self.clearbit.Person.find(email=email, stream=True)
+
+        if person is not None and person.get('pending'):
+            raise Exception('The information of %s is not ready yet.' % email)  # Retry later.
+
+        return person
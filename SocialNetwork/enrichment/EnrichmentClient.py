@@ -0,0 +1,38 @@
+# Package: SocialNetwork.enrichment
+import logging
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class EnrichmentClient:
+    """
+    Base class for the clients that used to retrieve the information of the users by their emails.
+    """
+
+    def find_people(self, emails: Iterable[str]) -> dict[str, Optional[dict]]:
+        """
+        Find the information of the people with the given emails (a failed lookup doesn't fail the other emails).
+        :param emails: The people emails.
+        :return: The information of every person by his email (None if the person not found), the emails that their
+                 lookup failed are missing (their lookup will be retried).
+        :exception: If the lookup of all the emails failed (the lookup will be retried).
+        """
+        people = {}
+
+        for email in emails:
+            try:
+                people[email] = self.find_person(email)
+            except Exception:
+                logger.warning('Failed to find the person of %s.', email, exc_info=True)
+
+        return people
+
+    def find_person(self, email: str) -> Optional[dict]:
+        """
+        Find the information of the person with the given email (in the Clearbit Enrichment person format).
+        :param email: The person email.
+        :return: The person information or None if the person not found.
+        :exception: If the lookup failed (the lookup will be retried).
+        """
+        raise NotImplementedError('Enrichment clients must implement find_person or find_people.')
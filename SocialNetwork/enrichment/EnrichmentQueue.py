@@ -0,0 +1,258 @@
+# Package: SocialNetwork.enrichment
+import heapq
+import logging
+import queue
+import threading
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.db import close_old_connections
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from SocialNetwork.profiling import track
+
+logger = logging.getLogger(__name__)
+
+
+class EnrichmentQueue:
+    """
+    Queue that enrich the users information in background workers (so the sign up doesn't wait for the lookup).
+
+    The workers take the queued users in batches, look up every email once (even if few users queued with it),
+    cache the lookups results and retry only the failed lookups with exponential backoff. The retries wait in the
+    queue until their backoff is over so the workers keep enriching the other users meanwhile.
+    """
+    DEFAULT_OPTIONS = {
+        'CLIENT': 'SocialNetwork.enrichment.ClearbitEnrichmentClient',  # The enrichment client class.
+        'WORKERS': 2,  # Number of background workers (0 to enrich the users when they queued).
+        'BATCH_SIZE': 20,  # Maximum number of users enriched together.
+        'BATCH_WAIT': 0.5,  # Maximum number of seconds to wait for a batch to fill.
+        'CACHE': 'default',  # Alias of the cache to keep the lookups results.
+        'CACHE_TIMEOUT': 60 * 60 * 24,  # Number of seconds to keep the lookups results.
+        'MAX_RETRIES': 3,  # Number of times to retry failed lookups (only with workers).
+        'RETRY_BACKOFF': 1.0,  # Number of seconds to wait before the first retry (doubled every retry).
+    }
+    NOT_FOUND = {}  # Cached result for emails without information.
+
+    def __init__(self, **options) -> None:
+        """
+        Constructor to initialize the queue.
+        :param options: The queue options (see 'DEFAULT_OPTIONS').
+        """
+        self.options = {**self.DEFAULT_OPTIONS, **options}
+        self.client = import_string(self.options['CLIENT'])()
+        self.cache = caches[self.options['CACHE']]
+
+        self.__queue = queue.Queue()
+        self.__retries = []  # Heap of the users to look up again (by the time of the retry).
+        self.__workers = []
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> 'EnrichmentQueue':
+        """
+        Create the queue from the 'ENRICHMENT' settings.
+        :return: The enrichment queue.
+        """
+        return cls(**getattr(settings, 'ENRICHMENT', {}))
+
+    def enqueue(self, user_id: int, email: str) -> None:
+        """
+        Queue the user to be enriched.
+        :param user_id: The user ID.
+        :param email: The user email.
+        """
+        if self.options['WORKERS'] == 0:
+            self.enrich({email: [user_id]})  # Enrich the user now (without retries so the sign up doesn't wait).
+            return
+
+        self.__start_workers()
+        self.__queue.put((user_id, email, 0))
+
+    def join(self) -> None:
+        """
+        Wait until all the queued users are enriched.
+        """
+        self.__queue.join()
+
+    def enrich(self, users_by_email: dict[str, list[int]]) -> list[str]:
+        """
+        Look up the emails and update the users with the information.
+        :param users_by_email: The IDs of the users to enrich by their emails.
+        :return: The emails that their lookup failed (their users are not enriched).
+        """
+        people = self.find_people(users_by_email)
+
+        from SocialNetwork.models import User
+
+        for user in User.objects.filter(pk__in=[pk for pks in users_by_email.values() for pk in pks]):
+            person = people.get(user.email)
+            if person:
+                user.enrich(person)
+
+        return [email for email in users_by_email if email not in people]
+
+    def find_people(self, emails) -> dict[str, Optional[dict]]:
+        """
+        Find the information of the people with the given emails (from the cache or the enrichment client).
+        :param emails: The people emails.
+        :return: The information of every person by his email (None if the person not found), the emails that their
+                 lookup failed are missing.
+        """
+        keys = {email: 'enrichment:person:%s' % email.lower() for email in emails}
+        cached = self.cache.get_many(keys.values())
+        people = {email: cached[key] or None for email, key in keys.items() if key in cached}
+
+        missing = [email for email in keys if email not in people]
+        if not missing:
+            return people
+
+        try:
+            with track('external'):
+                found = self.client.find_people(missing)
+        except Exception:
+            logger.warning('Failed to enrich %s.', ', '.join(missing), exc_info=True)
+            return people  # The lookup of all the emails failed.
+
+        self.cache.set_many({keys[email]: person or self.NOT_FOUND for email, person in found.items()},
+                            self.options['CACHE_TIMEOUT'])
+        return {**people, **found}
+
+    def __start_workers(self) -> None:
+        """
+        Start the background workers if they are not running.
+        """
+        if self.__workers:
+            return
+
+        with self.__lock:
+            while len(self.__workers) < self.options['WORKERS']:
+                worker = threading.Thread(target=self.__work, name='enrichment-%s' % len(self.__workers), daemon=True)
+                worker.start()
+                self.__workers.append(worker)
+
+    def __work(self) -> None:
+        """
+        Background worker that enrich the queued users in batches.
+        """
+        while True:
+            batch = self.__take_batch()
+
+            # Look up every email once even if it queued for few users.
+            users_by_email = {}
+            for user_id, email, _ in batch:
+                users_by_email.setdefault(email, []).append(user_id)
+
+            failed = set()
+            try:
+                failed.update(self.enrich(users_by_email))
+            except Exception:
+                logger.exception('Failed to enrich the users with the emails %s.', ', '.join(users_by_email))
+            finally:
+                close_old_connections()  # The worker is not a request so the connections are not closed for it.
+
+            for user_id, email, attempt in batch:
+                if email in failed and attempt < self.options['MAX_RETRIES']:
+                    self.__retry(user_id, email, attempt + 1)  # Not done until the retry.
+                    continue
+
+                if email in failed:
+                    logger.error('Failed to enrich the user %s after %s attempts.', user_id, attempt + 1)
+                self.__queue.task_done()
+
+    def __retry(self, user_id: int, email: str, attempt: int) -> None:
+        """
+        Look up the user email again after the backoff of the attempt (the user isn't done until then, so 'join' waits
+        for the retries).
+        :param user_id: The user ID.
+        :param email: The user email.
+        :param attempt: The number of the retry.
+        """
+        retry_at = time.monotonic() + self.options['RETRY_BACKOFF'] * 2 ** (attempt - 1)
+
+        with self.__lock:
+            heapq.heappush(self.__retries, (retry_at, user_id, email, attempt))
+
+    def __take_batch(self) -> list[tuple[int, str, int]]:
+        """
+        Wait for queued user (or retry) and take the users queued with him until the batch is full or the wait is over.
+        :return: The queued users IDs, emails and attempts.
+        """
+        batch = self.__take_retries()
+        while not batch:
+            try:
+                batch.append(self.__queue.get(timeout=self.__get_retry_wait()))
+            except queue.Empty:
+                batch = self.__take_retries()
+
+        deadline = time.monotonic() + self.options['BATCH_WAIT']
+
+        while len(batch) < self.options['BATCH_SIZE']:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+
+            try:
+                batch.append(self.__queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def __take_retries(self) -> list[tuple[int, str, int]]:
+        """
+        Take the retries that their backoff is over (up to batch size).
+        :return: The users IDs, emails and attempts.
+        """
+        retries = []
+
+        with self.__lock:
+            while (self.__retries and self.__retries[0][0] <= time.monotonic()
+                   and len(retries) < self.options['BATCH_SIZE']):
+                _, user_id, email, attempt = heapq.heappop(self.__retries)
+                retries.append((user_id, email, attempt))
+
+        return retries
+
+    def __get_retry_wait(self) -> Optional[float]:
+        """
+        Get the number of seconds until the next retry.
+        :return: The number of seconds or None if there are no retries.
+        """
+        with self.__lock:
+            if not self.__retries:
+                return None
+
+            return max(self.__retries[0][0] - time.monotonic(), 0)
+
+
+_enrichment_queue = None  # The queue of the process (created on first use).
+
+
+def get_enrichment_queue() -> EnrichmentQueue:
+    """
+    Get the enrichment queue of the process.
+    :return: The enrichment queue.
+    """
+    global _enrichment_queue
+
+    if _enrichment_queue is None:
+        _enrichment_queue = EnrichmentQueue.from_settings()
+
+    return _enrichment_queue
+
+
+@receiver(setting_changed)
+def reset_enrichment_queue(setting: str, **kwargs):
+    """
+    Create the queue again when the enrichment settings changed (in the tests).
+    :param setting: The name of the changed setting.
+    """
+    global _enrichment_queue
+
+    if setting == 'ENRICHMENT':
+        _enrichment_queue = None
@@ -0,0 +1,51 @@
+# Package: SocialNetwork.enrichment
+from typing import Iterable, Optional
+
+from SocialNetwork.enrichment.EnrichmentClient import EnrichmentClient
+
+
+class FakeEnrichmentClient(EnrichmentClient):
+    """
+    Local client that generate the person information from the email (used in tests and benchmarks).
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor to initialize the lookups counters.
+        """
+        self.lookups = 0  # Number of emails that looked up (to check the batching and the caching).
+        self.batches = 0  # Number of times the people looked up together.
+        self.failures = {}  # Number of times the lookup of every email fails before it succeeds (to test the retries).
+
+    def find_people(self, emails: Iterable[str]) -> dict[str, Optional[dict]]:
+        """
+        Generate the information of the people with the given emails.
+        :param emails: The people emails.
+        :return: The information of every person by his email (without the emails that their lookup failed).
+        """
+        self.batches += 1
+        return super().find_people(emails)
+
+    def find_person(self, email: str) -> Optional[dict]:
+        """
+        Generate the person information from the email.
+        :param email: The person email.
+        :return: The person information.
+        :exception: If the lookup of the email should fail (see 'failures').
+        """
+        self.lookups += 1
+
+        if self.failures.get(email):
+            self.failures[email] -= 1
+            raise Exception('The lookup of %s failed.' % email)
+
+        name = email.split('@')[0]
+
+        return {
+            'name': {'givenName': name.capitalize(), 'familyName': 'Fake'},
+            'bio': 'Fake person for %s.' % email,
+            'geo': {'city': 'Tel Aviv', 'stateCode': 'TA', 'countryCode': 'IL'},
+            'linkedin': {'handle': 'in/%s' % name},
+            'facebook': {'handle': name},
+            'github': {'handle': name},
+        }
@@ -0,0 +1,4 @@
+from SocialNetwork.enrichment.EnrichmentClient import EnrichmentClient
+from SocialNetwork.enrichment.ClearbitEnrichmentClient import ClearbitEnrichmentClient
+from SocialNetwork.enrichment.FakeEnrichmentClient import FakeEnrichmentClient
+from SocialNetwork.enrichment.EnrichmentQueue import EnrichmentQueue, get_enrichment_queue
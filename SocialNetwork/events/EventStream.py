@@ -0,0 +1,202 @@
+# Package: SocialNetwork.events
+import asyncio
+import json
+import time
+from typing import AsyncIterator, Iterator, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import close_old_connections
+from django.dispatch import receiver
+from rest_framework.exceptions import ValidationError
+
+
+class EventStream:
+    """
+    Stream of the posts events (Server-Sent Events) read from the events log.
+
+    Every event has its ID in the log (the offset), a client resumes the stream after the last event it received with
+    the 'Last-Event-ID' header (sent by the browsers when they reconnect) or the 'after' query parameter.
+    The data of the event is the post as it is now (its creator and likes count), so the client can keep the posts
+    without requesting them. After the events that exist when the stream opened, 'caught_up' event is sent.
+    """
+    DEFAULT_OPTIONS = {
+        'POLL_INTERVAL': 0.5,  # Number of seconds between the reads of the new events.
+        'BATCH_SIZE': 500,  # Maximum number of events read together.
+        'HEARTBEAT': 15,  # Number of seconds without events until a comment is sent to keep the connection.
+        'RETRY': 1000,  # Number of milliseconds the client waits before reconnecting.
+    }
+    CONTENT_TYPE = 'text/event-stream'
+    CAUGHT_UP = 'caught_up'
+
+    def __init__(self, **options) -> None:
+        """
+        Constructor to initialize the stream.
+        :param options: The stream options (see 'DEFAULT_OPTIONS').
+        """
+        self.options = {**self.DEFAULT_OPTIONS, **options}
+
+    @classmethod
+    def from_settings(cls) -> 'EventStream':
+        """
+        Create the stream from the 'EVENT_STREAM' settings.
+        :return: The event stream.
+        """
+        return cls(**getattr(settings, 'EVENT_STREAM', {}))
+
+    @staticmethod
+    def get_offset(request) -> int:
+        """
+        Get the ID of the last event the client received.
+        :param request: The stream request.
+        :return: The offset (0 to read from the first event).
+        :exception: ValidationError if the offset is not a number.
+        """
+        offset = request.META.get('HTTP_LAST_EVENT_ID') or request.GET.get('after') or 0
+
+        try:
+            return max(0, int(offset))
+        except ValueError:
+            raise ValidationError({'after': 'The offset should be the ID of an event.'})
+
+    def read(self, offset: int) -> tuple[bytes, int, int]:
+        """
+        Read the events after the offset.
+        :param offset: The ID of the last event the client received.
+        :return: The encoded events, the new offset and the number of events.
+        """
+        from SocialNetwork.models import Event  # The models are loaded after the stream.
+
+        events = (Event.objects.filter(pk__gt=offset).order_by('pk')
+                  .values_list('pk', 'kind', 'post_id', 'post__title', 'post__creator__username', 'post__likes_count',
+                               'user__username')[:self.options['BATCH_SIZE']])
+
+        chunks = []
+        for event_id, kind, post_id, title, creator, likes_count, username in events:
+            data = {'post': post_id, 'creator': creator, 'likes_count': likes_count, 'user': username}
+            if kind == Event.POST_CREATED:
+                data['title'] = title
+
+            chunks.append(self.format(kind, data, event_id))
+            offset = event_id
+
+        return b''.join(chunks), offset, len(chunks)
+
+    def iter_events(self, offset: int) -> Iterator[bytes]:
+        """
+        Stream the events after the offset (runs until the client disconnects).
+        :param offset: The ID of the last event the client received.
+        :return: Iterator of the encoded events.
+        """
+        for chunk, delay in self.__stream(offset):
+            if chunk:
+                yield chunk
+            if delay:
+                time.sleep(delay)
+
+    async def aiter_events(self, offset: int, disconnected: asyncio.Event) -> AsyncIterator[bytes]:
+        """
+        Stream the events after the offset in the event loop (the events are read in worker threads).
+        :param offset: The ID of the last event the client received.
+        :param disconnected: Set when the client disconnects.
+        :return: Async iterator of the encoded events.
+        """
+        stream = self.__stream(offset)
+
+        while not disconnected.is_set():
+            chunk, delay = await sync_to_async(self.__next, thread_sensitive=False)(stream)
+            if chunk:
+                yield chunk
+
+            if delay:
+                try:
+                    await asyncio.wait_for(disconnected.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    @staticmethod
+    def format(kind: str, data: dict, event_id: Optional[int] = None) -> bytes:
+        """
+        Encode an event.
+        :param kind: The event kind.
+        :param data: The event data.
+        :param event_id: The event ID (None for events that are not in the log).
+        :return: The encoded event.
+        """
+        lines = ['event: %s' % kind, 'data: %s' % json.dumps(data, separators=(',', ':'))]
+        if event_id is not None:
+            lines.insert(0, 'id: %s' % event_id)
+
+        return ('\n'.join(lines) + '\n\n').encode('utf-8')
+
+    def __stream(self, offset: int) -> Iterator[tuple[bytes, float]]:
+        """
+        Read the events after the offset again and again.
+        :param offset: The ID of the last event the client received.
+        :return: Iterator of the encoded events and the number of seconds to wait before reading again.
+        """
+        caught_up = False
+        idle_since = time.monotonic()
+
+        yield ('retry: %s\n\n' % self.options['RETRY']).encode('utf-8'), 0
+
+        while True:
+            chunk, offset, count = self.read(offset)
+
+            if count:
+                idle_since = time.monotonic()
+            elif time.monotonic() - idle_since >= self.options['HEARTBEAT']:
+                chunk, idle_since = b': heartbeat\n\n', time.monotonic()  # Comment, ignored by the clients.
+
+            # Read the next batch at once when the batch is full.
+            if count == self.options['BATCH_SIZE']:
+                yield chunk, 0
+                continue
+
+            if not caught_up:
+                chunk += self.format(self.CAUGHT_UP, {'offset': offset})
+                caught_up = True
+
+            yield chunk, self.options['POLL_INTERVAL']
+
+    @staticmethod
+    def __next(stream: Iterator[tuple[bytes, float]]) -> tuple[bytes, float]:
+        """
+        Read the next events in a worker thread (the database connection of the thread is closed when it's too old).
+        :param stream: The events iterator.
+        :return: The encoded events and the number of seconds to wait before reading again.
+        """
+        close_old_connections()
+        try:
+            return next(stream)
+        finally:
+            close_old_connections()
+
+
+_event_stream = None  # The stream of the process (created on first use).
+
+
+def get_event_stream() -> EventStream:
+    """
+    Get the event stream of the process.
+    :return: The event stream.
+    """
+    global _event_stream
+
+    if _event_stream is None:
+        _event_stream = EventStream.from_settings()
+
+    return _event_stream
+
+
+@receiver(setting_changed)
+def reset_event_stream(setting: str, **kwargs):
+    """
+    Create the stream again when the stream settings changed (in the tests).
+    :param setting: The name of the changed setting.
+    """
+    global _event_stream
+
+    if setting == 'EVENT_STREAM':
+        _event_stream = None
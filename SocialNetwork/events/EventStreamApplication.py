@@ -0,0 +1,104 @@
+# Package: SocialNetwork.events
+import asyncio
+import io
+import json
+
+from django.core.handlers.asgi import ASGIRequest
+from django.urls import reverse
+from rest_framework.exceptions import APIException
+
+from SocialNetwork.events.EventStream import get_event_stream
+
+
+class EventStreamApplication:
+    """
+    ASGI application that streams the posts events ('events/') without holding a thread for every client, the other
+    requests are passed to the Django application.
+
+    Django (3.1) sends streaming responses from sync iterators only, so on ASGI server the stream of the events view
+    would block the event loop between the reads. Here the stream waits in the event loop and only the reads of the
+    events run in worker threads.
+    """
+
+    def __init__(self, application) -> None:
+        """
+        Constructor to initialize the application.
+        :param application: The Django ASGI application.
+        """
+        self.application = application
+        self.__path = None  # The path of the events view (resolved on the first request).
+
+    async def __call__(self, scope, receive, send):
+        """
+        Handle the request.
+        :param scope: The connection scope.
+        :param receive: Receive the client messages.
+        :param send: Send messages to the client.
+        """
+        if self.__path is None:
+            self.__path = reverse('events')
+
+        if scope['type'] != 'http' or scope['path'] != self.__path or scope['method'] != 'GET':
+            return await self.application(scope, receive, send)
+
+        await self.__stream(scope, receive, send)
+
+    async def __stream(self, scope, receive, send):
+        """
+        Authenticate the user and stream the events until the client disconnects.
+        :param scope: The connection scope.
+        :param receive: Receive the client messages.
+        :param send: Send messages to the client.
+        """
+        from SocialNetwork.auth.backends import AsyncJWTAuthenticationBackend  # Imports the models.
+
+        request = ASGIRequest(scope, io.BytesIO())
+        stream = get_event_stream()
+
+        try:
+            if await AsyncJWTAuthenticationBackend().authenticate_async(request) is None:
+                return await self.__send_error(send, 403, 'Authentication credentials were not provided.')
+            offset = stream.get_offset(request)
+        except APIException as exception:
+            return await self.__send_error(send, exception.status_code, exception.detail)
+
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [(b'content-type', stream.CONTENT_TYPE.encode()), (b'cache-control', b'no-cache')],
+        })
+
+        disconnected = asyncio.Event()
+        watcher = asyncio.ensure_future(self.__wait_disconnect(receive, disconnected))
+        try:
+            async for chunk in stream.aiter_events(offset, disconnected):
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+            await send({'type': 'http.response.body', 'body': b''})
+        except OSError:
+            pass  # The client disconnected while sending.
+        finally:
+            watcher.cancel()
+
+    @staticmethod
+    async def __wait_disconnect(receive, disconnected: asyncio.Event):
+        """
+        Wait until the client disconnects.
+        :param receive: Receive the client messages.
+        :param disconnected: Set when the client disconnects.
+        """
+        while (await receive())['type'] != 'http.disconnect':
+            pass
+        disconnected.set()
+
+    @staticmethod
+    async def __send_error(send, status: int, detail) -> None:
+        """
+        Send error response (like the API views).
+        :param send: Send messages to the client.
+        :param status: The response status.
+        :param detail: The error details.
+        """
+        body = json.dumps(detail if isinstance(detail, dict) else {'detail': detail}).encode('utf-8')
+        await send({'type': 'http.response.start', 'status': status,
+                    'headers': [(b'content-type', b'application/json')]})
+        await send({'type': 'http.response.body', 'body': body})
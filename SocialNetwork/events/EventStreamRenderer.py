@@ -0,0 +1,17 @@
+# Package: SocialNetwork.events
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Renderer that accepts the requests of the events stream clients ('Accept: text/event-stream'), the events are
+    streamed without rendering so only the errors are rendered (as JSON).
+    """
+    media_type = 'text/event-stream'
+    format = 'event-stream'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        return json.dumps(data).encode(self.charset) if data is not None else b''
@@ -0,0 +1,3 @@
+from SocialNetwork.events.EventStream import EventStream, get_event_stream
+from SocialNetwork.events.EventStreamApplication import EventStreamApplication
+from SocialNetwork.events.EventStreamRenderer import EventStreamRenderer
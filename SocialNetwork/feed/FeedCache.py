@@ -0,0 +1,133 @@
+# Package: SocialNetwork.feed
+import json
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from SocialNetwork.likes import LikedPosts
+from SocialNetwork.models import Post
+from SocialNetwork.profiling import track
+from SocialNetwork.serializers import PostSerializer
+
+
+class FeedCache:
+    """
+    Two layers cache of the rendered posts feed.
+
+    The part of the post that is the same for all the users (id, title, body, creator and likes count) is cached as
+    pre-serialized JSON fragment keyed by the post version (its ID and likes count, so a like creates a new version
+    and the old one is never returned). The part that depends on the user ('is_user_like') is added to the fragments
+    when the response is rendered, so all the users share the fragments and the feed query only loads the posts
+    versions.
+    """
+    DEFAULT_OPTIONS = {
+        'ENABLED': True,  # If the feed is rendered from the cache.
+        'CACHE': 'default',  # Alias of the cache to keep the fragments ('locmem' for tests, shared cache in production).
+        'TIMEOUT': 60 * 10,  # Number of seconds to keep a fragment.
+    }
+    VERSION_FIELDS = ('id', 'likes_count')  # The fields the feed query loads (the version of the post).
+
+    def __init__(self, **options) -> None:
+        """
+        Constructor to initialize the cache.
+        :param options: The cache options (see 'DEFAULT_OPTIONS').
+        """
+        self.options = {**self.DEFAULT_OPTIONS, **options}
+        self.enabled = self.options['ENABLED']
+        self.cache = caches[self.options['CACHE']]
+
+    @classmethod
+    def from_settings(cls) -> 'FeedCache':
+        """
+        Create the cache from the 'FEED_CACHE' settings.
+        :return: The feed cache.
+        """
+        return cls(**getattr(settings, 'FEED_CACHE', {}))
+
+    def render(self, versions: Iterable[dict], liked_posts: LikedPosts) -> str:
+        """
+        Render the posts as JSON list.
+        :param versions: The versions of the posts (dictionaries with the 'VERSION_FIELDS'), in the feed order.
+        :param liked_posts: The posts the logged user liked.
+        :return: The JSON of the posts.
+        """
+        versions = list(versions)
+
+        with track('serializer'):
+            keys = {self.__get_key(version['id'], version['likes_count']): version['id'] for version in versions}
+            fragments = {keys[key]: fragment for key, fragment in self.cache.get_many(keys).items()}
+
+            # Render the posts that aren't cached (the posts that were deleted in the meantime are skipped).
+            missing = [version['id'] for version in versions if version['id'] not in fragments]
+            if missing:
+                fragments.update(self.store(Post.objects.filter(pk__in=missing).select_related('creator')))
+
+            return '[%s]' % ','.join('%s,"is_user_like":%s}' % (fragments[version['id']],
+                                                                 'true' if version['id'] in liked_posts else 'false')
+                                     for version in versions if version['id'] in fragments)
+
+    def store(self, posts: Iterable[Post]) -> dict[int, str]:
+        """
+        Render the posts fragments and cache them (used also to cache the new posts when they created).
+        :param posts: The posts.
+        :return: The fragment of every post by its ID.
+        """
+        fragments, entries = {}, {}
+
+        for data in PostSerializer(posts, many=True).data:
+            data.pop('is_user_like')
+            # The fragment is the post JSON without the closing brace, so the user part can be added to it.
+            fragment = json.dumps(data, ensure_ascii=False, separators=(',', ':'))[:-1]
+            fragments[data['id']] = entries[self.__get_key(data['id'], data['likes_count'])] = fragment
+
+        self.cache.set_many(entries, self.options['TIMEOUT'])
+        return fragments
+
+    def discard(self, post_id: int, likes_count: int) -> None:
+        """
+        Remove the fragment of an old version of the post (the post changed so it will not be used again).
+        :param post_id: The post ID.
+        :param likes_count: The likes count of the old version.
+        """
+        self.cache.delete(self.__get_key(post_id, likes_count))
+
+    @staticmethod
+    def __get_key(post_id: int, likes_count: int) -> str:
+        """
+        Get the cache key of the post fragment.
+        :param post_id: The post ID.
+        :param likes_count: The post likes count.
+        :return: The cache key.
+        """
+        return 'feed-cache:post:%s:%s' % (post_id, likes_count)
+
+
+_feed_cache = None  # The feed cache of the process (created on first use).
+
+
+def get_feed_cache() -> FeedCache:
+    """
+    Get the feed cache of the process.
+    :return: The feed cache.
+    """
+    global _feed_cache
+
+    if _feed_cache is None:
+        _feed_cache = FeedCache.from_settings()
+
+    return _feed_cache
+
+
+@receiver(setting_changed)
+def reset_feed_cache(setting: str, **kwargs):
+    """
+    Create the cache again when the cache settings changed (in the tests).
+    :param setting: The name of the changed setting.
+    """
+    global _feed_cache
+
+    if setting == 'FEED_CACHE':
+        _feed_cache = None
@@ -0,0 +1,87 @@
+# Package: SocialNetwork.feed
+import json
+from itertools import islice
+
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils.encoders import JSONEncoder
+
+from SocialNetwork.serializers import PostSerializer
+
+
+class PostsStream:
+    """
+    Streams large lists of posts as JSON list or as NDJSON (JSON object in every line).
+
+    The posts are read from the database in chunks and every chunk is serialized and sent before the next one is
+    read, so the memory doesn't grow with the number of posts and the client receives the first posts immediately.
+    """
+    QUERY_PARAM = 'stream'  # The query parameter of the stream format.
+    FORMATS = {
+        'json': 'application/json',
+        'ndjson': 'application/x-ndjson',
+    }
+    CHUNK_SIZE = 500  # Number of posts read and serialized together.
+
+    def __init__(self, stream_format: str, chunk_size: int = CHUNK_SIZE) -> None:
+        """
+        Constructor to initialize the stream.
+        :param stream_format: The stream format (see 'FORMATS').
+        :param chunk_size: Number of posts read and serialized together.
+        :exception: ValidationError if the format isn't supported.
+        """
+        if stream_format not in self.FORMATS:
+            raise ValidationError({self.QUERY_PARAM: 'Unknown stream format, the formats are: %s.'
+                                                     % ', '.join(self.FORMATS)})
+
+        self.format = stream_format
+        self.chunk_size = chunk_size
+
+    @classmethod
+    def from_request(cls, request):
+        """
+        Create the stream if the client requested it.
+        :param request: The user request.
+        :return: The stream or None if the client didn't request streaming.
+        """
+        stream_format = request.query_params.get(cls.QUERY_PARAM)
+        return cls(stream_format) if stream_format is not None else None
+
+    def get_response(self, queryset, context: dict) -> StreamingHttpResponse:
+        """
+        Create the response that streams the posts.
+        :param queryset: The posts query set.
+        :param context: The serializer context (the logged user and the posts he liked).
+        :return: The streaming response.
+        """
+        return StreamingHttpResponse(self.__generate(queryset, context), content_type=self.FORMATS[self.format])
+
+    def __generate(self, queryset, context: dict):
+        """
+        Read, serialize and encode the posts chunk after chunk.
+        :param queryset: The posts query set.
+        :param context: The serializer context.
+        :return: Generator of the encoded chunks.
+        """
+        posts = queryset.iterator(chunk_size=self.chunk_size)
+        separator = ''
+
+        if self.format == 'json':
+            yield b'['
+
+        while True:
+            chunk = list(islice(posts, self.chunk_size))
+            if not chunk:
+                break
+
+            lines = [json.dumps(data, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':'))
+                     for data in PostSerializer(chunk, many=True, context=context).data]
+
+            if self.format == 'ndjson':
+                yield ('\n'.join(lines) + '\n').encode()
+            else:
+                yield (separator + ','.join(lines)).encode()
+                separator = ','
+
+        if self.format == 'json':
+            yield b']'
@@ -0,0 +1,2 @@
+from SocialNetwork.feed.FeedCache import FeedCache, get_feed_cache
+from SocialNetwork.feed.PostsStream import PostsStream
@@ -0,0 +1,58 @@
+# Package: SocialNetwork.filters
+
+from rest_framework import exceptions
+from rest_framework.filters import BaseFilterBackend
+
+
+class PostFilterBackend(BaseFilterBackend):
+    """
+    Filter the posts by the request query parameters:
+    * likes_count=<number> - Only posts with the given number of likes.
+    * creator=<username> - Only posts of the given user.
+    * exclude_creator=<username> - Exclude the posts of the given user.
+    * not_liked_by_me=true - Exclude the posts the logged user liked.
+    """
+    true_values = ('1', 'true', 'yes')  # Query parameters values that considered as true.
+
+    def filter_queryset(self, request, queryset, view=None):
+        """
+        Filter the posts by the request query parameters.
+        :param request: The user request.
+        :param queryset: The posts query set.
+        :param view: The view that filter the posts.
+        :return: The filtered posts.
+        """
+        params = request.query_params
+
+        if 'likes_count' in params:
+            queryset = queryset.filter(likes_count=self.__get_number(params, 'likes_count'))
+
+        if 'creator' in params:
+            queryset = queryset.filter(creator__username=params['creator'])
+
+        if 'exclude_creator' in params:
+            queryset = queryset.exclude(creator__username=params['exclude_creator'])
+
+        if params.get('not_liked_by_me', '').lower() in self.true_values:
+            queryset = queryset.exclude(likes=request.user)
+
+        return queryset
+
+    @staticmethod
+    def __get_number(params, name: str) -> int:
+        """
+        Get query parameter that must be a non negative number.
+        :param params: The request query parameters.
+        :param name: The query parameter name.
+        :return: The query parameter value.
+        :exception: If the query parameter value is not a number.
+        """
+        try:
+            value = int(params[name])
+        except ValueError:
+            raise exceptions.ValidationError({name: 'A valid number is required.'})
+
+        if value < 0:
+            raise exceptions.ValidationError({name: 'Ensure this value is greater than or equal to 0.'})
+
+        return value
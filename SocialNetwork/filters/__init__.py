@@ -0,0 +1 @@
+from SocialNetwork.filters.PostFilterBackend import PostFilterBackend
@@ -0,0 +1,69 @@
+# Package: SocialNetwork.likes
+import bisect
+from array import array
+from typing import Iterable
+
+
+class LikedPosts:
+    """
+    Compact set of the IDs of the posts a user liked.
+
+    The IDs are kept sorted in an array of unsigned integers (4 bytes for every like instead of a Python int in a set)
+    and checked with binary search, so users with many likes are still cheap to cache and to check.
+    """
+    TYPECODE = 'I'  # Unsigned int.
+
+    def __init__(self, post_ids: Iterable[int] = ()) -> None:
+        """
+        Constructor to initialize the set.
+        :param post_ids: The IDs of the liked posts.
+        """
+        self.__ids = array(self.TYPECODE, sorted(set(post_ids)))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'LikedPosts':
+        """
+        Load the set from its compact representation.
+        :param data: The bytes created by 'to_bytes'.
+        :return: The liked posts set.
+        """
+        liked_posts = cls()
+        liked_posts.__ids.frombytes(data)
+        return liked_posts
+
+    def to_bytes(self) -> bytes:
+        """
+        Get the compact representation of the set (used to store it in the cache).
+        :return: The sorted IDs as bytes.
+        """
+        return self.__ids.tobytes()
+
+    def add(self, post_ids: Iterable[int]) -> None:
+        """
+        Add posts to the set.
+        :param post_ids: The IDs of the liked posts.
+        """
+        for post_id in post_ids:
+            index = bisect.bisect_left(self.__ids, post_id)
+            if index == len(self.__ids) or self.__ids[index] != post_id:
+                self.__ids.insert(index, post_id)
+
+    def discard(self, post_ids: Iterable[int]) -> None:
+        """
+        Remove posts from the set (if they are in it).
+        :param post_ids: The IDs of the unliked posts.
+        """
+        for post_id in post_ids:
+            index = bisect.bisect_left(self.__ids, post_id)
+            if index < len(self.__ids) and self.__ids[index] == post_id:
+                del self.__ids[index]
+
+    def __contains__(self, post_id: int) -> bool:
+        index = bisect.bisect_left(self.__ids, post_id)
+        return index < len(self.__ids) and self.__ids[index] == post_id
+
+    def __iter__(self):
+        return iter(self.__ids)
+
+    def __len__(self) -> int:
+        return len(self.__ids)
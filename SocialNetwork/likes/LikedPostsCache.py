@@ -0,0 +1,160 @@
+# Package: SocialNetwork.likes
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.checks import Tags, register
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from SocialNetwork.checks import check_shared_cache
+from SocialNetwork.likes.LikedPosts import LikedPosts
+
+
+class LikedPostsCache:
+    """
+    Cache of the posts every user liked, used to mark the posts the user liked without query per post.
+
+    The set of the user is loaded with one query on the first request and kept in a Django cache in its compact form
+    (see 'LikedPosts'). Every user has a version in the cache that the like and unlike paths of the 'Post' model
+    replace after their transaction commits, the set is cached with the version it was loaded in and used only while
+    the version is current. So a set that was loaded before a like committed (or two likes of the same user that
+    commit together) never leave a stale set in the cache, and the writes don't read the cache. The versions must be in
+    a cache shared by all the processes (checked on startup), otherwise the other processes keep using the old set.
+    """
+    DEFAULT_OPTIONS = {
+        'CACHE': 'persistent',  # Alias of the cache to keep the sets (shared by all the processes).
+        'TIMEOUT': 60 * 60,  # Number of seconds to keep the set of a user.
+    }
+
+    def __init__(self, **options) -> None:
+        """
+        Constructor to initialize the cache.
+        :param options: The cache options (see 'DEFAULT_OPTIONS').
+        """
+        self.options = {**self.DEFAULT_OPTIONS, **options}
+        self.cache = caches[self.options['CACHE']]
+
+    @classmethod
+    def from_settings(cls) -> 'LikedPostsCache':
+        """
+        Create the cache from the 'LIKED_POSTS_CACHE' settings.
+        :return: The liked posts cache.
+        """
+        return cls(**getattr(settings, 'LIKED_POSTS_CACHE', {}))
+
+    def get(self, user) -> LikedPosts:
+        """
+        Get the posts the user liked (load them from the database if they aren't cached).
+        :param user: The user.
+        :return: The IDs of the posts the user liked.
+        """
+        if user is None or not user.is_authenticated:
+            return LikedPosts()
+
+        version_key, key = self.__get_version_key(user.pk), self.__get_key(user.pk)
+        entries = self.cache.get_many([version_key, key])
+        version = entries.get(version_key)
+
+        if version is not None and key in entries and entries[key][0] == version:
+            return LikedPosts.from_bytes(entries[key][1])
+
+        # Read the version before the database, if a like commits while the set is loaded the version changes and
+        # the loaded set is not used.
+        if version is None:
+            version = self.__new_version(user.pk, only_missing=True)
+
+        liked_posts = self.__load(user.pk)
+        self.cache.set(key, (version, liked_posts.to_bytes()), self.options['TIMEOUT'])
+        return liked_posts
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Stop using the cached set of the user (called after the likes of the user changed and committed).
+        :param user_id: The user ID.
+        """
+        self.__new_version(user_id)
+
+    def __new_version(self, user_id: int, only_missing: bool = False) -> str:
+        """
+        Set new version to the set of the user.
+        :param user_id: The user ID.
+        :param only_missing: Set the version only if the user has no version (otherwise the current version is used).
+        :return: The current version.
+        """
+        version_key, version = self.__get_version_key(user_id), uuid.uuid4().hex
+
+        # The version doesn't expire (if it's evicted, the new version doesn't match the cached set).
+        if not only_missing:
+            self.cache.set(version_key, version, None)
+        elif not self.cache.add(version_key, version, None):
+            version = self.cache.get(version_key, version)
+
+        return version
+
+    @staticmethod
+    def __load(user_id: int) -> LikedPosts:
+        """
+        Load the posts the user liked from the database.
+        :param user_id: The user ID.
+        :return: The IDs of the posts the user liked.
+        """
+        from SocialNetwork.models import Post  # The models update the cache so they can't be imported before it.
+
+        likes = Post.likes.through.objects.filter(user_id=user_id).order_by('post_id')
+        return LikedPosts(likes.values_list('post_id', flat=True))
+
+    @staticmethod
+    def __get_key(user_id: int) -> str:
+        """
+        Get the cache key of the user set.
+        :param user_id: The user ID.
+        :return: The cache key.
+        """
+        return 'liked-posts:%s' % user_id
+
+    @staticmethod
+    def __get_version_key(user_id: int) -> str:
+        """
+        Get the cache key of the version of the user set.
+        :param user_id: The user ID.
+        :return: The cache key.
+        """
+        return 'liked-posts-version:%s' % user_id
+
+
+_liked_posts_cache = None  # The liked posts cache of the process (created on first use).
+
+
+def get_liked_posts_cache() -> LikedPostsCache:
+    """
+    Get the liked posts cache of the process.
+    :return: The liked posts cache.
+    """
+    global _liked_posts_cache
+
+    if _liked_posts_cache is None:
+        _liked_posts_cache = LikedPostsCache.from_settings()
+
+    return _liked_posts_cache
+
+
+@register(Tags.caches)
+def check_liked_posts_cache(app_configs, **kwargs):
+    """
+    Check that the sets and their versions are shared by all the processes.
+    """
+    options = {**LikedPostsCache.DEFAULT_OPTIONS, **getattr(settings, 'LIKED_POSTS_CACHE', {})}
+    return check_shared_cache('LIKED_POSTS_CACHE', options['CACHE'], 'SocialNetwork.E003')
+
+
+@receiver(setting_changed)
+def reset_liked_posts_cache(setting: str, **kwargs):
+    """
+    Create the cache again when the cache settings changed (in the tests).
+    :param setting: The name of the changed setting.
+    """
+    global _liked_posts_cache
+
+    if setting == 'LIKED_POSTS_CACHE':
+        _liked_posts_cache = None
@@ -0,0 +1,2 @@
+from SocialNetwork.likes.LikedPosts import LikedPosts
+from SocialNetwork.likes.LikedPostsCache import LikedPostsCache, get_liked_posts_cache
@@ -0,0 +1,55 @@
+# Package: SocialNetwork.management.commands
+import time
+
+import jwt
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from SocialNetwork.auth.TokenService import TokenService
+
+
+class Command(BaseCommand):
+    """
+    Command to compare the throughput of encoding and decoding the JWT tokens with PyJWT and with 'TokenService'.
+    """
+    help = 'Measure the encode/decode throughput of the JWT tokens.'
+
+    def add_arguments(self, parser):
+        """
+        Add the command arguments.
+        :param parser: The command arguments parser.
+        """
+        parser.add_argument('--iterations', type=int, default=20000, help='Number of operations in every measure.')
+
+    def handle(self, *args, **options):
+        """
+        Run the command.
+        """
+        iterations = options['iterations']
+        service = TokenService(settings.SECRET_KEY, CACHE='default')
+        key = settings.SECRET_KEY
+
+        now = time.time()
+        payload = {'id': 1, 'jti': '0' * 32, 'iat': now, 'exp': int(now + service.options['LIFETIME'])}
+        token = service.encode(payload)
+
+        class User:
+            pk = 1  # Only the ID of the user is used to issue the token.
+
+        measures = [
+            ('pyjwt encode', lambda: jwt.encode(payload, key, algorithm='HS256')),
+            ('service encode', lambda: service.encode(payload)),
+            ('service get_token (cached)', lambda: service.get_token(User)),
+            ('pyjwt decode', lambda: jwt.decode(token, key, algorithms=['HS256'])),
+            ('service decode', lambda: service.decode(token, check_revoked=False)),
+            ('service decode (revocation)', lambda: service.decode(token)),
+        ]
+
+        for name, function in measures:
+            started_at = time.perf_counter()
+            for _ in range(iterations):
+                function()
+            duration = time.perf_counter() - started_at
+
+            self.stdout.write('%-28s %10.0f ops/s  %7.2f us/op' % (name, iterations / duration,
+                                                                   duration / iterations * 1000000))
@@ -0,0 +1,39 @@
+# Package: SocialNetwork.management.commands
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from SocialNetwork.models import Event
+
+
+class Command(BaseCommand):
+    """
+    Command to compact the posts events log (keep only the last event of every post and the last like or unlike of
+    every user on every post).
+    """
+    help = 'Delete the events that later events of the same post supersede.'
+
+    def add_arguments(self, parser):
+        """
+        Add the command arguments.
+        :param parser: The command arguments parser.
+        """
+        parser.add_argument('--older-than', type=int, default=60 * 60,
+                            help='Delete only events older than this number of seconds (the stream clients that '
+                                 'resume after a recent event still receive every like).')
+        parser.add_argument('--dry-run', action='store_true', help='Only report the number of superseded events.')
+
+    def handle(self, *args, **options):
+        """
+        Run the command.
+        """
+        before = timezone.now() - timedelta(seconds=options['older_than'])
+
+        if options['dry_run']:
+            superseded = Event.objects.superseded().filter(created_at__lt=before).count()
+            self.stdout.write('%s of %s events are superseded.' % (superseded, Event.objects.count()))
+            return
+
+        deleted = Event.objects.compact(before)
+        self.stdout.write(self.style.SUCCESS('Deleted %s events, %s events left.' % (deleted, Event.objects.count())))
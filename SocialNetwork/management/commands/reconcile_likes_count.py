@@ -0,0 +1,33 @@
+# Package: SocialNetwork.management.commands
+
+from django.core.management.base import BaseCommand
+
+from SocialNetwork.models import Post
+
+
+class Command(BaseCommand):
+    """
+    Command to fix the posts likes counter when it drifted from the likes table.
+    """
+    help = 'Recount the likes of the posts that the likes counter is different from the likes table.'
+
+    def add_arguments(self, parser):
+        """
+        Add the command arguments.
+        :param parser: The command arguments parser.
+        """
+        parser.add_argument('--dry-run', action='store_true', help='Only report the drifted posts without fixing them.')
+
+    def handle(self, *args, **options):
+        """
+        Run the command.
+        """
+        if options['dry_run']:
+            drifted = Post.objects.drifted_likes_count()
+            for post in drifted.values('id', 'likes_count', 'actual_likes_count'):
+                self.stdout.write('Post %(id)s has %(likes_count)s likes counted but %(actual_likes_count)s likes.' % post)
+            self.stdout.write('%s posts drifted.' % drifted.count())
+            return
+
+        fixed = Post.objects.reconcile_likes_count()
+        self.stdout.write(self.style.SUCCESS('Fixed the likes counter of %s posts.' % fixed))
@@ -0,0 +1,31 @@
+# Generated by Django 3.1.14 on 2026-10-18 18:50
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_posts_likes(apps, schema_editor):
+    """
+    Initialize the likes counter of the existing posts from the likes table.
+    """
+    Post = apps.get_model('SocialNetwork', 'Post')
+    likes = Post.likes.through.objects.filter(post_id=OuterRef('pk')).order_by().values('post_id')
+    likes_count = likes.annotate(count=Count('*')).values('count')
+    Post.objects.update(likes_count=Coalesce(Subquery(likes_count), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('SocialNetwork', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='likes_count',
+            field=models.PositiveIntegerField(db_index=True, default=0),
+        ),
+        migrations.RunPython(count_posts_likes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 3.1.14 on 2026-10-18 19:33
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('SocialNetwork', '0004_event'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='event',
+            name='post',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='SocialNetwork.post'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['post', 'id'], name='event_post_id_idx'),
+        ),
+    ]
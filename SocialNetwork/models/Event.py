@@ -0,0 +1,118 @@
+# Package: SocialNetwork.models
+
+from datetime import datetime
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.db import connections, models, transaction
+from django.db.models import Exists, OuterRef
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+
+EVENTS_LOG_LOCK = 0x536f6369616c  # The key of the PostgreSQL advisory lock of the events log writers.
+
+
+class EventQuerySet(models.QuerySet):
+    """
+    Query set to record the events of the posts.
+    """
+
+    def record(self, kind: str, user_id: int, post_ids: Iterable[int]) -> None:
+        """
+        Record event for every post (in the transaction of the change so the event is published only if it committed).
+
+        The readers of the log read after the ID of the last event they read, so the events must commit in the order of
+        their IDs (see '__lock_log'). Record the events after the transaction locked the rows it changes.
+        :param kind: The event kind.
+        :param user_id: The user that created or liked the posts.
+        :param post_ids: The IDs of the posts.
+        """
+        events = [self.model(kind=kind, user_id=user_id, post_id=post_id) for post_id in post_ids]
+        if not events:
+            return
+
+        with transaction.atomic(using=self.db):
+            self.__lock_log()
+            self.bulk_create(events)
+
+    def __lock_log(self) -> None:
+        """
+        Lock the log until the transaction ends, so the next transaction takes its event IDs only after this one
+        committed. On PostgreSQL the IDs are taken from a sequence when the rows are inserted and the transactions
+        can commit them out of order, a reader would move after the later ID and never read the earlier event.
+        SQLite transactions lock the database when they begin, so they already commit in the order of their IDs.
+
+        The lock is the last lock of the transaction (the rows are locked before the events are recorded), so it
+        doesn't deadlock with the row locks.
+        """
+        connection = connections[self.db]
+
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT pg_advisory_xact_lock(%s)', [EVENTS_LOG_LOCK])
+
+    def superseded(self):
+        """
+        Get the events that later events replace: the post is read as it is now for every event, so the creation of
+        a post is replaced by any later event of the post, and a like or unlike is replaced by a later like or unlike of
+        the same post by the same user (the last one is kept, the clients build the posts every user liked from them).
+        :return: The superseded events.
+        """
+        later_events = Event.objects.filter(post_id=OuterRef('post_id'), pk__gt=OuterRef('pk'))
+        later_likes = later_events.filter(user_id=OuterRef('user_id'), kind__in=[Event.POST_LIKED, Event.POST_UNLIKED])
+
+        return (self.filter(kind=Event.POST_CREATED).filter(Exists(later_events)) |
+                self.filter(kind__in=[Event.POST_LIKED, Event.POST_UNLIKED]).filter(Exists(later_likes)))
+
+    def compact(self, before: Optional[datetime] = None) -> int:
+        """
+        Delete the superseded events, so the log keeps the last event of every post and the last like or unlike of
+        every user on every post, reading it from the start still returns every post and every like. The clients that
+        read after a deleted event get its post from the later event.
+        :param before: Delete only the events that happened before this time (None to delete all the superseded).
+        :return: The number of deleted events.
+        """
+        events = self.superseded()
+        if before is not None:
+            events = events.filter(created_at__lt=before)
+
+        deleted, _ = events.delete()
+        return deleted
+
+
+class Event(models.Model):
+    """
+    Event of a post (created, liked or unliked), the events are read in the order of their ID (the stream offset).
+    """
+    POST_CREATED = 'post_created'
+    POST_LIKED = 'post_liked'
+    POST_UNLIKED = 'post_unliked'
+    KINDS = [(POST_CREATED, 'Post created'), (POST_LIKED, 'Post liked'), (POST_UNLIKED, 'Post unliked')]
+
+    kind = models.CharField(max_length=16, choices=KINDS)  # What happened to the post.
+    post = models.ForeignKey('SocialNetwork.Post', on_delete=models.CASCADE, related_name='+',
+                             db_index=False)  # The changed post.
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='+')  # Who changed it.
+    created_at = models.DateTimeField(auto_now_add=True)  # When the event happened.
+
+    objects = EventQuerySet.as_manager()
+
+    class Meta:
+        # The events of a post in their order (used to find the superseded events when the log is compacted).
+        indexes = [models.Index(fields=['post', 'id'], name='event_post_id_idx')]
+
+    def __str__(self):
+        return '%s %s by %s' % (self.kind, self.post_id, self.user_id)
+
+
+@receiver(post_save, sender='SocialNetwork.Post')
+def record_post_created(sender, instance, created: bool, **kwargs):
+    """
+    Record the creation of the post (the bulk inserts record it separately).
+    :param sender: The post model.
+    :param instance: The saved post.
+    :param created: If the post is created (False when an existing post saved).
+    """
+    if created:
+        Event.objects.record(Event.POST_CREATED, instance.creator_id, [instance.pk])
@@ -0,0 +1,25 @@
+# Package: SocialNetwork.models
+
+from django.conf import settings
+from django.db import models
+
+
+class Like(models.Model):
+    """
+    Like of a user on a post (the through model of the post likes).
+    """
+    post = models.ForeignKey('SocialNetwork.Post', on_delete=models.CASCADE, db_index=False)  # The liked post.
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, db_index=False)  # The user that liked.
+    created_at = models.DateTimeField(auto_now_add=True)  # When the post liked.
+
+    class Meta:
+        db_table = 'SocialNetwork_post_likes'  # The table of the likes before the model existed.
+
+        # A user likes a post once, the constraint index is used to find the likes of a post.
+        unique_together = [('post', 'user')]
+
+        # The index of the posts a user liked (the liked posts cache and the 'not_liked_by_me' filter).
+        indexes = [models.Index(fields=['user', 'post'], name='like_user_post_idx')]
+
+    def __str__(self):
+        return '%s likes %s' % (self.user_id, self.post_id)
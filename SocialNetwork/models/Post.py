@@ -1,26 +1,212 @@
 # Package: SocialNetwork.models
 
 from django.conf import settings
-from django.db import models
+from django.db import IntegrityError, connections, models, transaction
+from django.db.models import Count, Exists, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from SocialNetwork.likes import get_liked_posts_cache
+from SocialNetwork.models.Event import Event
+from SocialNetwork.versioning import get_feed_versions
+
+
+class PostQuerySet(models.QuerySet):
+    """
+    Query set with the helpers used to render posts without running queries per post.
+    """
+
+    def with_feed_annotations(self, user=None):
+        """
+        Load the creator with the posts and compute the user likes in bulk.
+        :param user: The logged user (used to mark the posts he liked).
+        :return: The annotated query set.
+        """
+        queryset = self.select_related('creator')
+
+        if user is None or not user.is_authenticated:
+            return queryset
+
+        # Check in the same query if the user liked the post.
+        user_likes = Post.likes.through.objects.filter(post_id=OuterRef('pk'), user_id=user.pk)
+        return queryset.annotate(is_liked=Exists(user_likes))
+
+    def lock(self) -> dict[int, int]:
+        """
+        Lock the rows of the posts until the transaction ends (in the order of their IDs, so concurrent transactions
+        don't deadlock), the likes of the posts are read and changed only after it so the changes of the same posts
+        run one after the other. SQLite has no row locks, its transactions lock the database when they begin.
+        :return: The creator ID of every post by the post ID.
+        """
+        return dict(self.select_for_update().order_by('pk').values_list('pk', 'creator_id'))
+
+    def like_all(self, user) -> list[int]:
+        """
+        Add the user like to the posts (except his own posts and the posts he already liked) in one transaction.
+        :param user: The user that like the posts.
+        :return: The IDs of the posts that the like added to.
+        """
+        likes = Post.likes.through.objects
+
+        with transaction.atomic():
+            creators = self.exclude(creator=user).lock()  # The creator of every post.
+            liked_ids = set(likes.filter(user_id=user.pk, post_id__in=creators).values_list('post_id', flat=True))
+            new_ids = sorted(creators.keys() - liked_ids)
+
+            likes.bulk_create([likes.model(post_id=post_id, user_id=user.pk) for post_id in new_ids],
+                              ignore_conflicts=True)
+            Post.objects.filter(pk__in=new_ids).update(likes_count=F('likes_count') + 1)
+            Event.objects.record(Event.POST_LIKED, user.pk, new_ids)
+            transaction.on_commit(lambda: get_liked_posts_cache().invalidate(user.pk))
+            transaction.on_commit(lambda: get_feed_versions().bump(creators[post_id] for post_id in new_ids))
+
+        return new_ids
+
+    def unlike_all(self, user) -> list[int]:
+        """
+        Remove the user like from the posts in one transaction.
+        :param user: The user that unlike the posts.
+        :return: The IDs of the posts that the like removed from.
+        """
+        with transaction.atomic():
+            creators = self.lock()  # The creator of every post.
+            likes = Post.likes.through.objects.filter(user_id=user.pk, post_id__in=creators)
+            liked_ids = sorted(likes.values_list('post_id', flat=True))
+
+            likes.filter(post_id__in=liked_ids).delete()
+            Post.objects.filter(pk__in=liked_ids).update(likes_count=F('likes_count') - 1)
+            Event.objects.record(Event.POST_UNLIKED, user.pk, liked_ids)
+            transaction.on_commit(lambda: get_liked_posts_cache().invalidate(user.pk))
+            transaction.on_commit(lambda: get_feed_versions().bump(creators[post_id] for post_id in liked_ids))
+
+        return liked_ids
+
+    def distinct_creators(self):
+        """
+        Get the usernames of the creators of the posts (without duplicates).
+        :return: Query set of the creators usernames.
+        """
+        return self.order_by().values_list('creator__username', flat=True).distinct()
+
+    def drifted_likes_count(self):
+        """
+        Get the posts that the likes counter don't match the likes table.
+        :return: The drifted posts annotated with the likes table count as 'actual_likes_count'.
+        """
+        return self.annotate(actual_likes_count=self.__count_likes()).exclude(likes_count=F('actual_likes_count'))
+
+    def reconcile_likes_count(self) -> int:
+        """
+        Fix the likes counter of the posts that don't match the likes table.
+        :return: The number of fixed posts.
+        """
+        with transaction.atomic():
+            drifted = self.drifted_likes_count().values('pk')
+            return Post.objects.filter(pk__in=drifted).update(likes_count=self.__count_likes())
+
+    @staticmethod
+    def __count_likes():
+        """
+        Sub query that count the likes of the post in the outer query.
+        :return: Expression of the post number of likes.
+        """
+        likes = Post.likes.through.objects.filter(post_id=OuterRef('pk')).order_by().values('post_id')
+        return Coalesce(Subquery(likes.annotate(count=Count('*')).values('count')), 0)
 
 
 class Post(models.Model):
     title = models.CharField(max_length=150, blank=False, null=False)  # Post title.
     body = models.TextField()  # Post body.
     creator = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='posts')  # Post auther.
-    likes = models.ManyToManyField(settings.AUTH_USER_MODEL)  # Post Likes.
+    likes = models.ManyToManyField(settings.AUTH_USER_MODEL, through='Like')  # Post Likes.
+    created_at = models.DateTimeField(auto_now_add=True)  # When the post created.
+
+    # Number of post likes, kept in the post so reading it will not scan the likes table.
+    # Updated only together with the likes (see 'like' and 'unlike'), use 'reconcile_likes_count' to fix drift.
+    likes_count = models.PositiveIntegerField(default=0)
+
+    # Custom manager for the 'Post' model.
+    objects = PostQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # The posts of a user, newest first.
+            models.Index(fields=['creator', '-created_at'], name='post_creator_created_idx'),
+            # The posts with a number of likes (the posts with no likes), in the feed order.
+            models.Index(fields=['likes_count', 'id'], name='post_likes_count_id_idx'),
+        ]
 
     def __str__(self):
         return '%s(Author: %s)' % (self.title, self.creator.username)
 
-    @property
-    def likes_count(self):
+    def like(self, user) -> bool:
+        """
+        Add the user like to the post and increment the likes counter in the same transaction.
+        :param user: The user that like the post.
+        :return: If the like added (False if the user already liked the post).
+        """
+        with transaction.atomic():
+            self.__lock()
+
+            # Insert first so the transaction takes the write lock before reading, the like that already exists is
+            # rejected by the unique constraint (and only its savepoint is rolled back).
+            try:
+                with transaction.atomic():
+                    Post.likes.through.objects.create(post_id=self.pk, user_id=user.pk)
+            except IntegrityError:
+                return False
+
+            self.__update_likes_count(1)
+            Event.objects.record(Event.POST_LIKED, user.pk, [self.pk])
+            transaction.on_commit(lambda: get_liked_posts_cache().invalidate(user.pk))
+            transaction.on_commit(lambda: get_feed_versions().bump([self.creator_id]))
+
+        return True
+
+    def unlike(self, user) -> bool:
         """
-        Count the post likes
-        :return: The number of post likes
+        Remove the user like from the post and decrement the likes counter in the same transaction.
+        :param user: The user that unlike the post.
+        :return: If the like removed (False if the user didn't like the post).
         """
-        return self.likes.count()
+        with transaction.atomic():
+            self.__lock()
 
+            # Delete first so the transaction takes the write lock before reading.
+            deleted, _ = Post.likes.through.objects.filter(post_id=self.pk, user_id=user.pk).delete()
+            if not deleted:
+                return False
 
+            self.__update_likes_count(-1)
+            Event.objects.record(Event.POST_UNLIKED, user.pk, [self.pk])
+            transaction.on_commit(lambda: get_liked_posts_cache().invalidate(user.pk))
+            transaction.on_commit(lambda: get_feed_versions().bump([self.creator_id]))
 
+        return True
+
+    def toggle_like(self, user) -> bool:
+        """
+        Like the post if the user didn't like it, otherwise unlike it.
+        :param user: The user that like or unlike the post.
+        :return: If the user likes the post after the toggle.
+        """
+        with transaction.atomic():
+            if self.unlike(user):
+                return False
 
+            return self.like(user)
+
+    def __lock(self):
+        """
+        Lock the post row like the batch likes do (see 'PostQuerySet.lock'), so a like of the post and a batch that
+        contains it don't deadlock. Skipped on databases without row locks.
+        """
+        if connections[Post.objects.db].features.has_select_for_update:
+            Post.objects.filter(pk=self.pk).lock()
+
+    def __update_likes_count(self, delta: int):
+        """
+        Update the likes counter in the database (without reading it) and refresh the instance value.
+        :param delta: The change in the number of likes.
+        """
+        Post.objects.filter(pk=self.pk).update(likes_count=F('likes_count') + delta)
+        self.refresh_from_db(fields=['likes_count'])
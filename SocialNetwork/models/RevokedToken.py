@@ -0,0 +1,81 @@
+# Package: SocialNetwork.models
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.db import models
+from django.db.models import Q
+
+
+class RevokedTokenQuerySet(models.QuerySet):
+    """
+    Query set to record and check the revocations of the JWT tokens.
+    """
+
+    def is_revoked(self, user_id: int, jti: Optional[str], issued_at: float) -> bool:
+        """
+        Check if the token is revoked.
+        :param user_id: The user of the token.
+        :param jti: The token ID (None for tokens without ID).
+        :param issued_at: The time the token issued.
+        :return: If the token or all the tokens of the user that issued before it are revoked.
+        """
+        revoked = Q(user_id=user_id, jti=None, revoked_at__gt=issued_at)
+        if jti is not None:
+            revoked |= Q(jti=jti)
+
+        return self.filter(revoked, expires_at__gt=time.time()).exists()
+
+    def revoke_token(self, user_id: int, jti: str, expires_at: float) -> None:
+        """
+        Revoke the token until it expires.
+        :param user_id: The user of the token.
+        :param jti: The token ID.
+        :param expires_at: The time the token expires.
+        """
+        self.prune()
+        self.get_or_create(jti=jti, defaults={'user_id': user_id, 'revoked_at': time.time(), 'expires_at': expires_at})
+
+    def revoke_user(self, user_id: int, expires_at: float) -> None:
+        """
+        Revoke all the tokens of the user that issued until now.
+        :param user_id: The user ID.
+        :param expires_at: The time the last token issued until now expires.
+        """
+        self.prune()
+        self.create(user_id=user_id, revoked_at=time.time(), expires_at=expires_at)
+
+    def prune(self) -> int:
+        """
+        Delete the revocations of the tokens that expired (the expired tokens are rejected anyway).
+        :return: The number of deleted revocations.
+        """
+        deleted, _ = self.filter(expires_at__lte=time.time()).delete()
+        return deleted
+
+
+class RevokedToken(models.Model):
+    """
+    Revocation of a JWT token (by its ID) or of all the tokens of a user that issued before a time.
+
+    The revocations are kept in the database until the tokens expire, a revocation in a cache could be evicted and
+    the revoked token would be valid again.
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='+',
+                             db_index=False)  # The user of the revoked tokens.
+    jti = models.CharField(max_length=64, null=True, unique=True)  # The token ID (None to revoke the user tokens).
+    revoked_at = models.FloatField()  # When revoked (the tokens of the user that issued before it are revoked).
+    expires_at = models.FloatField()  # When the revoked tokens expire (the revocation is deleted after it).
+
+    objects = RevokedTokenQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # The revocations of all the tokens of a user.
+            models.Index(fields=['user', 'revoked_at'], name='revoked_token_user_idx'),
+            # The revocations to prune.
+            models.Index(fields=['expires_at'], name='revoked_token_expires_idx'),
+        ]
+
+    def __str__(self):
+        return '%s of %s' % (self.jti or 'all tokens', self.user_id)
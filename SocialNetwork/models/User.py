@@ -1,16 +1,13 @@
 # Package: SocialNetwork.models
-from datetime import datetime, timedelta, timezone
-
-import clearbit
-import jwt
-from django.conf import settings
 from django.contrib.auth.models import (
     AbstractBaseUser, BaseUserManager, PermissionsMixin
 )
 from django.contrib.auth.validators import UnicodeUsernameValidator
-from django.db import models
+from django.db import models, transaction
 
-clearbit.key = settings.CLEARBIT_API_KEY
+from SocialNetwork.auth.TokenService import get_token_service
+from SocialNetwork.enrichment import get_enrichment_queue
+from SocialNetwork.profiling import track
 
 
 class UserManager(BaseUserManager):
@@ -36,40 +33,33 @@ class UserManager(BaseUserManager):
 
     def __intilize_user(self, user, email, password):
         """
-           Retrieve the information from Clearbit Enrichment and initialize the user with the information and the given data.
+           Initialize the user with the given data and queue him to retrieve the information from Clearbit Enrichment.
            :param user: The user instance.
            :param email: the user email (used to get the information from Clearbit Enrichment).
            :param password: The user password.
         """
-        person = clearbit.Person.find(email=email, stream=True)
-
-        if person is None:
+        with track('password'):
             user.set_password(password)
-            user.save()
-            return
-
-        user.first_name = person['name']['givenName']
-        user.last_name = person['name']['familyName']
-        user.bio = person['bio'] or ''
-        user.location_city = person['geo']['city'] or ''
-        user.location_state_code = person['geo']['stateCode'] or ''
-        user.location_country_code = person['geo']['countryCode'] or ''
-        user.linkedin = person['linkedin']['handle'] or ''
-        user.facebook = person['facebook']['handle'] or ''
-        user.github = person['github']['handle'] or ''
-
-        user.set_password(password)
         user.save()
 
+        # The information is retrieved in the background after the user is saved so the sign up doesn't wait for it.
+        transaction.on_commit(lambda: get_enrichment_queue().enqueue(user.pk, user.email))
+
     def create_superuser(self, username, email, password):
         """
-        Create user based on the given information (super user is the same as regular user).
+        Create user based on the given information (super user is regular user that can access the profiling stats, he
+        is not a staff of the admin site).
         :param username: The user username.
         :param email: The user email.
         :param password: The user password.
         :return: A 'User' instance with the given information.
         """
-        return self.create_user(username, email, password)
+        user = self.create_user(username, email, password)
+
+        user.is_superuser = True
+        user.save(update_fields=['is_superuser'])
+
+        return user
 
 
 class User(AbstractBaseUser, PermissionsMixin):
@@ -144,34 +134,34 @@ class User(AbstractBaseUser, PermissionsMixin):
         """
         return self.first_name
 
-    def _generate_jwt_token(self) -> str:
-        """
-        Generate JSON Web Token (JWT) that contains the user's ID and will expire in 60 Days from the creation.
-        :return: String representing the JSON Web Token containing the user ID.
+    def enrich(self, person: dict) -> None:
         """
+        Update the user with the information retrieved from Clearbit Enrichment.
+        :param person: The person information.
         """
-        Generates a JSON Web Token that stores this user's ID and has an expiry
-        date set to 60 days into the future.
-        """
-
-        expire_date = datetime.now() + timedelta(days=60)
-        token = jwt.encode({
-            'id': self.pk,
-            'exp': expire_date.replace(tzinfo=timezone.utc).timestamp()
-        }, settings.SECRET_KEY, algorithm='HS256')
+        name = person.get('name') or {}
+        geo = person.get('geo') or {}
 
-        if isinstance(token, str):
-            return token
+        self.first_name = name.get('givenName') or ''
+        self.last_name = name.get('familyName') or ''
+        self.bio = person.get('bio') or ''
+        self.location_city = geo.get('city') or ''
+        self.location_state_code = geo.get('stateCode') or ''
+        self.location_country_code = geo.get('countryCode') or ''
+        self.linkedin = (person.get('linkedin') or {}).get('handle') or ''
+        self.facebook = (person.get('facebook') or {}).get('handle') or ''
+        self.github = (person.get('github') or {}).get('handle') or ''
 
-        return token.decode('utf-8')
+        self.save(update_fields=['first_name', 'last_name', 'bio', 'location_city', 'location_state_code',
+                                 'location_country_code', 'linkedin', 'facebook', 'github'])
 
     @property
     def token(self):
         """
-        Return the user's token
+        Return the user's token (issued once and reused until it's close to expire, see 'TokenService').
         :return: The user's token.
         """
-        return self._generate_jwt_token()
+        return get_token_service().get_token(self)
 
     def create_post(self, title, body):
         self.posts.create(title=title, body=body)
@@ -1,2 +1,5 @@
 from SocialNetwork.models.Post import Post
 from SocialNetwork.models.User import User
+from SocialNetwork.models.Like import Like
+from SocialNetwork.models.Event import Event
+from SocialNetwork.models.RevokedToken import RevokedToken
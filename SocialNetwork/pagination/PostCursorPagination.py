@@ -0,0 +1,47 @@
+# Package: SocialNetwork.pagination
+import json
+
+from rest_framework.pagination import CursorPagination
+
+
+class PostCursorPagination(CursorPagination):
+    """
+    Keyset (cursor) pagination for the posts feed.
+
+    The feed mode is used only when the client asks for it (by sending a cursor or a page size),
+    otherwise all the posts are returned as before so existing clients (like the bot) keep working.
+    """
+    ordering = '-id'  # Newest posts first, the primary key is unique so the cursor is stable.
+    page_size = 50  # Default number of posts in a page.
+    page_size_query_param = 'page_size'  # Allow the client to choose the page size.
+    max_page_size = 500  # Maximum number of posts in a page.
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Paginate the posts if the client requested the feed mode.
+        :param queryset: The posts query set.
+        :param request: The user request.
+        :param view: The view that paginate the posts.
+        :return: The posts of the page or None if the client didn't request the feed mode.
+        """
+        if not self.is_feed_requested(request):
+            return None
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def is_feed_requested(self, request) -> bool:
+        """
+        Check if the client requested the feed mode.
+        :param request: The user request.
+        :return: If the request contains a cursor or a page size.
+        """
+        return self.cursor_query_param in request.query_params or self.page_size_query_param in request.query_params
+
+    def get_paginated_json(self, results: str) -> str:
+        """
+        Create the page JSON from posts that already rendered (see 'FeedCache').
+        :param results: The JSON of the page posts.
+        :return: The page JSON with the next and previous links.
+        """
+        return '{"next":%s,"previous":%s,"results":%s}' % (json.dumps(self.get_next_link()),
+                                                             json.dumps(self.get_previous_link()), results)
@@ -0,0 +1 @@
+from SocialNetwork.pagination.PostCursorPagination import PostCursorPagination
@@ -0,0 +1,19 @@
+# Package: SocialNetwork.profiling
+
+from SocialNetwork.profiling.RequestProfile import track
+
+
+class ProfiledSerializerMixin:
+    """
+    Mixin for serializers to add the time of the serialization to the request profile (the queries that run while
+    serializing, like loading the posts of a query set, are included).
+    """
+
+    @property
+    def data(self):
+        """
+        Serialize the data and track the serialization time.
+        :return: The serialized data.
+        """
+        with track('serializer'):
+            return super().data
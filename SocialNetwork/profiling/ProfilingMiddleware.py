@@ -0,0 +1,122 @@
+# Package: SocialNetwork.profiling
+import asyncio
+import logging
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from SocialNetwork.profiling.ProfilingStats import get_profiling_stats
+from SocialNetwork.profiling.RequestProfile import RequestProfile, install_query_recorder
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilingMiddleware:
+    """
+    Middleware that profile every request: the number of SQL queries, the database time, the serializers time, the
+    external services time and the total time.
+
+    The profile is sent in the 'Server-Timing' header of the response, added to the stats of the process (see the
+    profiling stats view) and logged. The middleware is used only when profiling is enabled in the settings.
+    """
+    DEFAULT_OPTIONS = {
+        'ENABLED': False,  # If the requests are profiled.
+        'HEADER': True,  # If to send the profile in the 'Server-Timing' header.
+        'STATS': True,  # If to aggregate the profiles in the process stats.
+        'LOG': False,  # If to log the profile of every request.
+    }
+
+    # The middleware is first in the chain, if it was sync only Django would adapt all the chain to sync on ASGI and
+    # the async views would run through 'async_to_sync' instead of in the event loop.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        """
+        Constructor to initialize the middleware.
+        :param get_response: The next handler of the request.
+        """
+        self.options = {**self.DEFAULT_OPTIONS, **getattr(settings, 'PROFILING', {})}
+
+        if not self.options['ENABLED']:
+            raise MiddlewareNotUsed('Profiling is disabled.')
+
+        self.get_response = get_response
+
+        if asyncio.iscoroutinefunction(get_response):
+            self._is_coroutine = asyncio.coroutines._is_coroutine  # Mark the middleware as async (like Django does).
+
+        # Record the queries of all the databases connections (including the connections that open later).
+        connection_created.connect(install_query_recorder, dispatch_uid='profiling_query_recorder')
+        for connection in connections.all():
+            install_query_recorder(connection)
+
+    def __call__(self, request):
+        """
+        Handle the request and profile it.
+        :param request: The request.
+        :return: The response with the 'Server-Timing' header.
+        """
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__call_async(request)
+
+        profile = RequestProfile()
+        token = profile.activate()
+
+        try:
+            response = self.get_response(request)
+        finally:
+            profile.finish()
+            RequestProfile.deactivate(token)
+
+        return self.__process_response(request, response, profile)
+
+    async def __call_async(self, request):
+        """
+        Handle the request of the async handler and profile it.
+        :param request: The request.
+        :return: The response with the 'Server-Timing' header.
+        """
+        profile = RequestProfile()
+        token = profile.activate()
+
+        try:
+            response = await self.get_response(request)
+        finally:
+            profile.finish()
+            RequestProfile.deactivate(token)
+
+        return self.__process_response(request, response, profile)
+
+    def __process_response(self, request, response, profile: RequestProfile):
+        """
+        Add the profile to the response, the stats and the log.
+        :param request: The request.
+        :param response: The response.
+        :param profile: The request profile.
+        :return: The response.
+        """
+        endpoint = self.__get_endpoint(request)
+
+        if self.options['HEADER']:
+            response['Server-Timing'] = profile.to_server_timing()
+
+        if self.options['STATS']:
+            get_profiling_stats().record(endpoint, profile)
+
+        if self.options['LOG']:
+            logger.info('%s %s %s', endpoint, response.status_code, profile.to_dict())
+
+        return response
+
+    @staticmethod
+    def __get_endpoint(request) -> str:
+        """
+        Get the endpoint of the request (the posts of different users are the same endpoint).
+        :param request: The request.
+        :return: The method and the route of the request.
+        """
+        match = getattr(request, 'resolver_match', None)
+        return '%s %s' % (request.method, match.route if match else request.path)
@@ -0,0 +1,66 @@
+# Package: SocialNetwork.profiling
+import threading
+
+from SocialNetwork.profiling.RequestProfile import RequestProfile
+
+
+class ProfilingStats:
+    """
+    Aggregated profiles of the requests of the process by endpoint (method and URL route).
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor to initialize the stats.
+        """
+        self.__endpoints = {}  # The sum and the maximum of every metric by endpoint.
+        self.__lock = threading.Lock()
+
+    def record(self, endpoint: str, profile: RequestProfile) -> None:
+        """
+        Add the profile of a request to the stats.
+        :param endpoint: The endpoint of the request.
+        :param profile: The request profile.
+        """
+        metrics = profile.to_dict()
+
+        with self.__lock:
+            stats = self.__endpoints.setdefault(endpoint, {'count': 0, 'total': {}, 'max': {}})
+            stats['count'] += 1
+
+            for metric, value in metrics.items():
+                stats['total'][metric] = stats['total'].get(metric, 0) + value
+                stats['max'][metric] = max(stats['max'].get(metric, 0), value)
+
+    def summary(self) -> dict:
+        """
+        Summarize the stats.
+        :return: The number of requests and the mean and maximum of every metric by endpoint (times in milliseconds).
+        """
+        with self.__lock:
+            return {
+                endpoint: {
+                    'count': stats['count'],
+                    'mean': {metric: value / stats['count'] for metric, value in stats['total'].items()},
+                    'max': dict(stats['max']),
+                }
+                for endpoint, stats in sorted(self.__endpoints.items())
+            }
+
+    def clear(self) -> None:
+        """
+        Remove all the stats.
+        """
+        with self.__lock:
+            self.__endpoints.clear()
+
+
+_profiling_stats = ProfilingStats()  # The stats of the process.
+
+
+def get_profiling_stats() -> ProfilingStats:
+    """
+    Get the profiling stats of the process.
+    :return: The profiling stats.
+    """
+    return _profiling_stats
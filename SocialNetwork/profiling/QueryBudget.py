@@ -0,0 +1,25 @@
+# Package: SocialNetwork.profiling
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+@contextmanager
+def query_budget(max_queries: int, using: str = DEFAULT_DB_ALIAS):
+    """
+    Fail when the code in the block runs more queries than its budget (used in the tests of the views).
+
+    with query_budget(2):
+        client.get('/posts/')
+
+    :param max_queries: The maximum number of queries the block can run.
+    :param using: Alias of the database to count its queries.
+    :exception: AssertionError if the block ran too many queries.
+    """
+    with CaptureQueriesContext(connections[using]) as context:
+        yield context
+
+    if len(context) > max_queries:
+        queries = '\n'.join('%s. %s' % (index, query['sql']) for index, query in enumerate(context.captured_queries, 1))
+        raise AssertionError('%s queries executed, the budget is %s:\n%s' % (len(context), max_queries, queries))
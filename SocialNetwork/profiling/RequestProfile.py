@@ -0,0 +1,143 @@
+# Package: SocialNetwork.profiling
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+_current_profile = ContextVar('current_profile', default=None)  # The profile of the request that handled now.
+
+
+class RequestProfile:
+    """
+    The costs of one request: the SQL queries, the time spent in the database and the time of the tracked sections
+    (like the serializers and the calls to external services).
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor to initialize the profile.
+        """
+        self.started_at = time.perf_counter()
+        self.wall_time = 0.0  # Seconds.
+        self.query_count = 0
+        self.db_time = 0.0  # Seconds.
+        self.sections = {}  # The time (seconds) of every tracked section.
+        self.__depths = {}  # How deep every section is tracked now (nested sections are counted once).
+
+    def activate(self):
+        """
+        Set the profile as the profile of the current request.
+        :return: Token to deactivate the profile.
+        """
+        return _current_profile.set(self)
+
+    @staticmethod
+    def deactivate(token) -> None:
+        """
+        Restore the profile that was active before the profile activated.
+        :param token: The token received when the profile activated.
+        """
+        _current_profile.reset(token)
+
+    def finish(self) -> None:
+        """
+        Stop measuring the request time.
+        """
+        self.wall_time = time.perf_counter() - self.started_at
+
+    def record_query(self, execute, sql, params, many, context):
+        """
+        Database execute wrapper that count the queries and their time.
+        """
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.query_count += 1
+            self.db_time += time.perf_counter() - started_at
+
+    @contextmanager
+    def track_section(self, section: str):
+        """
+        Measure the time of a section of the request.
+        :param section: The section name.
+        """
+        depth = self.__depths.get(section, 0)
+        self.__depths[section] = depth + 1
+        started_at = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.__depths[section] = depth
+            if depth == 0:
+                self.sections[section] = self.sections.get(section, 0.0) + time.perf_counter() - started_at
+
+    def to_dict(self) -> dict:
+        """
+        Get the profile metrics.
+        :return: The number of queries and the times in milliseconds.
+        """
+        return {
+            'queries': self.query_count,
+            'db': self.db_time * 1000,
+            **{section: duration * 1000 for section, duration in self.sections.items()},
+            'total': self.wall_time * 1000,
+        }
+
+    def to_server_timing(self) -> str:
+        """
+        Format the profile as 'Server-Timing' header.
+        :return: The header value.
+        """
+        metrics = ['db;dur=%.2f;desc="%s queries"' % (self.db_time * 1000, self.query_count)]
+        metrics += ['%s;dur=%.2f' % (section, duration * 1000) for section, duration in self.sections.items()]
+        metrics.append('total;dur=%.2f' % (self.wall_time * 1000))
+        return ', '.join(metrics)
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper that records the query in the profile of the current request (installed on all the
+    connections, see 'install_query_recorder', the current profile is passed also to the worker threads of the
+    async views).
+    """
+    profile = get_current_profile()
+
+    if profile is None:
+        return execute(sql, params, many, context)
+
+    return profile.record_query(execute, sql, params, many, context)
+
+
+def install_query_recorder(connection, **kwargs) -> None:
+    """
+    Record the queries of the connection in the request profiles (used as 'connection_created' receiver).
+    :param connection: The database connection.
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def get_current_profile() -> Optional[RequestProfile]:
+    """
+    Get the profile of the request that handled now.
+    :return: The request profile or None if the request is not profiled.
+    """
+    return _current_profile.get()
+
+
+@contextmanager
+def track(section: str):
+    """
+    Measure the time of a section of the current request (does nothing when the request is not profiled).
+    :param section: The section name ('serializer', 'external', ...).
+    """
+    profile = get_current_profile()
+
+    if profile is None:
+        yield
+        return
+
+    with profile.track_section(section):
+        yield
@@ -0,0 +1,5 @@
+from SocialNetwork.profiling.RequestProfile import RequestProfile, get_current_profile, install_query_recorder, track
+from SocialNetwork.profiling.ProfilingStats import ProfilingStats, get_profiling_stats
+from SocialNetwork.profiling.ProfiledSerializerMixin import ProfiledSerializerMixin
+from SocialNetwork.profiling.ProfilingMiddleware import ProfilingMiddleware
+from SocialNetwork.profiling.QueryBudget import query_budget
@@ -4,9 +4,10 @@ from django.contrib.auth import authenticate
 from rest_framework import serializers
 
 from SocialNetwork.models import User
+from SocialNetwork.profiling import ProfiledSerializerMixin, track
 
 
-class LoginSerializer(serializers.Serializer):
+class LoginSerializer(ProfiledSerializerMixin, serializers.Serializer):
     """
     Used to serialize and deserialize login requests.
     """
@@ -28,7 +29,9 @@ class LoginSerializer(serializers.Serializer):
         email = data.get('email', None)
         password = data.get('password', None)
 
-        user = authenticate(username=email, password=password)
+        # The password is hashed again when the hashing profile or its cost changed (see 'PASSWORD_HASHING').
+        with track('password'):
+            user = authenticate(username=email, password=password)
 
         self.__authenticate_user(user)
 
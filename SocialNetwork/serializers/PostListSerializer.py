@@ -0,0 +1,56 @@
+# Package: SocialNetwork.serializers
+
+from django.db import transaction
+from rest_framework import serializers
+
+from SocialNetwork.models import Event
+from SocialNetwork.profiling import ProfiledSerializerMixin
+from SocialNetwork.versioning import get_feed_versions
+
+
+class PostListSerializer(ProfiledSerializerMixin, serializers.ListSerializer):
+    """
+    Used to serialize list of posts and to create many posts together.
+    """
+    batch_size = 500  # Maximum number of posts inserted in one query.
+
+    def create(self, validated_data: list[dict]) -> list:
+        """
+        Create all the posts in one transaction with bulk inserts.
+        :param validated_data: The posts data after verification.
+        :return: The new posts.
+        """
+        model = self.child.Meta.model
+        posts = [model(**attrs) for attrs in validated_data]
+
+        with transaction.atomic():
+            # The bulk inserts don't send the save signals so mark the feeds of the creators as changed here.
+            transaction.on_commit(lambda: get_feed_versions().bump(post.creator_id for post in posts))
+
+            last_id = model.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+            posts = model.objects.bulk_create(posts, batch_size=self.batch_size)
+            self.__record_created(model, posts, last_id)
+
+            return posts
+
+    @staticmethod
+    def __record_created(model, posts: list, last_id: int) -> None:
+        """
+        Record the events of the created posts.
+        :param model: The post model.
+        :param posts: The created posts.
+        :param last_id: The ID of the last post before the posts created.
+        """
+        # SQLite doesn't return the IDs of bulk inserts, the new posts are the posts after the last post before the
+        # inserts (the transaction holds the write lock).
+        if all(post.pk is not None for post in posts):
+            created = [(post.pk, post.creator_id) for post in posts]
+        else:
+            created = model.objects.filter(pk__gt=last_id).order_by('pk').values_list('pk', 'creator_id')
+
+        posts_by_creator = {}
+        for post_id, creator_id in created:
+            posts_by_creator.setdefault(creator_id, []).append(post_id)
+
+        for creator_id, post_ids in posts_by_creator.items():
+            Event.objects.record(Event.POST_CREATED, creator_id, post_ids)
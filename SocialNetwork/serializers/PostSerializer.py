@@ -3,9 +3,11 @@
 from rest_framework import serializers
 
 from SocialNetwork.models import Post
+from SocialNetwork.profiling import ProfiledSerializerMixin
+from SocialNetwork.serializers.PostListSerializer import PostListSerializer
 
 
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(ProfiledSerializerMixin, serializers.ModelSerializer):
 
     # The serialized post fields
     creator = serializers.SlugRelatedField(read_only=True, slug_field='username')
@@ -22,9 +24,21 @@ class PostSerializer(serializers.ModelSerializer):
 
         if not user:
             return False  # Sometimes this method called when the serializer deserialize the data (in post requests) so a giving dummy value because it's not needed.
+
+        # Check in the posts the user liked that loaded once for the request (see 'LikedPostsCache').
+        liked_posts = self.context.get('liked_posts')
+        if liked_posts is not None:
+            return obj.pk in liked_posts
+
+        # Use the value that computed in bulk when the post loaded (see 'PostQuerySet.with_feed_annotations').
+        is_liked = getattr(obj, 'is_liked', None)
+        if is_liked is not None:
+            return is_liked
+
         return obj.likes.filter(pk=user.pk).exists()
 
     class Meta:
         model = Post
         fields = ['id', 'title', 'body', 'creator', 'likes_count', 'is_user_like']
+        list_serializer_class = PostListSerializer  # Create many posts with bulk inserts.
 
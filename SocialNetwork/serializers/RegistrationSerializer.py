@@ -1,12 +1,12 @@
 # Package: SocialNetwork.serializers
 
-from pyhunter import PyHunter
 from rest_framework import serializers
 
-from PythonTask import settings
+from SocialNetwork.profiling import ProfiledSerializerMixin
+from SocialNetwork.verification import get_email_verifier
 from ..models import User
 
-class RegistrationSerializer(serializers.ModelSerializer):
+class RegistrationSerializer(ProfiledSerializerMixin, serializers.ModelSerializer):
     """
     Used to serialize and deserialize registration requests for new users.
     """
@@ -36,10 +36,12 @@ class RegistrationSerializer(serializers.ModelSerializer):
         if email is None:
             raise serializers.ValidationError('Users must have an email address.')
 
-        # Verify email using hunter.io
-        hunter = PyHunter(settings.HUNTER_API_KEY)
-        result = hunter.email_verifier(email)
-        if result['status'] == 'invalid':
+        # Check that the email is not used before the external verification so duplicate emails are rejected for free.
+        if User.objects.filter(email__iexact=User.objects.normalize_email(email)).exists():
+            raise serializers.ValidationError('user with this email already exists.')
+
+        # Verify email using hunter.io (the verdicts are cached, see 'EmailVerifier').
+        if not get_email_verifier().is_valid(email):
             raise serializers.ValidationError('Users must have an valid email address.')
 
         return email
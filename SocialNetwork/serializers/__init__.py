@@ -1,3 +1,4 @@
 from SocialNetwork.serializers.RegistrationSerializer import RegistrationSerializer
 from SocialNetwork.serializers.LoginSerializer import LoginSerializer
 from SocialNetwork.serializers.PostSerializer import PostSerializer
+from SocialNetwork.serializers.PostListSerializer import PostListSerializer
@@ -1,3 +1,956 @@
-from django.test import TestCase
+# Package: SocialNetwork
+import base64
+import json
+import random
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from unittest import mock, skipUnless
 
-# Create your tests here.
+import jwt
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.cache import caches
+from django.core.checks import run_checks
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection, connections, transaction
+from django.test import AsyncClient, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from SocialNetwork.auth.TokenCache import TokenCache, get_token_cache
+from SocialNetwork.auth.TokenService import TokenService
+from SocialNetwork.auth.hashers import LoadTestPasswordHasher, ScryptPasswordHasher, TunedArgon2PasswordHasher
+from SocialNetwork.enrichment import EnrichmentQueue
+from SocialNetwork.likes import LikedPostsCache, get_liked_posts_cache
+from SocialNetwork.models import Event, Like, Post, RevokedToken, User
+from SocialNetwork.profiling import ProfilingMiddleware, query_budget
+from SocialNetwork.verification import EmailVerifier
+from SocialNetwork.views import LikesBatchView, PostDetailView, PostsView
+
+# The external services are replaced with the local fakes, the caches are in the process (so nothing is kept between
+# the runs) and the passwords are hashed fast in the tests.
+TEST_SETTINGS = {
+    'CACHES': {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'default'},
+        'persistent': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'persistent'},
+    },
+    'ENRICHMENT': {'CLIENT': 'SocialNetwork.enrichment.FakeEnrichmentClient', 'WORKERS': 0},
+    'EMAIL_VERIFICATION': {'CLIENT': 'SocialNetwork.verification.FakeEmailVerificationClient', 'CACHE': 'default'},
+    'PASSWORD_HASHERS': ['django.contrib.auth.hashers.MD5PasswordHasher'],
+}
+
+
+def clear_caches() -> None:
+    """
+    Clear the caches of the tests (the liked posts, the feed fragments and the feed versions).
+    """
+    for alias in TEST_SETTINGS['CACHES']:
+        caches[alias].clear()
+
+
+def create_users(count: int, prefix: str = 'user') -> list:
+    """
+    Create users for the tests.
+    :param count: The number of users.
+    :param prefix: The prefix of the users usernames and emails.
+    :return: The users.
+    """
+    return [User.objects.create_user('%s%s' % (prefix, index), '%s%s@example.com' % (prefix, index), 'password123')
+            for index in range(count)]
+
+
+def create_posts(users: list, count: int) -> list:
+    """
+    Create posts of the users (every second post is liked by the next user).
+    :param users: The creators of the posts.
+    :param count: The number of posts.
+    :return: The posts.
+    """
+    posts = []
+
+    for index in range(count):
+        post = Post.objects.create(title='title %s' % index, body='body', creator=users[index % len(users)])
+        if index % 2:
+            post.like(users[(index + 1) % len(users)])
+        posts.append(post)
+
+    return posts
+
+
+def call_view(view, method: str, path: str, user, data=None, **kwargs):
+    """
+    Call the view with request of the user on the connection of the calling thread (used from many threads).
+    :param view: The view function.
+    :param method: The HTTP method.
+    :param path: The path of the request.
+    :param user: The logged user.
+    :param data: The request data (sent as JSON).
+    :param kwargs: The view arguments.
+    :return: The response status (the name of the exception if the request raised).
+    """
+    request = getattr(APIRequestFactory(), method)(path, data, format='json', HTTP_ACCEPT='application/json')
+    force_authenticate(request, user)
+
+    try:
+        return view(request, **kwargs).status_code
+    except Exception as exception:
+        return type(exception).__name__
+    finally:
+        connections.close_all()  # Every request on its own connection, like the threads of the server.
+
+
+def run_concurrently(tasks: list, threads: int = 8) -> Counter:
+    """
+    Run the tasks from many threads.
+    :param tasks: The tasks (functions without arguments).
+    :param threads: The number of threads.
+    :return: The number of times every result returned.
+    """
+    with ThreadPoolExecutor(threads) as executor:
+        return Counter(executor.map(lambda task: task(), tasks))
+
+
+@override_settings(**TEST_SETTINGS)
+class PostsQueriesTest(TestCase):
+    """
+    The posts lists run the same number of queries no matter how many posts they return.
+    """
+
+    def setUp(self) -> None:
+        clear_caches()
+        self.users = create_users(3)
+        self.client = APIClient()
+        self.client.force_authenticate(self.users[0])
+
+    def assert_queries(self, path: str, max_queries: int) -> None:
+        """
+        Check that the request runs at most the number of queries with few posts and with many posts.
+        :param path: The path of the request.
+        :param max_queries: The maximum number of queries of the request.
+        """
+        for count in (5, 50):
+            create_posts(self.users, count)
+            clear_caches()
+
+            with query_budget(max_queries):
+                response = self.client.get(path)
+
+            self.assertEqual(response.status_code, 200)
+
+    def test_posts(self):
+        # The liked posts of the user, the posts versions and the posts that aren't in the feed cache.
+        self.assert_queries('/posts/', 3)
+
+        with query_budget(1):  # Only the versions when the posts are in the feed cache.
+            self.assertEqual(len(self.client.get('/posts/').json()), 55)
+
+    @override_settings(FEED_CACHE={'ENABLED': False})
+    def test_posts_without_feed_cache(self):
+        self.assert_queries('/posts/', 2)  # The liked posts of the user and the posts with their creators.
+
+    def test_feed_mode(self):
+        self.assert_queries('/posts/?page_size=10', 3)
+
+        # The next page costs the same (its posts versions and the posts that aren't in the feed cache).
+        response = self.client.get('/posts/?page_size=10')
+        with query_budget(2):
+            self.assertEqual(len(self.client.get(response.json()['next']).json()['results']), 10)
+
+    @override_settings(FEED_CACHE={'ENABLED': False})
+    def test_feed_mode_without_feed_cache(self):
+        self.assert_queries('/posts/?page_size=10', 2)
+
+    def test_user_posts(self):
+        # The user of the feed version, the liked posts of the user, the user and his posts with their creator.
+        self.assert_queries('/users/%s/posts/' % self.users[1].username, 4)
+
+
+class QueryPlansTest(TestCase):
+    """
+    The hot queries of the site use the indexes they are meant to use (checked with EXPLAIN).
+    """
+
+    @staticmethod
+    def get_unique_index(model, columns: list[str]) -> str:
+        """
+        Get the name of the unique index of the columns (the name is generated by the database backend).
+        :param model: The model of the table.
+        :param columns: The index columns.
+        :return: The index name.
+        """
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+
+        return next(name for name, constraint in constraints.items()
+                    if constraint['unique'] and constraint['columns'] == columns)
+
+    def test_indexes(self):
+        user_id = 0  # The queries don't need data, only their plans are checked.
+
+        # The query, the index it should use and its description.
+        queries = [
+            (Post.objects.filter(likes_count=0).exclude(creator__username='').distinct_creators(),
+             'post_likes_count_id_idx', 'Creators of the posts with no likes'),
+            (Post.objects.filter(creator_id=user_id).order_by('-created_at'),
+             'post_creator_created_idx', 'Posts of a user, newest first'),
+            (Like.objects.filter(user_id=user_id).order_by('post_id').values_list('post_id', flat=True),
+             'like_user_post_idx', 'Posts a user liked (liked posts cache)'),
+            (Post.objects.filter(creator_id=user_id).exclude(likes=user_id),
+             'like_user_post_idx', 'Posts of a user not liked by me'),
+            (Like.objects.filter(post_id=0, user_id=user_id),
+             self.get_unique_index(Like, ['post_id', 'user_id']), 'Like of a user on a post'),
+        ]
+
+        for queryset, index, description in queries:
+            with self.subTest(description):
+                plan = queryset.explain()
+                self.assertIn(index, plan, 'The query does not use %s:\n%s' % (index, plan))
+
+
+@override_settings(**TEST_SETTINGS)
+class ConcurrentLikesBatchTest(TransactionTestCase):
+    """
+    Batches of likes of the same posts that run concurrently (with likes of single posts) keep the likes counters.
+    """
+
+    def test_concurrent_batches(self):
+        creator, *users = create_users(5)
+        post_ids = [post.pk for post in create_posts([creator], 10)]
+
+        batch, detail = LikesBatchView.as_view(), PostDetailView.as_view()
+        rng = random.Random(1)
+        tasks = []
+
+        for user in users:
+            for _ in range(20):
+                sample = rng.sample(post_ids, 5)
+                tasks.append(rng.choice([
+                    lambda user=user, sample=sample: call_view(batch, 'post', '/likes/', user, {'like': sample}),
+                    lambda user=user, sample=sample: call_view(batch, 'post', '/likes/', user, {'unlike': sample}),
+                    lambda user=user, pk=sample[0]: call_view(detail, 'post', '/posts/%s/' % pk, user, pk=pk),
+                ]))
+
+        self.assertEqual(run_concurrently(tasks), {200: len(tasks)})
+        self.assertFalse(Post.objects.drifted_likes_count().exists())
+        self.assertEqual(sum(Post.objects.values_list('likes_count', flat=True)), Like.objects.count())
+
+
+@override_settings(**TEST_SETTINGS)
+class ConcurrentLikesTest(TransactionTestCase):
+    """
+    Many users toggle their like on one post (a random number of times, from many threads), at the end only the users
+    that toggled odd number of times like the post and the likes counter matches them.
+    """
+
+    def test_concurrent_toggles(self):
+        creator, *users = create_users(33)
+        post = Post.objects.create(title='Concurrent likes', body='Post liked from many threads.', creator=creator)
+
+        rng = random.Random(1)
+        toggles = {user: rng.randint(1, 10) for user in users}
+        tasks = [user for user in users for _ in range(toggles[user])]
+        rng.shuffle(tasks)
+
+        detail = PostDetailView.as_view()
+        path = '/posts/%s/' % post.pk
+        statuses = run_concurrently([lambda user=user: call_view(detail, 'post', path, user, pk=post.pk)
+                                     for user in tasks], threads=16)
+
+        self.assertEqual(statuses, {200: len(tasks)})
+
+        expected = {user.pk for user, count in toggles.items() if count % 2}
+        self.assertEqual(set(Like.objects.filter(post=post).values_list('user_id', flat=True)), expected)
+
+        post.refresh_from_db(fields=['likes_count'])
+        self.assertEqual(post.likes_count, len(expected))
+
+
+@override_settings(**TEST_SETTINGS)
+class LikedPostsCacheTest(TransactionTestCase):
+    """
+    The cached liked posts of the user are not used after his likes changed.
+    """
+
+    def setUp(self) -> None:
+        clear_caches()
+        self.creator, self.user = create_users(2)
+        self.posts = [Post.objects.create(title='title', body='body', creator=self.creator) for _ in range(3)]
+
+    def test_likes_invalidate(self):
+        cache = get_liked_posts_cache()
+        self.assertFalse(list(cache.get(self.user)))
+
+        # Likes of the batch path and of the single post path of the same user.
+        Post.objects.filter(pk=self.posts[0].pk).like_all(self.user)
+        self.posts[1].like(self.user)
+        self.assertEqual(list(cache.get(self.user)), [self.posts[0].pk, self.posts[1].pk])
+
+        with query_budget(0):  # Cached until the next like.
+            cache.get(self.user)
+
+        self.posts[0].unlike(self.user)
+        self.assertEqual(list(cache.get(self.user)), [self.posts[1].pk])
+
+    def test_like_while_loading(self):
+        cache = get_liked_posts_cache()
+        load = LikedPostsCache._LikedPostsCache__load
+
+        def load_before_like(user_id):
+            liked_posts = load(user_id)
+            self.posts[2].like(self.user)  # Commits after the likes were read.
+            return liked_posts
+
+        with mock.patch.object(LikedPostsCache, '_LikedPostsCache__load', side_effect=load_before_like):
+            self.assertFalse(list(cache.get(self.user)))
+
+        self.assertEqual(list(cache.get(self.user)), [self.posts[2].pk])  # The set loaded before the like isn't used.
+
+    def test_process_cache(self):
+        with override_settings(LIKED_POSTS_CACHE={'CACHE': 'default'}):
+            self.assertIn('SocialNetwork.E003', [error.id for error in run_checks(tags=['caches'])])
+
+
+@override_settings(**TEST_SETTINGS)
+class FeedVersionsTest(TransactionTestCase):
+    """
+    The feed answers 304 until it changes and its counters are in a cache shared by all the processes.
+    """
+
+    def setUp(self) -> None:
+        clear_caches()
+        self.users = create_users(2)
+        self.posts = create_posts(self.users, 2)
+        self.client = APIClient()
+        self.client.force_authenticate(self.users[0])
+
+    def test_not_modified(self):
+        etag = self.client.get('/posts/')['ETag']
+        self.assertEqual(self.client.get('/posts/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.posts[0].like(self.users[1])
+        self.assertEqual(self.client.get('/posts/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_process_cache(self):
+        with override_settings(FEED_VERSIONS={'CACHE': 'default'}):
+            self.assertIn('SocialNetwork.E001', [error.id for error in run_checks(tags=['caches'])])
+
+        shared = {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': 'unused'}
+        with override_settings(FEED_VERSIONS={'CACHE': 'shared'}, CACHES={**TEST_SETTINGS['CACHES'], 'shared': shared}):
+            self.assertNotIn('SocialNetwork.E001', [error.id for error in run_checks(tags=['caches'])])
+
+
+def encode_segment(data) -> str:
+    """
+    Encode a JSON segment of a JWT token (to build tokens that the service didn't issue).
+    :param data: The segment data.
+    :return: The encoded segment.
+    """
+    return base64.urlsafe_b64encode(json.dumps(data).encode('utf-8')).rstrip(b'=').decode('ascii')
+
+
+@override_settings(**TEST_SETTINGS)
+class TokenServiceTest(TestCase):
+    """
+    Malformed tokens and tokens with claims of the wrong types fail to decode (and the requests with them fail to
+    authenticate) instead of raising other errors, and the revoked tokens are rejected until they expire.
+    """
+
+    def setUp(self) -> None:
+        clear_caches()
+        self.service = TokenService('secret')
+
+    def test_malformed_tokens(self):
+        header = encode_segment({'alg': 'HS256', 'typ': 'JWT'})
+        tokens = [
+            'abc', 'a.b', 'a.b.c', 'W10.e30.abc', '%s.W10.abc' % header, '%s.%s.abc' % (header, encode_segment('id')),
+            '%s.%s.abc' % (encode_segment(1), encode_segment({'id': 1})), '%s.e30.abc' % base64.urlsafe_b64encode(b'[' * 100000).decode('ascii'),
+            '%s.%s.abc' % (header, encode_segment({'id': 1})[:-1] + '!'),
+        ]
+
+        for token in tokens:
+            with self.subTest(token=token[:40]), self.assertRaises(jwt.DecodeError):
+                self.service.decode(token)
+
+    def test_claims_types(self):
+        for claims in ({'exp': 'soon'}, {'exp': True}, {'iat': [1]}, {'iat': None}):
+            with self.subTest(claims=claims), self.assertRaises(jwt.DecodeError):
+                self.service.decode(self.service.encode({'id': 1, **claims}))
+
+        self.assertEqual(self.service.decode(self.service.encode({'id': 1, 'iat': 1.5}))['id'], 1)
+
+    def test_process_cache(self):
+        with override_settings(JWT_TOKENS={'CACHE': 'default'}):
+            self.assertIn('SocialNetwork.E002', [error.id for error in run_checks(tags=['caches'])])
+
+    def test_revocation_not_evicted(self):
+        user = create_users(1)[0]
+        token = self.service.get_token(user)
+        self.service.revoke(token)
+
+        # Fill the cache of the service far beyond its maximum entries (the culled entries are random).
+        self.service.cache.set_many({'filler:%s' % index: index for index in range(1000)})
+
+        with self.assertRaises(jwt.InvalidTokenError):
+            self.service.decode(token)
+        self.assertNotEqual(self.service.get_token(user), token)
+
+    def test_revoke_user(self):
+        user = create_users(1)[0]
+        token = self.service.get_token(user)
+        self.service.revoke_user(user.pk)
+
+        with self.assertRaises(jwt.InvalidTokenError):
+            self.service.decode(token)
+        self.service.decode(self.service.get_token(user))  # The tokens issued after the revocation are valid.
+
+    def test_prune_expired(self):
+        user = create_users(1)[0]
+        RevokedToken.objects.create(user=user, jti='expired', revoked_at=0, expires_at=1)
+        RevokedToken.objects.revoke_token(user.pk, 'valid', expires_at=2 ** 40)  # Prunes the expired revocations.
+
+        self.assertEqual(RevokedToken.objects.prune(), 0)
+        self.assertEqual(list(RevokedToken.objects.values_list('jti', flat=True)), ['valid'])
+
+    def test_malformed_token_request(self):
+        response = APIClient().get('/posts/', HTTP_AUTHORIZATION='Token W10.e30.abc')
+        self.assertEqual(response.status_code, 403)
+
+
+@override_settings(**TEST_SETTINGS)
+class TokenCacheTest(TestCase):
+    """
+    The verified tokens are cached up to max size and until they expire, and are invalidated when their user changed
+    (in all the processes with a shared cache).
+    """
+
+    def setUp(self) -> None:
+        clear_caches()
+        get_token_cache().clear()
+        self.users = create_users(2)
+
+    def cache_token(self, cache: TokenCache, token: str, user: User, lifetime: float = 3600) -> None:
+        """
+        Cache the token of the user the way the authentication backend does.
+        :param cache: The token cache.
+        :param token: The token.
+        :param user: The user of the token.
+        :param lifetime: The number of seconds until the token expires.
+        """
+        cache.set(token, {'id': user.pk, 'exp': time.time() + lifetime}, user, cache.get_user_version(user.pk))
+
+    def test_least_recently_used(self):
+        cache = TokenCache(max_size=2)
+        self.cache_token(cache, 'a', self.users[0])
+        self.cache_token(cache, 'b', self.users[0])
+        cache.get('a')
+        self.cache_token(cache, 'c', self.users[1])
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a')[1].pk, self.users[0].pk)
+        self.assertEqual(cache.get('c')[1].pk, self.users[1].pk)
+        self.assertEqual(cache.stats()['size'], 2)
+
+    def test_expiration(self):
+        cache = TokenCache(timeout=300)
+        self.cache_token(cache, 'expired', self.users[0], lifetime=-1)
+        self.cache_token(cache, 'short', self.users[0], lifetime=10)
+        self.cache_token(cache, 'long', self.users[0])
+        self.assertIsNone(cache.get('expired'))
+        self.assertIsNotNone(cache.get('short'))
+
+        now = time.time()
+        with mock.patch('SocialNetwork.auth.TokenCache.time.time', return_value=now + 11):
+            self.assertIsNone(cache.get('short'))  # The token expired before the cache timeout.
+            self.assertIsNotNone(cache.get('long'))
+
+        with mock.patch('SocialNetwork.auth.TokenCache.time.time', return_value=now + 301):
+            self.assertIsNone(cache.get('long'))
+
+    def test_user_changed(self):
+        cache = get_token_cache()
+        self.cache_token(cache, 'a', self.users[0])
+        self.cache_token(cache, 'b', self.users[1])
+
+        self.users[0].is_active = False
+        self.users[0].save()
+        self.assertIsNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('b'))
+
+        self.users[1].delete()
+        self.assertIsNone(cache.get('b'))
+
+    def test_user_changed_while_loading(self):
+        cache = get_token_cache()
+        version = cache.get_user_version(self.users[0].pk)
+        user = User.objects.get(pk=self.users[0].pk)
+        self.users[0].save()  # Changed after the user loaded and before the token cached.
+
+        cache.set('a', {'id': user.pk}, user, version)
+        self.assertIsNone(cache.get('a'))
+
+    def test_shared_cache(self):
+        # Two caches of different processes that share the tokens.
+        cache, other_cache = TokenCache(cache='persistent'), TokenCache(cache='persistent')
+        self.cache_token(cache, 'a', self.users[0])
+        self.assertEqual(other_cache.get('a')[1].username, self.users[0].username)
+
+        other_cache.invalidate_user(self.users[0].pk)
+        self.assertIsNone(cache.get('a'))
+
+    def test_stats(self):
+        cache = TokenCache()
+        cache.get('a')
+        self.cache_token(cache, 'a', self.users[0])
+        cache.get('a')
+        cache.get('a')
+        cache.invalidate_user(self.users[0].pk)
+
+        self.assertEqual(cache.stats(), {'hits': 2, 'misses': 1, 'invalidations': 1, 'size': 1, 'shared': False})
+
+    def test_checks(self):
+        self.assertIn('SocialNetwork.W001', [error.id for error in run_checks(tags=['caches'])])
+
+        with override_settings(JWT_AUTHENTICATION_CACHE={'CACHE': 'default'}):
+            ids = [error.id for error in run_checks(tags=['caches'])]
+            self.assertIn('SocialNetwork.E004', ids)
+            self.assertNotIn('SocialNetwork.W001', ids)
+
+
+# Low costs of the hashers so the tests hash fast.
+LOW_COST_PASSWORD_HASHING = {
+    'ARGON2': {'TIME_COST': 1, 'MEMORY_COST': 64, 'PARALLELISM': 1},
+    'SCRYPT': {'WORK_FACTOR': 2 ** 4, 'BLOCK_SIZE': 8, 'PARALLELISM': 1},
+}
+
+
+@override_settings(**TEST_SETTINGS, PASSWORD_HASHING=LOW_COST_PASSWORD_HASHING)
+class PasswordHashersTest(TestCase):
+    """
+    The hashers verify their hashes, the passwords are hashed again when the cost or the profile changed and the
+    load test hasher can't be used without being allowed.
+    """
+
+    def test_scrypt(self):
+        hasher = ScryptPasswordHasher()
+        encoded = hasher.encode('password', 'salt')
+
+        self.assertTrue(encoded.startswith('scrypt$16$salt$8$1$'))
+        self.assertTrue(hasher.verify('password', encoded))
+        self.assertFalse(hasher.verify('passwore', encoded))
+        self.assertFalse(hasher.must_update(encoded))
+
+        scrypt = {**LOW_COST_PASSWORD_HASHING['SCRYPT'], 'WORK_FACTOR': 2 ** 5}
+        with override_settings(PASSWORD_HASHING={**LOW_COST_PASSWORD_HASHING, 'SCRYPT': scrypt}):
+            self.assertTrue(hasher.must_update(encoded))
+            self.assertTrue(hasher.verify('password', encoded))  # The old hashes are still verified with their cost.
+
+    def test_argon2(self):
+        hasher = TunedArgon2PasswordHasher()
+        encoded = hasher.encode('password', 'saltsalt')
+
+        self.assertTrue(hasher.verify('password', encoded))
+        self.assertFalse(hasher.must_update(encoded))
+
+        argon2 = {**LOW_COST_PASSWORD_HASHING['ARGON2'], 'TIME_COST': 2}
+        with override_settings(PASSWORD_HASHING={**LOW_COST_PASSWORD_HASHING, 'ARGON2': argon2}):
+            self.assertTrue(hasher.must_update(encoded))
+
+    def test_login_rehash(self):
+        user = create_users(1)[0]
+        encoded = PBKDF2PasswordHasher().encode('password123', 'salt', iterations=1000)
+        User.objects.filter(pk=user.pk).update(password=encoded)
+
+        with override_settings(PASSWORD_HASHERS=settings.PASSWORD_HASHING_PROFILES['argon2']):
+            response = APIClient().post('/login/', {'email': user.email, 'password': 'password123'}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(User.objects.get(pk=user.pk).password.startswith('argon2$'))
+
+    def test_load_test_hasher(self):
+        with self.assertRaises(ImproperlyConfigured):
+            LoadTestPasswordHasher()
+
+        with override_settings(PASSWORD_HASHING={'ALLOW_LOAD_TEST_HASHER': True}):
+            hasher = LoadTestPasswordHasher()
+            self.assertTrue(hasher.verify('password', hasher.encode('password', 'salt')))
+
+
+@override_settings(**TEST_SETTINGS)
+class EmailVerifierTest(TestCase):
+    """
+    Concurrent verifications of the same email call the client once, the domains without mail servers are cached and
+    the client is not called for a while after it failed few times in a row.
+    """
+
+    def setUp(self) -> None:
+        clear_caches()
+        self.verifier = EmailVerifier(**{**TEST_SETTINGS['EMAIL_VERIFICATION'], 'FAILURE_THRESHOLD': 2,
+                                         'RECOVERY_TIMEOUT': 60, 'FALLBACK_VALID': False})
+
+    def test_concurrent_verifications(self):
+        self.verifier.client.delay = 0.2  # The other verifications start while the first one runs.
+
+        results = run_concurrently([lambda: self.verifier.is_valid('user@example.com') for _ in range(8)])
+
+        self.assertEqual(results, {True: 8})
+        self.assertEqual(self.verifier.client.verifications, 1)
+
+    def test_domain_cache(self):
+        self.assertFalse(self.verifier.is_valid('user1@invalid.example.com'))
+        self.assertFalse(self.verifier.is_valid('User2@Invalid.example.com'))
+        self.assertTrue(self.verifier.is_valid('user1@example.com'))
+        self.assertTrue(self.verifier.is_valid('user1@example.com'))
+
+        self.assertEqual(self.verifier.client.verifications, 2)
+
+    def test_circuit_breaker(self):
+        self.verifier.client.failing = True
+        for index in range(3):  # The third verification doesn't call the failing client.
+            self.assertFalse(self.verifier.is_valid('user%s@example.com' % index))
+        self.assertEqual(self.verifier.client.verifications, 2)
+
+        self.verifier.client.failing = False
+        self.assertFalse(self.verifier.is_valid('user3@example.com'))  # Still open.
+
+        with mock.patch('time.monotonic', return_value=time.monotonic() + 61):
+            self.assertTrue(self.verifier.is_valid('user4@example.com'))  # Recovered.
+        self.assertEqual((self.verifier.client.verifications, self.verifier.failures), (3, 0))
+
+
+@override_settings(**TEST_SETTINGS)
+class EnrichmentQueueTest(TransactionTestCase):
+    """
+    The queued users are looked up in batches (every email once), the lookups are cached and only the failed lookups
+    are retried with backoff.
+    """
+
+    def setUp(self) -> None:
+        self.users = create_users(3)
+        clear_caches()  # The users were enriched on the sign up.
+
+        # The workers close their connections after every batch, so none is open when the test database is destroyed.
+        patcher = mock.patch.dict(connection.settings_dict, {'CONN_MAX_AGE': 0})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_queue(self, **options) -> EnrichmentQueue:
+        """
+        Create queue with the fake client.
+        :param options: The queue options.
+        :return: The enrichment queue.
+        """
+        return EnrichmentQueue(**{**TEST_SETTINGS['ENRICHMENT'], 'BATCH_SIZE': 3, 'RETRY_BACKOFF': 0.05, **options})
+
+    def assert_enriched(self, *users) -> None:
+        """
+        Check that the users have the information of the fake client.
+        :param users: The users.
+        """
+        for user in users:
+            self.assertEqual(User.objects.get(pk=user.pk).bio, 'Fake person for %s.' % user.email)
+
+    def test_batch(self):
+        enrichment_queue = self.create_queue(WORKERS=1, BATCH_WAIT=10)
+        User.objects.update(bio='')
+
+        for user in (self.users[0], self.users[0], self.users[1]):  # A full batch with an email queued twice.
+            enrichment_queue.enqueue(user.pk, user.email)
+        enrichment_queue.join()
+
+        self.assert_enriched(self.users[0], self.users[1])
+        self.assertEqual((enrichment_queue.client.batches, enrichment_queue.client.lookups), (1, 2))
+
+    def test_cache(self):
+        enrichment_queue = self.create_queue(CACHE_TIMEOUT=60)
+        email = self.users[0].email
+
+        enrichment_queue.find_people([email])
+        self.assertEqual(enrichment_queue.find_people([email.upper()])[email.upper()]['bio'],
+                         'Fake person for %s.' % email)
+        self.assertEqual(enrichment_queue.client.lookups, 1)
+
+        with mock.patch('time.time', return_value=time.time() + 61):
+            enrichment_queue.find_people([email])
+        self.assertEqual(enrichment_queue.client.lookups, 2)
+
+    def test_partial_failure(self):
+        enrichment_queue = self.create_queue()
+        emails = [user.email for user in self.users]
+        enrichment_queue.client.failures[emails[1]] = 1
+
+        self.assertCountEqual(enrichment_queue.find_people(emails), [emails[0], emails[2]])
+        self.assertCountEqual(enrichment_queue.find_people(emails), emails)
+        self.assertEqual(enrichment_queue.client.lookups, 4)  # Only the failed lookup looked up again.
+
+    def test_retries(self):
+        enrichment_queue = self.create_queue(WORKERS=1, BATCH_WAIT=0, MAX_RETRIES=2)
+        User.objects.update(bio='')
+        enrichment_queue.client.failures = {self.users[1].email: 2, self.users[2].email: 3}
+
+        started = time.monotonic()
+        for user in self.users:
+            enrichment_queue.enqueue(user.pk, user.email)
+        enrichment_queue.join()
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.05 + 0.1)
+        self.assert_enriched(self.users[0], self.users[1])
+        self.assertEqual(User.objects.get(pk=self.users[2].pk).bio, '')  # Failed after all the retries.
+        self.assertEqual(enrichment_queue.client.lookups, 1 + 3 + 3)
+
+    def test_retry_doesnt_block(self):
+        enrichment_queue = self.create_queue(WORKERS=1, BATCH_WAIT=0, RETRY_BACKOFF=1)
+        User.objects.update(bio='')
+        enrichment_queue.client.failures[self.users[0].email] = 1
+
+        enrichment_queue.enqueue(self.users[0].pk, self.users[0].email)
+        enrichment_queue.enqueue(self.users[1].pk, self.users[1].email)
+
+        # The next user is enriched while the failed user waits for his retry.
+        deadline = time.monotonic() + 10
+        while User.objects.get(pk=self.users[1].pk).bio == '' and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assert_enriched(self.users[1])
+        self.assertEqual(User.objects.get(pk=self.users[0].pk).bio, '')
+
+        enrichment_queue.join()
+        self.assert_enriched(self.users[0])
+
+
+@override_settings(**TEST_SETTINGS)
+class PostsBulkTest(TestCase):
+    """
+    The posts of a bulk request are inserted together (all of them or none) and every new post has a creation event.
+    """
+
+    def setUp(self) -> None:
+        clear_caches()
+        self.users = create_users(2)
+        self.client = APIClient()
+        self.client.force_authenticate(self.users[0])
+
+    def post_posts(self, count: int):
+        """
+        Create posts with the bulk request.
+        :param count: The number of posts.
+        :return: The response.
+        """
+        posts = [{'title': 'title %s' % index, 'body': 'body'} for index in range(count)]
+        return self.client.post('/posts/bulk/', posts, format='json')
+
+    def test_one_insert(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.post_posts(3).data, {'created': 3})
+
+        # The same queries for any number of posts (up to the rows SQLite inserts in one query).
+        with self.assertNumQueries(len(queries)):
+            self.assertEqual(self.post_posts(100).data, {'created': 100})
+
+        inserts = [query for query in queries if query['sql'].startswith('INSERT INTO "SocialNetwork_post"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(Post.objects.filter(creator=self.users[0]).count(), 103)
+
+    def test_validation_errors(self):
+        posts = [{'title': 'title', 'body': 'body'}, {'title': '', 'body': 'body'}, {'title': 'title'}]
+        response = self.client.post('/posts/bulk/', posts, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data[0], {})
+        self.assertEqual(list(response.data[1]), ['title'])
+        self.assertEqual(list(response.data[2]), ['body'])
+        self.assertFalse(Post.objects.exists())
+
+    def test_created_events(self):
+        create_posts([self.users[1]], 3)  # Posts of other creator before the bulk request.
+        last_id = Post.objects.order_by('-pk').values_list('pk', flat=True).first()
+
+        self.post_posts(5)
+
+        new_post_ids = list(Post.objects.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True))
+        events = Event.objects.filter(kind=Event.POST_CREATED, user=self.users[0]).order_by('pk')
+        self.assertEqual(len(new_post_ids), 5)
+        self.assertEqual(list(events.values_list('post_id', flat=True)), new_post_ids)
+
+
+@override_settings(**TEST_SETTINGS)
+class PostsStreamMemoryTest(TestCase):
+    """
+    Streaming the posts keeps the memory to the posts of a chunk, while the list grows with the number of posts.
+    """
+    POSTS = 5000  # Number of posts (10 chunks of the stream).
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_users(1)[0]
+        Post.objects.bulk_create((Post(title='Post %s' % index, body='Seeded post body. ' * 10, creator=cls.user)
+                                  for index in range(cls.POSTS)), batch_size=1000)
+
+    def measure(self, params: dict) -> tuple:
+        """
+        Get all the posts and measure the peak memory until the whole response is consumed.
+        :param params: The query parameters.
+        :return: The peak memory (bytes) and the response content.
+        """
+        request = APIRequestFactory().get('/posts/', params, HTTP_ACCEPT='application/json')
+        force_authenticate(request, self.user)
+
+        tracemalloc.start()
+        try:
+            response = PostsView.as_view()(request)
+
+            if response.streaming:
+                chunks = list(response.streaming_content)
+            else:
+                if hasattr(response, 'render'):
+                    response.render()
+                chunks = [response.content]
+
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        content = b''.join(chunks)
+
+        # The content itself is not part of the memory the modes need.
+        return peak - len(content), content
+
+    def test_stream_memory(self):
+        list_peak, content = self.measure({})
+        self.assertEqual(len(json.loads(content)), self.POSTS)
+
+        peak, content = self.measure({'stream': 'json'})
+        self.assertEqual(len(json.loads(content)), self.POSTS)
+        self.assertLess(peak, list_peak / 4)
+
+        peak, content = self.measure({'stream': 'ndjson'})
+        self.assertEqual(len(content.splitlines()), self.POSTS)
+        self.assertLess(peak, list_peak / 4)
+
+
+@override_settings(**TEST_SETTINGS, PROFILING={'ENABLED': True, 'STATS': False})
+class ProfilingMiddlewareTest(TestCase):
+    """
+    The profiling middleware keeps the middleware chain async on ASGI, so the async views run in the event loop.
+    """
+
+    async def test_async_chain(self):
+        call_async = ProfilingMiddleware._ProfilingMiddleware__call_async
+
+        with mock.patch.object(ProfilingMiddleware, '_ProfilingMiddleware__call_async', autospec=True,
+                               side_effect=call_async) as spy:
+            response = await AsyncClient().get('/async/posts/', HTTP_ACCEPT='application/json')
+
+        self.assertTrue(spy.called)
+        self.assertIn('Server-Timing', response)
+
+
+@override_settings(**TEST_SETTINGS)
+class ProfilingStatsViewTest(TestCase):
+    """
+    Only the super users can read and reset the profiling stats.
+    """
+
+    def setUp(self) -> None:
+        self.user = create_users(1)[0]
+        self.superuser = User.objects.create_superuser('admin', 'admin@example.com', 'password123')
+        self.client = APIClient()
+
+    def test_permissions(self):
+        with override_settings(PROFILING={**settings.PROFILING, 'ENABLED': True}):
+            self.client.force_authenticate(self.user)
+            self.assertEqual(self.client.get('/profiling/stats/').status_code, 403)
+            self.assertEqual(self.client.delete('/profiling/stats/').status_code, 403)
+
+            self.client.force_authenticate(self.superuser)
+            self.assertEqual(self.client.get('/profiling/stats/').status_code, 200)
+            self.assertEqual(self.client.delete('/profiling/stats/').status_code, 204)
+
+        with override_settings(PROFILING={**settings.PROFILING, 'ENABLED': False}):
+            self.assertEqual(self.client.get('/profiling/stats/').status_code, 404)
+
+
+@override_settings(**TEST_SETTINGS)
+class CompactEventsTest(TestCase):
+    """
+    The compacted events log still has every post and the last like or unlike of every user on every post.
+    """
+
+    def test_compact(self):
+        creator, *users = create_users(3)
+        posts = [Post.objects.create(title='title %s' % index, body='body', creator=creator) for index in range(3)]
+
+        for user in users:
+            for post in posts[:2]:
+                post.like(user)
+        posts[0].unlike(users[0])
+        posts[1].unlike(users[1])
+        posts[1].like(users[1])
+
+        Event.objects.compact()
+
+        # The last event of every post and the last like or unlike of every user on every post.
+        events = Event.objects.order_by('pk').values_list('kind', 'post_id', 'user_id')
+        self.assertEqual(list(events), [
+            (Event.POST_CREATED, posts[2].pk, creator.pk),
+            (Event.POST_LIKED, posts[1].pk, users[0].pk),
+            (Event.POST_LIKED, posts[0].pk, users[1].pk),
+            (Event.POST_UNLIKED, posts[0].pk, users[0].pk),
+            (Event.POST_LIKED, posts[1].pk, users[1].pk),
+        ])
+
+        # Reading the log from the start gives the likes of every user.
+        liked = {}
+        for kind, post_id, user_id in events:
+            if kind == Event.POST_LIKED:
+                liked.setdefault(user_id, set()).add(post_id)
+            elif kind == Event.POST_UNLIKED:
+                liked.setdefault(user_id, set()).discard(post_id)
+
+        for user in users:
+            self.assertEqual(liked[user.pk], set(Like.objects.filter(user=user).values_list('post_id', flat=True)))
+
+
+@skipUnless(connection.vendor == 'postgresql', 'SQLite transactions lock the database when they begin.')
+@override_settings(**TEST_SETTINGS)
+class EventsOrderTest(TransactionTestCase):
+    """
+    A transaction that records events waits for the transaction that recorded events before it, so the events commit
+    in the order of their IDs (the readers of the log read after the last ID they read).
+    """
+
+    def test_record_waits(self):
+        user = create_users(1)[0]
+        post = Post.objects.create(title='title', body='body', creator=user)
+        recorded, release = threading.Event(), threading.Event()
+
+        def record_and_wait():
+            try:
+                with transaction.atomic():
+                    Event.objects.record(Event.POST_LIKED, user.pk, [post.pk])
+                    recorded.set()
+                    release.wait(10)
+            finally:
+                connections.close_all()
+
+        def record():
+            try:
+                Event.objects.record(Event.POST_UNLIKED, user.pk, [post.pk])
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(2) as executor:
+            first = executor.submit(record_and_wait)
+            self.assertTrue(recorded.wait(10))
+
+            second = executor.submit(record)
+            with self.assertRaises(FutureTimeoutError):
+                second.result(0.5)  # Waits until the first transaction ends.
+
+            release.set()
+            first.result(10)
+            second.result(10)
+
+        kinds = Event.objects.filter(post=post).order_by('pk').values_list('kind', flat=True)
+        self.assertEqual(list(kinds), [Event.POST_CREATED, Event.POST_LIKED, Event.POST_UNLIKED])
@@ -7,9 +7,24 @@ urlpatterns = [
 
     path('signup/', views.SignUpView.as_view(), name='signup'),
     path('login/', views.LoginView.as_view(), name='login'),
+    path('logout/', views.LogoutView.as_view(), name='logout'),
     path('posts/', views.PostsView.as_view(), name='posts'),
+    path('posts/bulk/', views.PostsBulkView.as_view(), name='posts bulk'),
+    path('posts/changes/', views.PostChangesView.as_view(), name='post changes'),
     path('posts/<int:pk>/', views.PostDetailView.as_view(), name='post detail'),
+    path('posts/<int:pk>/like/', views.PostLikeView.as_view(), name='post like'),
+    path('likes/', views.LikesBatchView.as_view(), name='likes batch'),
     path('users/<str:username>/posts/', views.UserPostsView.as_view(), name='user posts'),
 
+    # Async read only views, served natively when the site runs on ASGI server (see 'AsyncAPIView').
+    path('async/posts/', views.AsyncPostsView.as_view(), name='async posts'),
+    path('async/posts/<int:pk>/', views.AsyncPostDetailView.as_view(), name='async post detail'),
+    path('async/users/<str:username>/posts/', views.AsyncUserPostsView.as_view(), name='async user posts'),
+
+    # Stream of the posts events (see 'EventStream').
+    path('events/', views.EventsView.as_view(), name='events'),
+
+    path('profiling/stats/', views.ProfilingStatsView.as_view(), name='profiling stats'),
+
 ]
 
@@ -0,0 +1,17 @@
+# Package: SocialNetwork.verification
+
+
+class EmailVerificationClient:
+    """
+    Base class for the clients that used to verify emails.
+    """
+
+    def verify(self, email: str) -> dict:
+        """
+        Verify the email (the result is in the hunter.io email verifier format).
+        :param email: The email to verify.
+        :return: The verification result, contains the 'status' of the email ('valid', 'invalid', ...) and if the
+                 email domain has mail servers ('mx_records').
+        :exception: If the verification failed.
+        """
+        raise NotImplementedError('Email verification clients must implement verify.')
@@ -0,0 +1,212 @@
+# Package: SocialNetwork.verification
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from SocialNetwork.profiling import track
+
+logger = logging.getLogger(__name__)
+
+
+class EmailVerifier:
+    """
+    Service that verify the emails of the new users.
+
+    The verdicts are cached by email and by domain (when the domain has no mail servers every email of the domain
+    is invalid), concurrent verifications of the same email wait for one call to the client and after few failed
+    calls the client is not called for a while (circuit breaker) and the fallback verdict is used instead.
+    """
+    DEFAULT_OPTIONS = {
+        'CLIENT': 'SocialNetwork.verification.HunterEmailVerificationClient',  # The verification client class.
+        'CACHE': 'default',  # Alias of the cache to keep the verdicts.
+        'EMAIL_TIMEOUT': 60 * 60 * 24 * 30,  # Number of seconds to keep the verdict of an email.
+        'DOMAIN_TIMEOUT': 60 * 60 * 24,  # Number of seconds to keep the verdict of a domain without mail servers.
+        'FAILURE_THRESHOLD': 5,  # Number of failed calls in a row that stop the calls to the client.
+        'RECOVERY_TIMEOUT': 60,  # Number of seconds to wait before calling the client again.
+        'FALLBACK_VALID': True,  # The verdict when the client can't be called.
+    }
+    VALID = 'valid'
+    INVALID = 'invalid'
+
+    def __init__(self, **options) -> None:
+        """
+        Constructor to initialize the verifier.
+        :param options: The verifier options (see 'DEFAULT_OPTIONS').
+        """
+        self.options = {**self.DEFAULT_OPTIONS, **options}
+        self.client = import_string(self.options['CLIENT'])()
+        self.cache = caches[self.options['CACHE']]
+
+        self.__in_flight = {}  # The verifications that running now by the email.
+        self.__lock = threading.Lock()  # Guards the verifications that running now and the circuit breaker state.
+
+        # Circuit breaker state.
+        self.failures = 0  # Number of failed calls in a row.
+        self.open_until = 0  # Time until the client will not be called.
+
+    @classmethod
+    def from_settings(cls) -> 'EmailVerifier':
+        """
+        Create the verifier from the 'EMAIL_VERIFICATION' settings.
+        :return: The email verifier.
+        """
+        return cls(**getattr(settings, 'EMAIL_VERIFICATION', {}))
+
+    def is_valid(self, email: str) -> bool:
+        """
+        Check if the email is valid.
+        :param email: The email to verify.
+        :return: If the email is valid.
+        """
+        email = email.lower()
+        domain = email.rsplit('@', 1)[-1]
+
+        email_key, domain_key = self.__get_key('email', email), self.__get_key('domain', domain)
+        verdicts = self.cache.get_many([email_key, domain_key])
+
+        if domain_key in verdicts:
+            return verdicts[domain_key] == self.VALID
+
+        if email_key in verdicts:
+            return verdicts[email_key] == self.VALID
+
+        return self.__verify_once(email) == self.VALID
+
+    def __verify_once(self, email: str) -> str:
+        """
+        Verify the email with the client, when the email is already verified by other request wait for its result.
+        :param email: The email to verify.
+        :return: The email verdict.
+        """
+        with self.__lock:
+            future = self.__in_flight.get(email)
+            is_owner = future is None
+
+            if is_owner:
+                future = self.__in_flight[email] = Future()
+
+        if not is_owner:
+            return future.result()  # Wait for the verification that already running.
+
+        try:
+            verdict = self.__verify(email)
+            future.set_result(verdict)
+            return verdict
+        except BaseException as exception:
+            future.set_exception(exception)
+            raise
+        finally:
+            with self.__lock:
+                del self.__in_flight[email]
+
+    def __verify(self, email: str) -> str:
+        """
+        Verify the email with the client and cache the verdict.
+        :param email: The email to verify.
+        :return: The email verdict (the fallback verdict if the client can't be called).
+        """
+        if self.__is_open():
+            return self.__fallback()  # The client failed too many times, don't call it until it recovers.
+
+        try:
+            with track('external'):
+                result = self.client.verify(email)
+        except Exception:
+            logger.warning('Failed to verify the email %s.', email, exc_info=True)
+            self.__record_failure()
+            return self.__fallback()
+
+        self.__record_success()
+
+        verdict = self.INVALID if result.get('status') == 'invalid' else self.VALID
+        self.cache.set(self.__get_key('email', email), verdict, self.options['EMAIL_TIMEOUT'])
+
+        # No mail servers, all the emails of the domain are invalid.
+        if verdict == self.INVALID and result.get('mx_records') is False:
+            domain = email.rsplit('@', 1)[-1]
+            self.cache.set(self.__get_key('domain', domain), verdict, self.options['DOMAIN_TIMEOUT'])
+
+        return verdict
+
+    def __is_open(self) -> bool:
+        """
+        Check if the client is not called now (the circuit breaker is open).
+        :return: If the client failed too many times and didn't recover yet.
+        """
+        with self.__lock:
+            return time.monotonic() < self.open_until
+
+    def __record_success(self) -> None:
+        """
+        Reset the failed calls in a row after the client succeeded.
+        """
+        with self.__lock:
+            self.failures = 0
+
+    def __record_failure(self) -> None:
+        """
+        Count the failed call and stop calling the client if it failed too many times in a row.
+        """
+        with self.__lock:
+            self.failures += 1
+
+            opened = self.failures >= self.options['FAILURE_THRESHOLD']
+            if opened:
+                self.open_until = time.monotonic() + self.options['RECOVERY_TIMEOUT']
+                self.failures = 0
+
+        if opened:
+            logger.warning('Email verification failed %s times, using fallback verdict for %s seconds.',
+                           self.options['FAILURE_THRESHOLD'], self.options['RECOVERY_TIMEOUT'])
+
+    def __fallback(self) -> str:
+        """
+        Get the verdict to use when the client can't be called (not cached).
+        :return: The fallback verdict.
+        """
+        return self.VALID if self.options['FALLBACK_VALID'] else self.INVALID
+
+    @staticmethod
+    def __get_key(kind: str, value: str) -> str:
+        """
+        Get the cache key of the verdict.
+        :param kind: The kind of the verdict ('email' or 'domain').
+        :param value: The email or the domain.
+        :return: The cache key.
+        """
+        return 'email-verification:%s:%s' % (kind, value)
+
+
+_email_verifier = None  # The verifier of the process (created on first use).
+
+
+def get_email_verifier() -> EmailVerifier:
+    """
+    Get the email verifier of the process.
+    :return: The email verifier.
+    """
+    global _email_verifier
+
+    if _email_verifier is None:
+        _email_verifier = EmailVerifier.from_settings()
+
+    return _email_verifier
+
+
+@receiver(setting_changed)
+def reset_email_verifier(setting: str, **kwargs):
+    """
+    Create the verifier again when the verification settings changed (in the tests).
+    :param setting: The name of the changed setting.
+    """
+    global _email_verifier
+
+    if setting == 'EMAIL_VERIFICATION':
+        _email_verifier = None
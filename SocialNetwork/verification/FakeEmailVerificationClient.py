@@ -0,0 +1,39 @@
+# Package: SocialNetwork.verification
+import time
+
+from SocialNetwork.verification.EmailVerificationClient import EmailVerificationClient
+
+
+class FakeEmailVerificationClient(EmailVerificationClient):
+    """
+    Local client that consider all the emails valid except the emails of the 'invalid' domains
+    (used in tests and benchmarks).
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor to initialize the verifications counter.
+        """
+        self.verifications = 0  # Number of emails that verified (to check the caching).
+        self.failing = False  # Fail the verifications (to test the circuit breaker).
+        self.delay = 0  # Number of seconds every verification takes (to test the concurrent verifications).
+
+    def verify(self, email: str) -> dict:
+        """
+        Verify the email by its domain.
+        :param email: The email to verify.
+        :return: The verification result.
+        :exception: If the verifications fail (see 'failing').
+        """
+        self.verifications += 1
+        time.sleep(self.delay)
+
+        if self.failing:
+            raise Exception('The verification of %s failed.' % email)
+
+        domain = email.rsplit('@', 1)[-1]
+
+        if domain.startswith('invalid.'):
+            return {'email': email, 'status': 'invalid', 'mx_records': False}
+
+        return {'email': email, 'status': 'valid', 'mx_records': True}
@@ -0,0 +1,27 @@
+# Package: SocialNetwork.verification
+
+from django.conf import settings
+
+from SocialNetwork.verification.EmailVerificationClient import EmailVerificationClient
+
+
+class HunterEmailVerificationClient(EmailVerificationClient):
+    """
+    Client that verify the emails using hunter.io.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor to initialize the hunter.io client (created once and reused for all the verifications).
+        """
+        from pyhunter import PyHunter  # Imported here so the site can run with other clients without the package.
+
+        self.hunter = PyHunter(settings.HUNTER_API_KEY)
+
+    def verify(self, email: str) -> dict:
+        """
+        Verify the email using hunter.io.
+        :param email: The email to verify.
+        :return: The verification result.
+        """
+        return self.hunter.email_verifier(email)
@@ -0,0 +1,4 @@
+from SocialNetwork.verification.EmailVerificationClient import EmailVerificationClient
+from SocialNetwork.verification.HunterEmailVerificationClient import HunterEmailVerificationClient
+from SocialNetwork.verification.FakeEmailVerificationClient import FakeEmailVerificationClient
+from SocialNetwork.verification.EmailVerifier import EmailVerifier, get_email_verifier
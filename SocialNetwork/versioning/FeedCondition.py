@@ -0,0 +1,28 @@
+# Package: SocialNetwork.versioning
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+
+from SocialNetwork.versioning.FeedVersions import get_feed_versions
+
+
+def feed_condition(get_scopes):
+    """
+    Decorator for the GET method of a feed view that answers conditional requests ('If-None-Match' and
+    'If-Modified-Since') with 304 before the view runs, and adds the 'ETag' and 'Last-Modified' headers.
+    :param get_scopes: Function that get the request and the view arguments and return the scopes of the counters
+                       that the feed depends on (see 'FeedVersions').
+    :return: The method decorator.
+    """
+    def get_request_scopes(request, *args, **kwargs) -> list[str]:
+        # Computed once for the ETag and the last modified time.
+        if not hasattr(request, 'feed_scopes'):
+            request.feed_scopes = get_scopes(request, *args, **kwargs)
+        return request.feed_scopes
+
+    def get_etag(request, *args, **kwargs) -> str:
+        return get_feed_versions().get_etag(request, get_request_scopes(request, *args, **kwargs))
+
+    def get_last_modified(request, *args, **kwargs):
+        return get_feed_versions().get_last_modified(get_request_scopes(request, *args, **kwargs))
+
+    return method_decorator(condition(etag_func=get_etag, last_modified_func=get_last_modified))
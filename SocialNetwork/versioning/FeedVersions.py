@@ -0,0 +1,183 @@
+# Package: SocialNetwork.versioning
+import hashlib
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.checks import Tags, register
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from SocialNetwork.checks import check_shared_cache
+
+
+class FeedVersions:
+    """
+    Change counters of the posts feeds, used to answer conditional GET requests without rendering the posts.
+
+    The global counter is bumped when any post is created, deleted or liked and the counter of a user when his posts
+    are created, deleted or liked. The ETag of a feed is computed from its counters, the logged user and the request
+    path, so a client that sends it back gets 304 until the feed changes.
+
+    The counters must be in a cache shared by all the processes (checked on startup), a counter in the process isn't
+    bumped by the other processes and they answer 304 for a changed feed. Bumping a counter sets it to a new random
+    value instead of incrementing it, so two processes that bump it together (the increment of the file cache is not
+    atomic) still change it.
+    """
+    DEFAULT_OPTIONS = {
+        'CACHE': 'persistent',  # Alias of the cache to keep the counters (shared by all the processes).
+    }
+    GLOBAL = 'global'  # The scope of the counter of all the posts.
+
+    def __init__(self, **options) -> None:
+        """
+        Constructor to initialize the counters.
+        :param options: The counters options (see 'DEFAULT_OPTIONS').
+        """
+        self.options = {**self.DEFAULT_OPTIONS, **options}
+        self.cache = caches[self.options['CACHE']]
+
+    @classmethod
+    def from_settings(cls) -> 'FeedVersions':
+        """
+        Create the counters from the 'FEED_VERSIONS' settings.
+        :return: The feed versions.
+        """
+        return cls(**getattr(settings, 'FEED_VERSIONS', {}))
+
+    @staticmethod
+    def user_scope(user_id: int) -> str:
+        """
+        Get the scope of the counter of the user posts.
+        :param user_id: The user ID.
+        :return: The counter scope.
+        """
+        return 'user:%s' % user_id
+
+    def bump(self, user_ids: Iterable[int]) -> None:
+        """
+        Mark the global feed and the feeds of the users as changed.
+        :param user_ids: The IDs of the users that their posts changed.
+        """
+        user_ids = set(user_ids)
+        if not user_ids:
+            return  # Nothing changed.
+
+        scopes = [self.GLOBAL] + [self.user_scope(user_id) for user_id in user_ids]
+        now = time.time()
+
+        self.cache.set_many({self.__get_key(scope): self.__new_version() for scope in scopes}, None)
+        self.cache.set_many({self.__get_key(scope, 'modified'): now for scope in scopes}, None)
+
+    def get_versions(self, scopes: list[str]) -> list[int]:
+        """
+        Get the counters of the scopes.
+        :param scopes: The counters scopes.
+        :return: The counters values.
+        """
+        keys = [self.__get_key(scope) for scope in scopes]
+        versions = self.cache.get_many(keys)
+        return [versions[key] if key in versions else self.__initialize(key) for key in keys]
+
+    def get_etag(self, request, scopes: list[str]) -> str:
+        """
+        Compute the ETag of the feed that the request gets.
+        :param request: The request (the logged user and the path are part of the ETag).
+        :param scopes: The scopes of the counters that the feed depends on.
+        :return: The ETag.
+        """
+        versions = ','.join(str(version) for version in self.get_versions(scopes))
+        value = '%s|%s|%s' % (versions, request.user.pk, request.get_full_path())
+        return hashlib.sha1(value.encode()).hexdigest()
+
+    def get_last_modified(self, scopes: list[str]) -> Optional[datetime]:
+        """
+        Get the time the feed last changed.
+        :param scopes: The scopes of the counters that the feed depends on.
+        :return: The last change time or None if the feed didn't change since the counters were created.
+        """
+        modified = self.cache.get_many([self.__get_key(scope, 'modified') for scope in scopes]).values()
+        return datetime.fromtimestamp(max(modified), timezone.utc) if modified else None
+
+    def __initialize(self, key: str) -> int:
+        """
+        Create the counter if it doesn't exist.
+        :param key: The counter key.
+        :return: The counter value.
+        """
+        self.cache.add(key, self.__new_version(), None)
+        return self.cache.get(key)
+
+    @staticmethod
+    def __new_version() -> int:
+        """
+        Get new random value of a counter, so a counter that was lost (cache restart or eviction) or bumped together by
+        two processes doesn't repeat the versions that the clients already have.
+        :return: The counter value.
+        """
+        return uuid.uuid4().int >> 64
+
+    @staticmethod
+    def __get_key(scope: str, kind: str = 'version') -> str:
+        """
+        Get the cache key of the counter.
+        :param scope: The counter scope.
+        :param kind: The value kind ('version' or 'modified').
+        :return: The cache key.
+        """
+        return 'feed-versions:%s:%s' % (kind, scope)
+
+
+_feed_versions = None  # The feed versions of the process (created on first use).
+
+
+def get_feed_versions() -> FeedVersions:
+    """
+    Get the feed versions of the process.
+    :return: The feed versions.
+    """
+    global _feed_versions
+
+    if _feed_versions is None:
+        _feed_versions = FeedVersions.from_settings()
+
+    return _feed_versions
+
+
+@receiver(post_save, sender='SocialNetwork.Post')
+@receiver(post_delete, sender='SocialNetwork.Post')
+def bump_post_feeds(sender, instance, created: bool = True, **kwargs):
+    """
+    Mark the feeds of the post as changed when the post is created or deleted (the likes bump them separately).
+    :param sender: The post model.
+    :param instance: The created or deleted post.
+    :param created: If the post is created (False when an existing post saved).
+    """
+    if created:
+        transaction.on_commit(lambda: get_feed_versions().bump([instance.creator_id]))
+
+
+@register(Tags.caches)
+def check_feed_versions_cache(app_configs, **kwargs):
+    """
+    Check that the counters are shared by all the processes.
+    """
+    options = {**FeedVersions.DEFAULT_OPTIONS, **getattr(settings, 'FEED_VERSIONS', {})}
+    return check_shared_cache('FEED_VERSIONS', options['CACHE'], 'SocialNetwork.E001')
+
+
+@receiver(setting_changed)
+def reset_feed_versions(setting: str, **kwargs):
+    """
+    Create the counters again when the settings changed (in the tests).
+    :param setting: The name of the changed setting.
+    """
+    global _feed_versions
+
+    if setting == 'FEED_VERSIONS':
+        _feed_versions = None
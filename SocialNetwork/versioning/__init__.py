@@ -0,0 +1,2 @@
+from SocialNetwork.versioning.FeedVersions import FeedVersions, get_feed_versions
+from SocialNetwork.versioning.FeedCondition import feed_condition
@@ -0,0 +1,137 @@
+# Package: SocialNetwork.views
+import json
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from django.http import Http404, HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import exceptions
+from rest_framework.request import Request
+
+from SocialNetwork.auth.backends import AsyncJWTAuthenticationBackend
+from SocialNetwork.feed import FeedCache, get_feed_cache
+from SocialNetwork.likes import get_liked_posts_cache
+from SocialNetwork.serializers import PostSerializer
+from SocialNetwork.versioning import get_feed_versions
+
+
+class AsyncAPIView:
+    """
+    Base class of the async read only views (served natively when the site runs on ASGI server).
+
+    The authentication (with a cached token) and the conditional requests are handled in the event loop, the
+    database queries and the rendering run in one worker thread per request (the ORM is synchronous).
+    Django 3.1 runs only function views as async views, so 'as_view' returns a coroutine function.
+    """
+    authentication = AsyncJWTAuthenticationBackend()
+
+    @classmethod
+    def as_view(cls):
+        """
+        Create the view function.
+        :return: The async view function.
+        """
+        async def view(request, *args, **kwargs):
+            return await cls().dispatch(request, *args, **kwargs)
+
+        view.csrf_exempt = True  # Read only views, the same as the API views.
+        return view
+
+    async def dispatch(self, request, *args, **kwargs) -> HttpResponse:
+        """
+        Authenticate the request, answer conditional requests and render the response.
+        :param request: The user request.
+        :return: The response.
+        """
+        if request.method not in ('GET', 'HEAD'):
+            return JsonResponse({'detail': 'Method "%s" not allowed.' % request.method}, status=405)
+
+        try:
+            authenticated = await self.authentication.authenticate_async(request)
+            if authenticated is None:
+                raise exceptions.NotAuthenticated()
+
+            # Use DRF request so the filters and the pagination of the sync views can be used.
+            self.request = Request(request)
+            self.request.user = authenticated[0]
+
+            scopes = await self.get_scopes(*args, **kwargs)
+            etag = quote_etag(get_feed_versions().get_etag(self.request, scopes))
+            last_modified = get_feed_versions().get_last_modified(scopes)
+            last_modified = int(last_modified.timestamp()) if last_modified else None
+
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                content = await self.run_sync(self.render, *args, **kwargs)
+                response = HttpResponse(content, content_type='application/json')
+
+        except exceptions.APIException as exception:
+            detail = exception.detail if isinstance(exception.detail, (list, dict)) else {'detail': exception.detail}
+            # Like the sync views, the token authentication doesn't send 'WWW-Authenticate' so 401 is sent as 403.
+            status = 403 if exception.status_code == 401 else exception.status_code
+            return JsonResponse(detail, status=status, safe=False)
+        except Http404:
+            return JsonResponse({'detail': 'Not found.'}, status=404)
+
+        response.setdefault('ETag', etag)
+        if last_modified:
+            response.setdefault('Last-Modified', http_date(last_modified))
+        return response
+
+    async def get_scopes(self, *args, **kwargs) -> list[str]:
+        """
+        Get the scopes of the change counters of the response (see 'FeedVersions').
+        :return: The counters scopes.
+        """
+        raise NotImplementedError
+
+    def render(self, *args, **kwargs) -> str:
+        """
+        Render the response (runs in worker thread so it can use the database).
+        :return: The response JSON.
+        """
+        raise NotImplementedError
+
+    def render_posts(self, queryset, paginator=None) -> str:
+        """
+        Render the posts the same as the sync views.
+        :param queryset: The posts query set.
+        :param paginator: The pagination of the posts (None to render all the posts).
+        :return: The posts JSON.
+        """
+        liked_posts = get_liked_posts_cache().get(self.request.user)
+
+        if get_feed_cache().enabled:
+            queryset = queryset.order_by('pk').values(*FeedCache.VERSION_FIELDS)
+            page = paginator.paginate_queryset(queryset, self.request, self) if paginator else None
+            posts = get_feed_cache().render(page if page is not None else queryset, liked_posts)
+        else:
+            queryset = queryset.with_feed_annotations().order_by('pk')
+            page = paginator.paginate_queryset(queryset, self.request, self) if paginator else None
+            context = {'user': self.request.user, 'liked_posts': liked_posts}
+            data = PostSerializer(page if page is not None else queryset, many=True, context=context).data
+            posts = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+        return paginator.get_paginated_json(posts) if page is not None else posts
+
+    @classmethod
+    async def run_sync(cls, function, *args, **kwargs):
+        """
+        Run synchronous code (that uses the database) in a worker thread.
+        :param function: The function to run.
+        :return: The function result.
+        """
+        return await sync_to_async(cls.__run_and_release, thread_sensitive=False)(function, *args, **kwargs)
+
+    @staticmethod
+    def __run_and_release(function, *args, **kwargs):
+        """
+        Run the function and release the database connection of the worker thread when needed.
+        :param function: The function to run.
+        :return: The function result.
+        """
+        try:
+            return function(*args, **kwargs)
+        finally:
+            close_old_connections()
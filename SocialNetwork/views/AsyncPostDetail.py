@@ -0,0 +1,34 @@
+# Package: SocialNetwork.views
+from django.http import Http404
+
+from SocialNetwork.models import Post
+from SocialNetwork.versioning import FeedVersions
+from SocialNetwork.views.AsyncAPIView import AsyncAPIView
+
+
+class AsyncPostDetailView(AsyncAPIView):
+    """
+    Async view to see the post.
+    """
+
+    async def get_scopes(self, pk: int) -> list[str]:
+        """
+        Use the global counter so the post isn't loaded to check if it changed.
+        :param pk: The post ID.
+        :return: The counters scopes.
+        """
+        return [FeedVersions.GLOBAL]
+
+    def render(self, pk: int) -> str:
+        """
+        Render the post.
+        :param pk: The post ID.
+        :return: The post JSON.
+        :exception: Throw HTTP 404 if the post not exist.
+        """
+        posts = self.render_posts(Post.objects.filter(pk=pk))
+
+        if posts == '[]':
+            raise Http404
+
+        return posts[1:-1]  # The post without the list.
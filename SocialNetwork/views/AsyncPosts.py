@@ -0,0 +1,34 @@
+# Package: SocialNetwork.views
+import json
+
+from SocialNetwork.filters import PostFilterBackend
+from SocialNetwork.models import Post
+from SocialNetwork.pagination import PostCursorPagination
+from SocialNetwork.versioning import FeedVersions
+from SocialNetwork.views.AsyncAPIView import AsyncAPIView
+
+
+class AsyncPostsView(AsyncAPIView):
+    """
+    Async view to get the posts (the same query parameters as 'PostsView', without streaming).
+    """
+
+    async def get_scopes(self) -> list[str]:
+        """
+        The posts change when any post is created or liked.
+        :return: The counters scopes.
+        """
+        return [FeedVersions.GLOBAL]
+
+    def render(self) -> str:
+        """
+        Render the posts.
+        :return: The posts JSON.
+        """
+        posts = PostFilterBackend().filter_queryset(self.request, Post.objects.all(), self)
+
+        # Return only the usernames of the posts creators.
+        if self.request.query_params.get('distinct') == 'creator':
+            return json.dumps(list(posts.distinct_creators()))
+
+        return self.render_posts(posts, PostCursorPagination())
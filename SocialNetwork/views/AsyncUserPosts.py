@@ -0,0 +1,44 @@
+# Package: SocialNetwork.views
+from django.http import Http404
+
+from SocialNetwork.filters import PostFilterBackend
+from SocialNetwork.models import User
+from SocialNetwork.versioning import FeedVersions
+from SocialNetwork.views.AsyncAPIView import AsyncAPIView
+
+
+class AsyncUserPostsView(AsyncAPIView):
+    """
+    Async view to see the user posts.
+    """
+
+    async def get_scopes(self, username: str) -> list[str]:
+        """
+        The user posts change when the user creates post or his posts are liked.
+        :param username: The user username.
+        :return: The counters scopes.
+        """
+        self.user_id = await self.run_sync(self.__get_user_id, username)
+        return [FeedVersions.user_scope(self.user_id)]
+
+    def render(self, username: str) -> str:
+        """
+        Render the user posts.
+        :param username: The user username.
+        :return: The posts JSON.
+        :exception: Throw HTTP 404 if the user not exist.
+        """
+        if self.user_id is None:
+            raise Http404
+
+        posts = User(pk=self.user_id).posts.all()
+        return self.render_posts(PostFilterBackend().filter_queryset(self.request, posts, self))
+
+    @staticmethod
+    def __get_user_id(username: str):
+        """
+        Get the ID of the requested user.
+        :param username: The user username.
+        :return: The user ID or None if the user not exist.
+        """
+        return User.objects.filter(username=username).values_list('pk', flat=True).first()
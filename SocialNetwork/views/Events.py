@@ -0,0 +1,28 @@
+# Package: SocialNetwork.views
+from django.http import StreamingHttpResponse
+from rest_framework import permissions
+from rest_framework.renderers import JSONRenderer
+from rest_framework.views import APIView
+
+from SocialNetwork.events import EventStreamRenderer, get_event_stream
+
+
+class EventsView(APIView):
+    """
+    View to stream the posts events (Server-Sent Events), on ASGI server the stream is sent by
+    'EventStreamApplication' instead.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [EventStreamRenderer, JSONRenderer]
+
+    def get(self, request):
+        """
+        Stream the events after the offset of the request until the client disconnects.
+        :param request: The user request.
+        :return: Streaming response of the events.
+        """
+        stream = get_event_stream()
+
+        response = StreamingHttpResponse(stream.iter_events(stream.get_offset(request)), content_type=stream.CONTENT_TYPE)
+        response['Cache-Control'] = 'no-cache'
+        return response
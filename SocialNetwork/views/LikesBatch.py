@@ -0,0 +1,60 @@
+# Package: SocialNetwork.views
+
+from django.db import transaction
+from rest_framework import permissions, serializers
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from SocialNetwork.models import Post
+
+
+class LikesBatchSerializer(serializers.Serializer):
+    """
+    Used to deserialize batch of likes, the IDs of the posts to like and the IDs of the posts to unlike.
+    """
+    max_posts = 1000  # Maximum number of posts in one batch.
+
+    like = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, default=list,
+                                 max_length=max_posts)
+    unlike = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, default=list,
+                                   max_length=max_posts)
+
+    def validate(self, data):
+        """
+        Validate that a post is not liked and unliked in the same batch.
+        :param data: The serializer data.
+        :return: The validated data.
+        """
+        if set(data['like']) & set(data['unlike']):
+            raise serializers.ValidationError('A post can not be liked and unliked in the same batch.')
+
+        return data
+
+
+class LikesBatchView(APIView):
+    """
+    View for user to like and unlike many posts in one request (repeating the request doesn't change the result).
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        """
+        Like and unlike the posts in the request.
+        :param request: The user request, contains the IDs of the posts to 'like' and to 'unlike'.
+        :return: Response containing the IDs of the posts that the user like was added to ('liked') or removed from
+                 ('unliked'), the other posts were already in the requested state, are the user posts or not exist.
+        """
+        serializer = LikesBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        user = request.user
+        like_ids, unlike_ids = serializer.validated_data['like'], serializer.validated_data['unlike']
+
+        with transaction.atomic():
+            # Lock all the posts before the likes record their events (the events log is locked after the rows).
+            Post.objects.filter(pk__in=like_ids + unlike_ids).lock()
+
+            liked = Post.objects.filter(pk__in=like_ids).like_all(user)
+            unliked = Post.objects.filter(pk__in=unlike_ids).unlike_all(user)
+
+        return Response({'liked': liked, 'unliked': unliked})
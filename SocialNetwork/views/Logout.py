@@ -0,0 +1,22 @@
+# Package: SocialNetwork.views
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from SocialNetwork.auth.TokenService import get_token_service
+
+
+class LogoutView(APIView):
+    """
+    View to logout user (revoke the token of the request, the next login issues a new token).
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        """
+        Logout the user.
+        :param request: The logout request.
+        :return: Empty response.
+        """
+        get_token_service().revoke(request.auth)
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,63 @@
+# Package: SocialNetwork.views
+from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from SocialNetwork.likes import get_liked_posts_cache
+from SocialNetwork.models import Event, Post
+from SocialNetwork.serializers import PostSerializer
+
+
+class PostChangesView(APIView):
+    """
+    View to get only the posts that changed (created or liked) since the last sync of the client.
+
+    The changes are read from the events log after the sync token (the ID of the last event the client synced), so
+    the cost is the number of changes and not the number of posts. Without token all the posts are returned (the log
+    keeps at least the last event of every post, see 'EventQuerySet.compact'). The events commit in the order of their
+    IDs (see 'EventQuerySet.record'), so an event that commits after the token was returned has a larger ID and is read
+    on the next sync. When 'has_more' is true the client should request again with the new token.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    BATCH_SIZE = 1000  # Maximum number of events read in one request.
+
+    def get(self, request):
+        """
+        Get the posts that changed since the sync token.
+        :param request: The user request (the 'since' parameter is the sync token).
+        :return: Response containing the changed posts, the new sync token and if there are more changes.
+        :exception: ValidationError if the token is not valid.
+        """
+        since = self.__get_token(request)
+
+        events = list(Event.objects.filter(pk__gt=since).order_by('pk').values_list('pk', 'post_id')[:self.BATCH_SIZE])
+        post_ids = {post_id for _, post_id in events}
+
+        posts = Post.objects.filter(pk__in=post_ids).with_feed_annotations().order_by('pk')
+        context = {'user': request.user, 'liked_posts': get_liked_posts_cache().get(request.user)}
+
+        return Response({
+            'posts': PostSerializer(posts, many=True, context=context).data,
+            'token': str(events[-1][0] if events else since),
+            'has_more': len(events) == self.BATCH_SIZE,
+        })
+
+    @staticmethod
+    def __get_token(request) -> int:
+        """
+        Get the sync token of the request.
+        :param request: The user request.
+        :return: The ID of the last event the client synced (0 when the client didn't sync).
+        :exception: ValidationError if the token is not valid.
+        """
+        try:
+            since = int(request.query_params.get('since') or 0)
+        except ValueError:
+            since = -1
+
+        if since < 0:
+            raise ValidationError({'since': 'Invalid sync token.'})
+
+        return since
@@ -3,8 +3,11 @@
 from rest_framework import permissions, generics
 from rest_framework.response import Response
 
+from SocialNetwork.feed import get_feed_cache
+from SocialNetwork.likes import get_liked_posts_cache
 from SocialNetwork.models import Post
 from SocialNetwork.serializers import PostSerializer
+from SocialNetwork.versioning import FeedVersions, feed_condition
 
 
 class PostDetailView(generics.RetrieveAPIView):
@@ -16,6 +19,13 @@ class PostDetailView(generics.RetrieveAPIView):
 
     queryset = Post.objects.all()
 
+    def get_queryset(self):
+        """
+        Get the posts with the creator loaded in the same query (the user like is checked in the liked posts cache).
+        :return: The posts query set.
+        """
+        return super().get_queryset().with_feed_annotations()
+
     def post(self, request, pk):
         """
         Request for the user to like post.
@@ -29,15 +39,16 @@ class PostDetailView(generics.RetrieveAPIView):
         if post.creator == user:
             return self.get(request, pk)  # User can't like his own posts.
 
-        # If user like post, unlike it otherwise like the post.
-        if post.likes.filter(pk=user.pk).exists():
-            post.likes.remove(user)
-        else:
-            post.likes.add(user)
+        # If user like post, unlike it otherwise like the post (the likes counter is updated in the same transaction).
+        likes_count = post.likes_count
+        post.toggle_like(user)
+        get_feed_cache().discard(post.pk, likes_count)  # The cached version of the post is not used anymore.
 
         # Return the post information.
         return self.get(request, pk)
 
+    # Use the global counter so the post isn't loaded to check if it changed.
+    @feed_condition(lambda request, pk: [FeedVersions.GLOBAL])
     def get(self, request, pk):
         """
         Get the requested post details.
@@ -45,5 +56,6 @@ class PostDetailView(generics.RetrieveAPIView):
         :param pk: The post ID.
         :return: Resposne containing the requested post details.
         """
-        serializer = self.serializer_class(self.get_object(), context={'user': request.user})
+        context = {'user': request.user, 'liked_posts': get_liked_posts_cache().get(request.user)}
+        serializer = self.serializer_class(self.get_object(), context=context)
         return Response(serializer.data)
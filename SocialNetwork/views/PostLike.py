@@ -0,0 +1,68 @@
+# Package: SocialNetwork.views
+
+from django.shortcuts import get_object_or_404
+from rest_framework import exceptions, permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from SocialNetwork.feed import get_feed_cache
+from SocialNetwork.models import Post
+
+
+class PostLikeView(APIView):
+    """
+    View for user to like (PUT) or unlike (DELETE) a post, repeating the request doesn't change the result.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def put(self, request, pk):
+        """
+        Like the post.
+        :param request: The user request.
+        :param pk: The post ID.
+        :return: Response containing the post likes count and if the user likes it.
+        """
+        post = self.get_object(pk)
+
+        if post.creator_id == request.user.pk:
+            raise exceptions.PermissionDenied("User can't like his own posts.")
+
+        likes_count = post.likes_count
+        if post.like(request.user):
+            get_feed_cache().discard(post.pk, likes_count)  # The cached version of the post is not used anymore.
+
+        return self.__get_like_response(post, True)
+
+    def delete(self, request, pk):
+        """
+        Unlike the post.
+        :param request: The user request.
+        :param pk: The post ID.
+        :return: Response containing the post likes count and if the user likes it.
+        """
+        post = self.get_object(pk)
+
+        likes_count = post.likes_count
+        if post.unlike(request.user):
+            get_feed_cache().discard(post.pk, likes_count)  # The cached version of the post is not used anymore.
+
+        return self.__get_like_response(post, False)
+
+    def get_object(self, pk) -> Post:
+        """
+        Get the requested post.
+        :param pk: The post ID.
+        :return: The post.
+        :exception: Throw HTTP 404 if the post not exist.
+        """
+        return get_object_or_404(Post.objects.only('id', 'creator_id', 'likes_count'), pk=pk)
+
+    @staticmethod
+    def __get_like_response(post: Post, is_user_like: bool) -> Response:
+        """
+        Create compact response of the post likes (without the post content).
+        :param post: The post.
+        :param is_user_like: If the user likes the post.
+        :return: The response.
+        """
+        return Response({'id': post.pk, 'likes_count': post.likes_count, 'is_user_like': is_user_like})
@@ -1,11 +1,16 @@
 # Package: SocialNetwork.views
-
+from django.http import HttpResponse
 from rest_framework import generics, status
 from rest_framework import permissions
 from rest_framework.response import Response
 
+from SocialNetwork.feed import FeedCache, PostsStream, get_feed_cache
+from SocialNetwork.filters import PostFilterBackend
+from SocialNetwork.likes import get_liked_posts_cache
 from SocialNetwork.models import Post
+from SocialNetwork.pagination import PostCursorPagination
 from SocialNetwork.serializers import PostSerializer
+from SocialNetwork.versioning import FeedVersions, feed_condition
 
 class PostsView(generics.ListCreateAPIView):
     """
@@ -13,15 +18,30 @@ class PostsView(generics.ListCreateAPIView):
     """
     serializer_class = PostSerializer
     permission_classes = [permissions.IsAuthenticated]
+    filter_backends = [PostFilterBackend]  # Filter the posts by the query parameters (see 'PostFilterBackend').
+    pagination_class = PostCursorPagination  # Feed mode, used when the client send a cursor or a page size.
     queryset = Post.objects.all()
 
+    def get_queryset(self):
+        """
+        Get the posts with the creators loaded in bulk (the user likes are checked in the liked posts cache).
+        :return: The posts query set.
+        """
+        return super().get_queryset().with_feed_annotations()
+
     def perform_create(self, serializer: PostSerializer):
         """
         link the user to the post that he made when the post is created.
         :param serializer: The post serializer.
         """
-        serializer.save(creator=self.request.user)
+        post = serializer.save(creator=self.request.user)
 
+        # Cache the new post so the next feed request will not render it.
+        if get_feed_cache().enabled:
+            get_feed_cache().store([post])
+
+    # The posts change when any post is created or liked.
+    @feed_condition(lambda request, *args, **kwargs: [FeedVersions.GLOBAL])
     def get(self, request, *args, **kwargs):
         """
         Get reuqest to get all the posts.
@@ -29,6 +49,46 @@ class PostsView(generics.ListCreateAPIView):
         :return:
         """
 
-        # Pass the user to the serializer to mark the posts liked by the user.
-        serializer = self.serializer_class(self.get_queryset(), many=True, context={'user': request.user})
+        # Return only the usernames of the posts creators.
+        if request.query_params.get('distinct') == 'creator':
+            creators = self.filter_queryset(super().get_queryset()).distinct_creators()
+            return Response(list(creators))
+
+        liked_posts = get_liked_posts_cache().get(request.user)
+
+        # Stream all the posts in chunks (for large lists of posts).
+        stream = PostsStream.from_request(request)
+        if stream is not None:
+            queryset = self.filter_queryset(self.get_queryset()).order_by('pk')
+            return stream.get_response(queryset, {'user': request.user, 'liked_posts': liked_posts})
+
+        # Render the posts from the feed cache (only for JSON, the browsable API is rendered as usual).
+        if get_feed_cache().enabled and request.accepted_renderer.format == 'json':
+            return self.__get_cached_feed(liked_posts)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)  # None when the client didn't request the feed mode.
+
+        # Pass the user and the posts he liked to the serializer to mark the posts liked by the user.
+        context = {'user': request.user, 'liked_posts': liked_posts}
+
+        if page is not None:
+            serializer = self.serializer_class(page, many=True, context=context)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.serializer_class(queryset, many=True, context=context)
         return Response(serializer.data)
+
+    def __get_cached_feed(self, liked_posts) -> HttpResponse:
+        """
+        Get the posts rendered from the feed cache, only the posts versions are loaded from the database.
+        :param liked_posts: The posts the logged user liked.
+        :return: Response containing the posts JSON.
+        """
+        # Keep the order of the posts list (without it the database may read the versions from the likes index).
+        queryset = self.filter_queryset(super().get_queryset()).order_by('pk').values(*FeedCache.VERSION_FIELDS)
+        page = self.paginate_queryset(queryset)  # None when the client didn't request the feed mode.
+
+        posts = get_feed_cache().render(page if page is not None else queryset, liked_posts)
+        content = self.paginator.get_paginated_json(posts) if page is not None else posts
+        return HttpResponse(content, content_type='application/json')
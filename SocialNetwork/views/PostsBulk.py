@@ -0,0 +1,35 @@
+# Package: SocialNetwork.views
+
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from SocialNetwork.serializers import PostSerializer
+
+
+class PostsBulkView(APIView):
+    """
+    View for user to create many posts in one request.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    max_posts = 1000  # Maximum number of posts in one request.
+
+    def post(self, request):
+        """
+        Create the posts in the request for the logged user (all the posts are created or none of them).
+        :param request: The user request, contains list of posts.
+        :return: Response containing the number of created posts, or the validation errors of every post.
+        """
+        if not isinstance(request.data, list):
+            return Response({'detail': 'Expected a list of posts.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        if len(request.data) > self.max_posts:
+            return Response({'detail': 'Ensure there are no more than %s posts.' % self.max_posts},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        # The errors are returned by the posts order (empty for valid posts).
+        serializer = PostSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        posts = serializer.save(creator=request.user)
+
+        return Response({'created': len(posts)}, status=status.HTTP_201_CREATED)
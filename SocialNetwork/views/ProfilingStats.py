@@ -0,0 +1,43 @@
+# Package: SocialNetwork.views
+from django.conf import settings
+from django.http import Http404
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from SocialNetwork.auth.IsSuperUser import IsSuperUser
+from SocialNetwork.auth.TokenCache import get_token_cache
+from SocialNetwork.profiling import get_profiling_stats
+
+
+class ProfilingStatsView(APIView):
+    """
+    View to get the profiling stats of the process (see 'ProfilingMiddleware'), exists only when profiling is enabled.
+    Only the super users can read or reset the stats.
+    """
+    permission_classes = [IsSuperUser]
+
+    def initial(self, request, *args, **kwargs):
+        """
+        Hide the view when profiling is disabled.
+        """
+        if not getattr(settings, 'PROFILING', {}).get('ENABLED', False):
+            raise Http404()
+
+        super().initial(request, *args, **kwargs)
+
+    def get(self, request):
+        """
+        Get the profiling stats.
+        :param request: The user request.
+        :return: The stats of every endpoint and the JWT tokens cache counters.
+        """
+        return Response({'endpoints': get_profiling_stats().summary(), 'token_cache': get_token_cache().stats()})
+
+    def delete(self, request):
+        """
+        Reset the profiling stats (between benchmark runs).
+        :param request: The user request.
+        :return: Empty response.
+        """
+        get_profiling_stats().clear()
+        return Response(status=204)
@@ -5,8 +5,12 @@ from rest_framework import permissions
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from SocialNetwork.feed import PostsStream
+from SocialNetwork.filters import PostFilterBackend
+from SocialNetwork.likes import get_liked_posts_cache
 from SocialNetwork.models import User
 from SocialNetwork.serializers import PostSerializer
+from SocialNetwork.versioning import FeedVersions, feed_condition
 
 
 class UserPostsView(APIView):
@@ -15,6 +19,17 @@ class UserPostsView(APIView):
     """
     permission_classes = [permissions.IsAuthenticated]  # only authenticated users can see this view.
 
+    @staticmethod
+    def get_scopes(username: str) -> list[str]:
+        """
+        Get the scopes of the counters of the user posts (the posts change when the user creates post or his posts
+        are liked).
+        :param username: The user username.
+        :return: The counters scopes.
+        """
+        user_id = User.objects.filter(username=username).values_list('pk', flat=True).first()
+        return [FeedVersions.user_scope(user_id)]
+
     def get_object(self, username):
         """
         Get the requested user.
@@ -27,6 +42,7 @@ class UserPostsView(APIView):
         except User.DoesNotExist:
             raise Http404
 
+    @feed_condition(lambda request, username: UserPostsView.get_scopes(username))
     def get(self, request, username):
         """
         Return the user posts.
@@ -36,6 +52,15 @@ class UserPostsView(APIView):
         """
         user = self.get_object(username)
 
-        # Passing the logged user to the serializer to compute which posts the user liked.
-        serializer = PostSerializer(user.posts, many=True, context={'user': request.user})
+        # Passing the logged user and the posts he liked to the serializer to mark which posts the user liked.
+        posts = PostFilterBackend().filter_queryset(request, user.posts.all(), self)
+        posts = posts.with_feed_annotations()
+        context = {'user': request.user, 'liked_posts': get_liked_posts_cache().get(request.user)}
+
+        # Stream the posts in chunks (for users with many posts).
+        stream = PostsStream.from_request(request)
+        if stream is not None:
+            return stream.get_response(posts.order_by('pk'), context)
+
+        serializer = PostSerializer(posts, many=True, context=context)
         return Response(serializer.data)
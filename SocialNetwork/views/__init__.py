@@ -1,5 +1,15 @@
 from SocialNetwork.views.Signup import SignUpView
 from SocialNetwork.views.Login import LoginView
+from SocialNetwork.views.Logout import LogoutView
 from SocialNetwork.views.Posts import PostsView
 from SocialNetwork.views.PostDetail import PostDetailView
-from SocialNetwork.views.UserPosts import UserPostsView
\ No newline at end of file
+from SocialNetwork.views.UserPosts import UserPostsView
+from SocialNetwork.views.PostsBulk import PostsBulkView
+from SocialNetwork.views.PostChanges import PostChangesView
+from SocialNetwork.views.PostLike import PostLikeView
+from SocialNetwork.views.LikesBatch import LikesBatchView
+from SocialNetwork.views.ProfilingStats import ProfilingStatsView
+from SocialNetwork.views.Events import EventsView
+from SocialNetwork.views.AsyncPosts import AsyncPostsView
+from SocialNetwork.views.AsyncPostDetail import AsyncPostDetailView
+from SocialNetwork.views.AsyncUserPosts import AsyncUserPostsView
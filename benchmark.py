@@ -0,0 +1,60 @@
+import argparse
+import json
+
+from Bot.Benchmark import Benchmark
+from Bot.Helper import get_rule
+
+
+def run(args):
+    """
+    Run benchmark scenario and write the results.
+    :param args: The command line arguments.
+    """
+    benchmark = Benchmark(args.scenario, args.users, args.posts_per_user, args.requests, args.concurrency,
+                          args.async_views)
+    results = benchmark.run()
+    path = Benchmark.save(results, args.output_dir)
+
+    total = results['results']['total']
+    print('%(count)s requests, %(throughput).1f requests/s, p50 %(p50).1fms, p95 %(p95).1fms, p99 %(p99).1fms, '
+          '%(errors)s errors.' % total)
+    print('Results written to %s' % path)
+
+
+def compare(args):
+    """
+    Compare the results of two benchmarks.
+    :param args: The command line arguments.
+    """
+    with open(args.old) as old, open(args.new) as new:
+        rows = Benchmark.compare(json.load(old), json.load(new))
+
+    for row in rows:
+        endpoint = row.pop('endpoint')
+        changes = ['%s %.1f -> %.1f (%s)' % (metric, before, after, '%+.1f%%' % change if change is not None else 'n/a')
+                   for metric, (before, after, change) in row.items()]
+        print('%s: %s' % (endpoint, ', '.join(changes)))
+
+
+if __name__ == '__main__':
+   parser = argparse.ArgumentParser(description='Benchmark the site with the bot.')
+   commands = parser.add_subparsers(dest='command', required=True)
+
+   run_parser = commands.add_parser('run', help='Run benchmark scenario.')
+   run_parser.add_argument('--scenario', choices=Benchmark.SCENARIOS, default=get_rule('BENCHMARK_SCENARIO', 'mixed'))
+   run_parser.add_argument('--users', type=int, help='Number of users that sign up.')
+   run_parser.add_argument('--posts-per-user', type=int, help='Number of posts every user creates.')
+   run_parser.add_argument('--requests', type=int, help='Number of requests in the read, login and mixed scenarios.')
+   run_parser.add_argument('--concurrency', type=int, help='Number of requests that run concurrently.')
+   run_parser.add_argument('--async-views', action='store_true', default=None,
+                           help='Send the reads to the async views (run the site on ASGI server).')
+   run_parser.add_argument('--output-dir', default=get_rule('BENCHMARK_OUTPUT_DIR', 'benchmarks'))
+   run_parser.set_defaults(handler=run)
+
+   compare_parser = commands.add_parser('compare', help='Compare the results of two benchmarks.')
+   compare_parser.add_argument('old', help='The results file of the baseline benchmark.')
+   compare_parser.add_argument('new', help='The results file of the compared benchmark.')
+   compare_parser.set_defaults(handler=compare)
+
+   args = parser.parse_args()
+   args.handler(args)
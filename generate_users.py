@@ -0,0 +1,18 @@
+import argparse
+import time
+
+from Bot.Helper import get_rule, Generator
+
+if __name__ == '__main__':
+   parser = argparse.ArgumentParser(description='Generate users to a fixture file (set USERS_FIXTURE to use it).')
+   parser.add_argument('--count', type=int, required=True, help='Number of users.')
+   parser.add_argument('--output', default='users.jsonl', help='The path of the fixture file.')
+   parser.add_argument('--seed', type=int, default=get_rule('USERS_SEED', None),
+                       help='The seed of the users (the same seed generates the same users).')
+   parser.add_argument('--domains', nargs='+', default=get_rule('EMAIL_DOMAINS', None),
+                       help='The domains of the users emails.')
+   args = parser.parse_args()
+
+   started_at = time.perf_counter()
+   Generator(args.seed, args.domains).write_fixture(args.output, args.count)
+   print('%s users written to %s in %.1fs.' % (args.count, args.output, time.perf_counter() - started_at))
@@ -1,5 +1,10 @@
 from Bot.Bot import Bot
+from Bot.Helper import get_rule
 
 if __name__ == '__main__':
-   bot = Bot()
-   bot.start_activity()
\ No newline at end of file
+   if get_rule('ASYNC_MODE', False):
+      from Bot.AsyncBot import AsyncBot
+      bot = AsyncBot()
+   else:
+      bot = Bot()
+   bot.start_activity()
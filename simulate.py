@@ -0,0 +1,24 @@
+import argparse
+
+from Bot.Bot import Bot
+from Bot.Helper import get_rule
+from Bot.Simulation import Simulation
+
+if __name__ == '__main__':
+   parser = argparse.ArgumentParser(description='Simulate the like activity of the bot offline.')
+   parser.add_argument('--users', type=int, default=get_rule('NUMBER_OF_USERS', Bot.NUMBER_OF_USERS),
+                       help='Number of users.')
+   parser.add_argument('--max-posts', type=int, default=get_rule('MAX_POSTS_PER_USER', Bot.MAX_POSTS_PER_USER),
+                       help='Maximum number of posts the user can create.')
+   parser.add_argument('--max-likes', type=int, default=get_rule('MAX_LIKES_PER_USER', Bot.MAX_LIKES_PER_USER),
+                       help='Maximum number of likes the user can do.')
+   parser.add_argument('--seed', type=int, default=get_rule('SIMULATION_SEED', None),
+                       help='The seed of the run (the same seed gives the same results).')
+   args = parser.parse_args()
+
+   results = Simulation.generate(args.users, args.max_posts, args.max_likes, args.seed).run()
+
+   print('%(users)s users created %(posts)s posts and liked %(likes)s posts in %(duration).1fs.' % results)
+   print('%(users_reached_max_likes)s users reached max likes, %(posts_with_no_likes)s posts with no likes.' % results)
+   if results['stopped_by'] is not None:
+      print("Stopped at the user %(stopped_by)s, all the posts he can like are liked." % results)